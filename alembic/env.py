@@ -27,6 +27,7 @@ from application.database.models.users import Users
 from application.database.models.transactions import Transactions
 from application.database.models.categories import Categories
 from application.database.models.tokens import Tokens
+from application.database.models.daily_rollups import DailyRollups
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,57 @@
+"""add hot query indexes
+
+Revision ID: cd0b65f8ca4d
+Revises: d7b7c6f5f55f
+Create Date: 2026-10-18 09:00:12.418230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "cd0b65f8ca4d"
+down_revision: Union[str, Sequence[str], None] = "d7b7c6f5f55f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_transactions_user_id_created_at_id", "transactions", ["user_id", "created_at", "id"]),
+    ("ix_transactions_user_id_updated_at_id", "transactions", ["user_id", "updated_at", "id"]),
+    ("ix_transactions_user_id_amount_id", "transactions", ["user_id", "amount", "id"]),
+    ("ix_transactions_user_id_category_created_at", "transactions", ["user_id", "category", "created_at"]),
+    ("ix_transactions_user_id_transaction_type_created_at", "transactions", ["user_id", "transaction_type", "created_at"]),
+    ("ix_tokens_user_id", "tokens", ["user_id"]),
+    ("ix_categories_user_id", "categories", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indexes are built concurrently so existing tables stay writable
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
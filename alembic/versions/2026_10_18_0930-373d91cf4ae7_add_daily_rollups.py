@@ -0,0 +1,69 @@
+"""add daily rollups
+
+Revision ID: 373d91cf4ae7
+Revises: cd0b65f8ca4d
+Create Date: 2026-10-18 09:30:41.902114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "373d91cf4ae7"
+down_revision: Union[str, Sequence[str], None] = "cd0b65f8ca4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_rollups",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(length=32), nullable=False),
+        sa.Column(
+            "transaction_type",
+            postgresql.ENUM("INCOME", "EXPENSE", name="transaction_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total_amount", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("transaction_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "day", "category", "transaction_type"),
+    )
+
+    # Backfill from existing transactions
+    op.execute(
+        """
+        INSERT INTO daily_rollups (user_id, day, category, transaction_type, total_amount, transaction_count)
+        SELECT
+            user_id,
+            CAST(timezone('UTC', created_at) AS DATE),
+            category,
+            transaction_type,
+            sum(amount),
+            count(*)
+        FROM transactions
+        GROUP BY user_id, CAST(timezone('UTC', created_at) AS DATE), category, transaction_type
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_rollups")
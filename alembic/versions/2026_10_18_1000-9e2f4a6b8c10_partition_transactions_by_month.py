@@ -0,0 +1,159 @@
+"""partition transactions by month
+
+Revision ID: 9e2f4a6b8c10
+Revises: 373d91cf4ae7
+Create Date: 2026-10-18 10:00:27.551904
+
+Rebuilds transactions as a table partitioned by RANGE (created_at) with one
+partition per UTC month and a default partition. The partition DDL is
+inlined so the revision doesn't change with the application code. Rows are copied in one
+transaction, so writes to transactions are blocked while it runs.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from datetime import datetime, timezone
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e2f4a6b8c10"
+down_revision: Union[str, Sequence[str], None] = "373d91cf4ae7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_transactions_user_id_created_at_id", ["user_id", "created_at", "id"]),
+    ("ix_transactions_user_id_updated_at_id", ["user_id", "updated_at", "id"]),
+    ("ix_transactions_user_id_amount_id", ["user_id", "amount", "id"]),
+    ("ix_transactions_user_id_category_created_at", ["user_id", "category", "created_at"]),
+    ("ix_transactions_user_id_transaction_type_created_at", ["user_id", "transaction_type", "created_at"]),
+]
+
+COLUMNS = "id, amount, category, description, transaction_type, created_at, updated_at, user_id"
+
+# Months ahead of the current one created up front, as configured when this
+# revision was written; partition maintenance keeps creating them afterwards
+MONTHS_AHEAD = 3
+
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def create_partition_sql(month: datetime) -> str:
+    upper = add_months(month, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS transactions_p{month:%Y_%m} PARTITION OF transactions "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+    )
+
+
+def transactions_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('transactions_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(length=32), nullable=False),
+        sa.Column("description", sa.String(length=512), nullable=True),
+        sa.Column(
+            "transaction_type",
+            postgresql.ENUM("INCOME", "EXPENSE", name="transaction_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        # Named explicitly: set_aside_old_table renames it, an auto-generated name
+        # would become transactions_user_id_fkey1 after a downgrade
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="transactions_user_id_fkey"),
+    ]
+
+
+def set_aside_old_table(old_name: str) -> None:
+    op.rename_table("transactions", old_name)
+    op.execute(f"ALTER TABLE {old_name} RENAME CONSTRAINT transactions_pkey TO {old_name}_pkey")
+    op.execute(f"ALTER TABLE {old_name} RENAME CONSTRAINT transactions_user_id_fkey TO {old_name}_user_id_fkey")
+
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=old_name, if_exists=True)
+
+
+def create_indexes() -> None:
+    # On a partitioned table every index is created on each partition as well
+    for name, columns in INDEXES:
+        op.create_index(name, "transactions", columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    set_aside_old_table("transactions_unpartitioned")
+
+    op.create_table(
+        "transactions",
+        *transactions_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("CREATE TABLE IF NOT EXISTS transactions_default PARTITION OF transactions DEFAULT")
+
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM transactions_unpartitioned")).scalar()
+    now = datetime.now(tz=timezone.utc)
+    month = month_start(oldest or now)
+    last = add_months(month_start(now), MONTHS_AHEAD)
+
+    while month <= last:
+        op.execute(create_partition_sql(month))
+        month = add_months(month, 1)
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_unpartitioned")
+    create_indexes()
+
+    # The sequence would be dropped together with its old owner
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.drop_table("transactions_unpartitioned")
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    set_aside_old_table("transactions_partitioned")
+
+    op.create_table(
+        "transactions",
+        *transactions_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned")
+    create_indexes()
+
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    # Drops every attached partition; detached archives are left alone
+    op.drop_table("transactions_partitioned")
+    op.execute("ANALYZE transactions")
@@ -0,0 +1,76 @@
+"""add transaction search
+
+Revision ID: 4c3d2e1f0a9b
+Revises: 9e2f4a6b8c10
+Create Date: 2026-10-18 10:30:05.117342
+
+Adds stored generated search columns to transactions together with GIN
+indexes. Adding a stored generated column rewrites every partition.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c3d2e1f0a9b"
+down_revision: Union[str, Sequence[str], None] = "9e2f4a6b8c10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', category), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+    )
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "search_text",
+            sa.String(length=545),
+            sa.Computed("category || ' ' || coalesce(description, '')", persisted=True),
+        ),
+    )
+
+    # Partitioned tables can't build indexes concurrently, each partition is indexed in turn
+    op.create_index(
+        "ix_transactions_user_id_search_vector",
+        "transactions",
+        ["user_id", "search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_transactions_user_id_search_text_trgm",
+        "transactions",
+        ["user_id", "search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_user_id_search_text_trgm", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_search_vector", table_name="transactions")
+    op.drop_column("transactions", "search_text")
+    op.drop_column("transactions", "search_vector")
+    # Extensions are left installed, other objects may depend on them
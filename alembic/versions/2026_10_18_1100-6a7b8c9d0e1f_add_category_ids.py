@@ -0,0 +1,114 @@
+"""add category ids
+
+Revision ID: 6a7b8c9d0e1f
+Revises: 4c3d2e1f0a9b
+Create Date: 2026-10-18 11:00:43.309215
+
+Turns categories into a per-user dimension: names are unique per user,
+transactions and daily_rollups reference categories by id. Categories are
+backfilled from the names already stored on transactions and rollups.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a7b8c9d0e1f"
+down_revision: Union[str, Sequence[str], None] = "4c3d2e1f0a9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint("categories_name_key", "categories", type_="unique")
+    op.drop_index("ix_categories_user_id", table_name="categories", if_exists=True)
+    op.create_unique_constraint("uq_categories_user_id_name", "categories", ["user_id", "name"])
+
+    op.execute("""
+        INSERT INTO categories (user_id, name)
+        SELECT user_id, category FROM transactions
+        UNION
+        SELECT user_id, category FROM daily_rollups
+        ON CONFLICT (user_id, name) DO NOTHING
+    """)
+
+    # transactions
+    op.add_column("transactions", sa.Column("category_id", sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE transactions
+        SET category_id = categories.id
+        FROM categories
+        WHERE categories.user_id = transactions.user_id AND categories.name = transactions.category
+    """)
+    op.alter_column("transactions", "category_id", nullable=False)
+    op.create_foreign_key(
+        "transactions_category_id_fkey", "transactions", "categories", ["category_id"], ["id"]
+    )
+    op.create_index(
+        "ix_transactions_user_id_category_id_created_at",
+        "transactions",
+        ["user_id", "category_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_transactions_user_id_category_created_at", table_name="transactions")
+
+    # daily_rollups
+    op.add_column("daily_rollups", sa.Column("category_id", sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE daily_rollups
+        SET category_id = categories.id
+        FROM categories
+        WHERE categories.user_id = daily_rollups.user_id AND categories.name = daily_rollups.category
+    """)
+    op.alter_column("daily_rollups", "category_id", nullable=False)
+    op.create_foreign_key(
+        "daily_rollups_category_id_fkey", "daily_rollups", "categories", ["category_id"], ["id"]
+    )
+    op.drop_constraint("daily_rollups_pkey", "daily_rollups", type_="primary")
+    op.create_primary_key(
+        "daily_rollups_pkey", "daily_rollups", ["user_id", "day", "category_id", "transaction_type"]
+    )
+    op.drop_column("daily_rollups", "category")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("daily_rollups", sa.Column("category", sa.String(length=32), nullable=True))
+    op.execute("""
+        UPDATE daily_rollups
+        SET category = categories.name
+        FROM categories
+        WHERE categories.id = daily_rollups.category_id
+    """)
+    op.alter_column("daily_rollups", "category", nullable=False)
+    op.drop_constraint("daily_rollups_pkey", "daily_rollups", type_="primary")
+    op.create_primary_key(
+        "daily_rollups_pkey", "daily_rollups", ["user_id", "day", "category", "transaction_type"]
+    )
+    op.drop_constraint("daily_rollups_category_id_fkey", "daily_rollups", type_="foreignkey")
+    op.drop_column("daily_rollups", "category_id")
+
+    op.create_index(
+        "ix_transactions_user_id_category_created_at",
+        "transactions",
+        ["user_id", "category", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_transactions_user_id_category_id_created_at", table_name="transactions")
+    op.drop_constraint("transactions_category_id_fkey", "transactions", type_="foreignkey")
+    op.drop_column("transactions", "category_id")
+
+    # The old schema holds a name once; names still live on transactions.category
+    op.drop_constraint("uq_categories_user_id_name", "categories", type_="unique")
+    op.execute("""
+        DELETE FROM categories duplicate
+        USING categories kept
+        WHERE duplicate.name = kept.name AND duplicate.id > kept.id
+    """)
+    op.create_unique_constraint("categories_name_key", "categories", ["name"])
+    op.create_index("ix_categories_user_id", "categories", ["user_id"], unique=False)
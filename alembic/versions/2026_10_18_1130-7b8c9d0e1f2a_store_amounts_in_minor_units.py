@@ -0,0 +1,51 @@
+"""store amounts in minor units
+
+Revision ID: 7b8c9d0e1f2a
+Revises: 6a7b8c9d0e1f
+Create Date: 2026-10-18 11:30:12.604518
+
+Amounts become exact BIGINT minor units (cents). Stored values were whole
+major units (the INTEGER column truncated any fraction), so they are scaled
+by 100. Changing the column type rewrites every transactions partition.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b8c9d0e1f2a"
+down_revision: Union[str, Sequence[str], None] = "6a7b8c9d0e1f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "transactions",
+        "amount",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+        postgresql_using="amount::bigint * 100",
+    )
+    op.execute("UPDATE daily_rollups SET total_amount = total_amount * 100")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fractions of a major unit are truncated, as the old column did; rollups
+    # are scaled as a whole, rebuild them if exact sums of truncated rows matter
+    op.execute("UPDATE daily_rollups SET total_amount = total_amount / 100")
+    op.alter_column(
+        "transactions",
+        "amount",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using="(amount / 100)::integer",
+    )
@@ -0,0 +1,58 @@
+"""hash refresh tokens
+
+Revision ID: 8c9d0e1f2a3b
+Revises: 7b8c9d0e1f2a
+Create Date: 2026-10-18 12:00:27.118903
+
+Refresh tokens are stored as a unique sha256 digest together with their
+expiry. Existing rows are hashed in place; their expiry is derived from the
+30 day refresh token lifetime, counted from the last rotation.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c9d0e1f2a3b"
+down_revision: Union[str, Sequence[str], None] = "7b8c9d0e1f2a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tokens", sa.Column("token_hash", sa.String(length=64), nullable=True))
+    op.add_column("tokens", sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True))
+
+    op.execute("""
+        UPDATE tokens
+        SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex'),
+            expires_at = updated_at + interval '30 days'
+    """)
+    # The same token can't be stored twice any more, keep its newest row
+    op.execute("""
+        DELETE FROM tokens duplicate
+        USING tokens kept
+        WHERE duplicate.token_hash = kept.token_hash AND duplicate.id < kept.id
+    """)
+
+    op.alter_column("tokens", "token_hash", nullable=False)
+    op.alter_column("tokens", "expires_at", nullable=False)
+    op.create_unique_constraint("uq_tokens_token_hash", "tokens", ["token_hash"])
+    op.create_index("ix_tokens_expires_at", "tokens", ["expires_at"], unique=False)
+    op.drop_column("tokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Digests can't be turned back into tokens, stored sessions are dropped
+    op.execute("DELETE FROM tokens")
+    op.add_column("tokens", sa.Column("token", sa.String(), nullable=False))
+    op.drop_index("ix_tokens_expires_at", table_name="tokens")
+    op.drop_constraint("uq_tokens_token_hash", "tokens", type_="unique")
+    op.drop_column("tokens", "expires_at")
+    op.drop_column("tokens", "token_hash")
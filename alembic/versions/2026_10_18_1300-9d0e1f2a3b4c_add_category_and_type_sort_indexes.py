@@ -0,0 +1,70 @@
+"""add category and type sort indexes
+
+Revision ID: 9d0e1f2a3b4c
+Revises: 8c9d0e1f2a3b
+Create Date: 2026-10-18 13:00:41.207316
+
+Keyset listings sorted by category or transaction type page through
+(user_id, <sort>, id). The existing (user_id, category_id, created_at) and
+(user_id, transaction_type, created_at) indexes don't match that order, so
+every page read and sorted all rows of the user.
+
+CREATE INDEX CONCURRENTLY is not supported on a partitioned table. The
+parent index is created ON ONLY the parent (invalid until complete), every
+partition is indexed concurrently and attached to it, so the table stays
+writable.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d0e1f2a3b4c"
+down_revision: Union[str, Sequence[str], None] = "8c9d0e1f2a3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_transactions_user_id_category_id", ["user_id", "category", "id"]),
+    ("ix_transactions_user_id_transaction_type_id", ["user_id", "transaction_type", "id"]),
+]
+
+
+def attached_partitions() -> list[str]:
+    result = op.get_bind().execute(sa.text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'transactions'
+        ORDER BY child.relname
+    """))
+
+    return list(result.scalars())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        partitions = attached_partitions()
+
+        for name, columns in INDEXES:
+            column_list = ", ".join(columns)
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY transactions ({column_list})")
+
+            for partition in partitions:
+                partition_index = f"{partition}_{'_'.join(columns)}_idx"
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} ({column_list})")
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping the parent index drops the attached partition indexes with it
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="transactions", if_exists=True)
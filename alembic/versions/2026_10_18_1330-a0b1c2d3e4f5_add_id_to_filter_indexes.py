@@ -0,0 +1,81 @@
+"""add id to filter indexes
+
+Revision ID: a0b1c2d3e4f5
+Revises: 9d0e1f2a3b4c
+Create Date: 2026-10-18 13:30:08.915472
+
+Listings filtered by category or transaction type are ordered by
+(created_at, id). The filter indexes ended at created_at, so id ties were
+sorted after the scan. With id appended the index delivers the whole keyset
+order.
+
+The new indexes are built like 9d0e1f2a3b4c: ON ONLY the parent, every
+partition concurrently, then attached. The old ones are dropped afterwards.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a0b1c2d3e4f5"
+down_revision: Union[str, Sequence[str], None] = "9d0e1f2a3b4c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (old index, new index, columns of the new index)
+INDEXES = [
+    (
+        "ix_transactions_user_id_category_id_created_at",
+        "ix_transactions_user_id_category_id_created_at_id",
+        ["user_id", "category_id", "created_at", "id"],
+    ),
+    (
+        "ix_transactions_user_id_transaction_type_created_at",
+        "ix_transactions_user_id_transaction_type_created_at_id",
+        ["user_id", "transaction_type", "created_at", "id"],
+    ),
+]
+
+
+def attached_partitions() -> list[str]:
+    result = op.get_bind().execute(sa.text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'transactions'
+        ORDER BY child.relname
+    """))
+
+    return list(result.scalars())
+
+
+def create_partitioned_index(name: str, columns: list[str]) -> None:
+    column_list = ", ".join(columns)
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY transactions ({column_list})")
+
+    for partition in attached_partitions():
+        partition_index = f"{partition}_{'_'.join(columns)}_idx"
+        op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} ({column_list})")
+        op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for old, new, columns in INDEXES:
+            create_partitioned_index(new, columns)
+            op.drop_index(old, table_name="transactions", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for old, new, columns in reversed(INDEXES):
+            create_partitioned_index(old, columns[:-1])
+            op.drop_index(new, table_name="transactions", if_exists=True)
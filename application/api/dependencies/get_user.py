@@ -1,28 +1,35 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, event
 
 from application.database.base import get_session
 from application.database.models.users import Users
 from application.core.jwt_generation import JWTGeneration
+from application.core.cache import principal_cache
+from application.core.instrumentation import timed_phase
+from application.core.revocation import revocation_list
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_session)
-):
+async def get_token_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
     """
-    Dependency for extracting user from JWT token.
+    Dependency for decoding and checking the presented access token.
+
+    Revoked tokens are looked up in the in-process revocation list, so
+    the check costs no database round trip.
+
     Args:
         credentials: JWT token from headers
-        session: AsyncSession
     Raises:
-        HTTPException 401: Invalid or expired token 
+        HTTPException 401: Invalid, expired or revoked token
     """
     access_token = credentials.credentials
-    payload = JWTGeneration.decode_jwt(access_token=access_token)
+    with timed_phase("jwt"):
+        payload = JWTGeneration.decode_jwt(access_token=access_token)
 
     if not payload:
         raise HTTPException(
@@ -31,28 +38,86 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
     
+    # Refresh tokens are only accepted by /auth/refresh
+    if payload.get("type") != "access":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    # Tokens issued before jti existed can't be revoked, they expire on their own
+    jti = payload.get("jti")
+    if jti and revocation_list.is_revoked(jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Dependency for extracting user from JWT token.
+
+    Users are served from the in-process principal cache, so a cache hit
+    costs no database round trip. Cached instances are detached from any
+    session and must be treated as read-only.
+
+    Args:
+        payload: checked access token payload
+        session: AsyncSession
+    Raises:
+        HTTPException 401: Invalid or expired token 
+    """
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload"
         )
+
+    user = principal_cache.get(int(user_id))
+    if user is not None:
+        return user
+
     try:
         
-        result = await session.execute(
-            select(Users)
-            .where(Users.id == int(user_id))
-        )
+        with timed_phase("auth"):
+            result = await session.execute(
+                select(Users)
+                .where(Users.id == int(user_id))
+            )
         user = result.scalar_one_or_none()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
-        
+
+        session.expunge(user)
+        principal_cache.set(user.id, user)
+
         return user
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service unavailable"
-        )
\ No newline at end of file
+        )
+
+
+@event.listens_for(Users, "after_update")
+@event.listens_for(Users, "after_delete")
+def invalidate_principal(mapper, connection, target: Users) -> None:
+    """Dropping cached principal whenever the user row is changed through the ORM."""
+
+    principal_cache.pop(target.id)
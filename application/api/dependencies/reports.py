@@ -0,0 +1,21 @@
+from fastapi import Query
+
+from application.schemas.reports import ReportsFilterSchema
+from features.transaction_enum import TransactionType
+
+from datetime import datetime
+
+def get_report_params(
+    start_date: datetime | None = Query(None, description="start date of the report"),
+    end_date: datetime | None = Query(None, description="end date of the report"),
+    transaction_type: TransactionType | None = Query(None, description="transaction_type")
+) -> ReportsFilterSchema:
+    """
+    Dependency for collecting report filters.
+    """
+
+    return ReportsFilterSchema(
+        start_date=start_date,
+        end_date=end_date,
+        transaction_type=transaction_type
+    )
@@ -1,10 +1,39 @@
-from fastapi import Query
+from fastapi import Query, HTTPException, status
 
-from application.schemas.transactions import PagedTransactionsDisplaySchema
-from features.transaction_enum import TransactionType
+from application.schemas.transactions import (
+    PagedTransactionsDisplaySchema,
+    CursorTransactionsDisplaySchema,
+    SearchTransactionsDisplaySchema,
+    TransactionsExportSchema
+)
+from features.transaction_enum import TransactionType, TransactionField
+from features.file_format_enum import FileFormat
+from features.search_enum import SearchMode
 
 from datetime import datetime
 
+FIELDS_DESCRIPTION = f"comma-separated fields to return: {', '.join(f.value for f in TransactionField)}"
+
+def parse_fields(fields: str | None) -> list[TransactionField] | None:
+    """
+    Parsing a comma-separated sparse fieldset.
+
+    Raises:
+        HTTPException 400: If an unknown field is requested
+    """
+
+    if not fields:
+        return None
+
+    try:
+        return [TransactionField(name.strip()) for name in fields.split(",") if name.strip()] or None
+
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field requested. Allowed fields: {[f.value for f in TransactionField]}"
+        )
+
 def get_transactions_params(
     page: int = Query(1, description="current page"),
     per_page: int = Query(10, description="number of records per page"),
@@ -13,7 +42,9 @@ def get_transactions_params(
     start_date: datetime | None = Query(None, description="start date for sorting"),
     end_date: datetime | None = Query(None, description="end date for sorting"),
     category: str | None = Query(None, description="transaction category"),
-    transaction_type: TransactionType | None = Query(None, description="transaction_type")
+    transaction_type: TransactionType | None = Query(None, description="transaction_type"),
+    include_total: bool = Query(True, description="count total records and pages; when false has_next is probed"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
 ) -> PagedTransactionsDisplaySchema:
     #Doc string
 
@@ -25,5 +56,88 @@ def get_transactions_params(
         start_date=start_date,
         end_date=end_date,
         category=category,
+        transaction_type=transaction_type,
+        include_total=include_total,
+        fields=parse_fields(fields)
+    )
+
+def get_cursor_transactions_params(
+    cursor: str | None = Query(None, description="opaque cursor from the previous page"),
+    per_page: int = Query(10, ge=1, le=100, description="number of records per page"),
+    sort_by: str | None = Query("created_at", description="column for sorting"),
+    sort_order: str | None = Query("desc", description="sort order"),
+    start_date: datetime | None = Query(None, description="start date for sorting"),
+    end_date: datetime | None = Query(None, description="end date for sorting"),
+    category: str | None = Query(None, description="transaction category"),
+    transaction_type: TransactionType | None = Query(None, description="transaction_type"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+) -> CursorTransactionsDisplaySchema:
+    """
+    Dependency for collecting keyset pagination parameters.
+    """
+
+    return CursorTransactionsDisplaySchema(
+        cursor=cursor,
+        per_page=per_page,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        start_date=start_date,
+        end_date=end_date,
+        category=category,
+        transaction_type=transaction_type,
+        fields=parse_fields(fields)
+    )
+
+def get_search_params(
+    q: str = Query(..., min_length=1, max_length=128, description="search query over category and description"),
+    mode: SearchMode = Query(SearchMode.FTS, description="fts: word prefixes, fuzzy: tolerates typos"),
+    cursor: str | None = Query(None, description="opaque cursor from the previous page"),
+    per_page: int = Query(10, ge=1, le=100, description="number of records per page"),
+    sort_by: str | None = Query("created_at", description="column for sorting"),
+    sort_order: str | None = Query("desc", description="sort order"),
+    start_date: datetime | None = Query(None, description="start date for sorting"),
+    end_date: datetime | None = Query(None, description="end date for sorting"),
+    category: str | None = Query(None, description="transaction category"),
+    transaction_type: TransactionType | None = Query(None, description="transaction_type"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+) -> SearchTransactionsDisplaySchema:
+    """
+    Dependency for collecting search query, filters and keyset pagination parameters.
+    """
+
+    return SearchTransactionsDisplaySchema(
+        q=q,
+        mode=mode,
+        cursor=cursor,
+        per_page=per_page,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        start_date=start_date,
+        end_date=end_date,
+        category=category,
+        transaction_type=transaction_type,
+        fields=parse_fields(fields)
+    )
+
+def get_export_params(
+    file_format: FileFormat = Query(FileFormat.CSV, description="export format: csv or ndjson"),
+    sort_by: str | None = Query("created_at", description="column for sorting"),
+    sort_order: str | None = Query("desc", description="sort order"),
+    start_date: datetime | None = Query(None, description="start date for sorting"),
+    end_date: datetime | None = Query(None, description="end date for sorting"),
+    category: str | None = Query(None, description="transaction category"),
+    transaction_type: TransactionType | None = Query(None, description="transaction_type")
+) -> TransactionsExportSchema:
+    """
+    Dependency for collecting export format, filters and sorting.
+    """
+
+    return TransactionsExportSchema(
+        file_format=file_format,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        start_date=start_date,
+        end_date=end_date,
+        category=category,
         transaction_type=transaction_type
     )
\ No newline at end of file
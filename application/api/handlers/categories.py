@@ -0,0 +1,134 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy import select, event
+
+from application.database.models.categories import Categories
+from application.core.cache import category_cache
+
+from typing import Iterable
+
+
+class CategoriesService:
+    """
+    Per-user category dimension of transactions.
+
+    Writes resolve category names into ids through the in-process
+    category cache; only cache misses reach the database.
+    """
+
+    #Method for normalizing a category name
+    @classmethod
+    def normalize(
+        cls,
+        name: str
+    ) -> str:
+        return name.strip().title()
+
+    #Method for looking up a category id for filters
+    @classmethod
+    async def find_id(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        name: str
+    ) -> int | None:
+        """
+        Looking up the id of a category of concrete user by name, without creating it.
+
+        The name is normalized like on writes, so "food" finds "Food". Found
+        ids are cached; unknown names are not, so a category created later
+        is found right away.
+
+        Returns:
+            Category id, None if the user has no such category
+        """
+
+        name = cls.normalize(name)
+        cached = category_cache.get_many(user_id=user_id, names={name})
+
+        if cached:
+            return cached[name]
+
+        category_id = await session.scalar(
+            select(Categories.id)
+            .where(Categories.user_id == user_id, Categories.name == name)
+        )
+
+        if category_id is not None:
+            category_cache.set_many(user_id=user_id, categories={name: category_id})
+
+        return category_id
+
+    #Method for resolving category names into ids
+    @classmethod
+    async def resolve_ids(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        names: Iterable[str]
+    ) -> dict[str, int]:
+        """
+        Resolving normalized category names of concrete user into ids, creating missing categories.
+
+        Created categories become visible to other requests only after the
+        session commits, so they are cached by the after_commit hook below
+        instead of right away.
+
+        Args:
+            session: AsyncSession, the caller commits
+            user_id: user ID from DB
+            names: normalized category names
+
+        Returns:
+            Mapping of every requested name to its category id
+        """
+
+        wanted = set(names)
+        resolved = category_cache.get_many(user_id=user_id, names=wanted)
+        missing = wanted - resolved.keys()
+
+        if not missing:
+            return resolved
+
+        # Sorted inserts keep concurrent writers from deadlocking on the unique index
+        result = await session.execute(
+            pg_insert(Categories)
+            .values([{"user_id": user_id, "name": name} for name in sorted(missing)])
+            .on_conflict_do_nothing(index_elements=[Categories.user_id, Categories.name])
+            .returning(Categories.name, Categories.id)
+        )
+        created = dict(result.tuples().all())
+
+        existing = {}
+        if missing - created.keys():
+            result = await session.execute(
+                select(Categories.name, Categories.id)
+                .where(Categories.user_id == user_id, Categories.name.in_(missing - created.keys()))
+            )
+            existing = dict(result.tuples().all())
+
+        category_cache.set_many(user_id=user_id, categories=existing)
+
+        if created:
+            pending = session.info.setdefault("created_categories", {})
+            pending.setdefault(user_id, {}).update(created)
+
+        return {**resolved, **existing, **created}
+
+
+@event.listens_for(Session, "after_commit")
+def cache_created_categories(session: Session) -> None:
+    """Caching categories created in the committed transaction."""
+
+    for user_id, categories in session.info.pop("created_categories", {}).items():
+        category_cache.set_many(user_id=user_id, categories=categories)
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_created_categories(session: Session) -> None:
+    """Dropping categories whose creation was rolled back."""
+
+    session.info.pop("created_categories", None)
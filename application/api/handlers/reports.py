@@ -0,0 +1,297 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, func, case, cast, Date, BigInteger, ColumnElement
+from fastapi import HTTPException, status
+
+from application.database.models.daily_rollups import DailyRollups
+from application.database.models.categories import Categories
+from features.transaction_enum import TransactionType
+from features.report_enum import ReportPeriod
+from application.schemas.reports import (
+    SummaryReportSchema,
+    SummaryReportResponseSchema,
+    CategoryReportItemSchema,
+    CategoryReportResponseSchema,
+    PeriodReportItemSchema,
+    PeriodReportResponseSchema
+)
+
+from datetime import datetime, timezone, date
+
+
+class ReportsService:
+    """
+    Reports are read from daily_rollups, so their cost depends on the number
+    of days (and categories) in the range rather than on the number of
+    transactions. Date filters therefore have a granularity of one UTC day.
+
+    Totals are minor units: SUM(bigint) yields numeric in Postgres, so sums
+    are cast back to BIGINT and arrive as exact Python ints.
+    """
+
+    INCOME = func.coalesce(
+        cast(func.sum(case((DailyRollups.transaction_type == TransactionType.INCOME, DailyRollups.total_amount), else_=0)), BigInteger), 0
+    )
+    EXPENSE = func.coalesce(
+        cast(func.sum(case((DailyRollups.transaction_type == TransactionType.EXPENSE, DailyRollups.total_amount), else_=0)), BigInteger), 0
+    )
+    COUNT = func.coalesce(func.sum(DailyRollups.transaction_count), 0)
+
+    #Method for building rollup filter conditions
+    @classmethod
+    def rollup_filters(
+        cls,
+        *,
+        user_id: int,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+    ) -> tuple[list[ColumnElement[bool]], str | None]:
+        """
+        Building WHERE conditions for daily_rollups.
+
+        Returns:
+            List of conditions and normalized transaction type value
+        """
+
+        filters = [DailyRollups.user_id == user_id]
+
+        transaction_type_value = None
+        if transaction_type:
+            transaction_type_value = TransactionType(transaction_type).value
+            filters.append(DailyRollups.transaction_type == transaction_type_value)
+
+        if start_date:
+            filters.append(DailyRollups.day >= cls._utc_day(start_date))
+
+        if end_date:
+            filters.append(DailyRollups.day <= cls._utc_day(end_date))
+
+        return filters, transaction_type_value
+
+    @classmethod
+    def _utc_day(
+        cls,
+        value: datetime
+    ) -> date:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+
+        return value.date()
+
+    #Method for displaying income/expense totals
+    @classmethod
+    async def summary_report_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+    ) -> SummaryReportResponseSchema:
+        """
+        Income, expense and net totals of concrete user, aggregated in the database.
+
+        Args:
+            session: AsyncSession
+            user_id: user ID from DB
+            transaction_type: transaction type: income or expense
+            start_date: first day of the report
+            end_date: last day of the report
+
+        Raises:
+            HTTPException 503: In case of database errors
+        """
+
+        filters, transaction_type_value = cls.rollup_filters(
+            user_id=user_id,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        try:
+            result = await session.execute(
+                select(
+                    cls.INCOME.label("income"),
+                    cls.EXPENSE.label("expense"),
+                    cls.COUNT.label("transactions_count")
+                )
+                .where(*filters)
+            )
+            row = result.one()
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+        return SummaryReportResponseSchema(
+            data=SummaryReportSchema(
+                income=row.income,
+                expense=row.expense,
+                net=row.income - row.expense,
+                transactions_count=row.transactions_count
+            ),
+            meta=cls._meta(
+                transaction_type=transaction_type_value,
+                start_date=start_date,
+                end_date=end_date
+            )
+        )
+
+    #Method for displaying totals per category
+    @classmethod
+    async def categories_report_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+    ) -> CategoryReportResponseSchema:
+        """
+        Totals of concrete user grouped by category and transaction type.
+
+        Raises:
+            HTTPException 503: In case of database errors
+        """
+
+        filters, transaction_type_value = cls.rollup_filters(
+            user_id=user_id,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        total = cast(func.sum(DailyRollups.total_amount), BigInteger)
+        count = func.sum(DailyRollups.transaction_count)
+
+        try:
+            result = await session.execute(
+                select(
+                    Categories.name.label("category"),
+                    DailyRollups.transaction_type,
+                    total.label("total"),
+                    count.label("transactions_count")
+                )
+                .join(Categories, Categories.id == DailyRollups.category_id)
+                .where(*filters)
+                .group_by(DailyRollups.category_id, Categories.name, DailyRollups.transaction_type)
+                .having(count > 0)
+                .order_by(total.desc())
+            )
+            rows = result.all()
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+        return CategoryReportResponseSchema(
+            data=[
+                CategoryReportItemSchema(
+                    category=row.category,
+                    transaction_type=row.transaction_type,
+                    total=row.total,
+                    transactions_count=row.transactions_count
+                )
+                for row in rows
+            ],
+            meta=cls._meta(
+                transaction_type=transaction_type_value,
+                start_date=start_date,
+                end_date=end_date
+            )
+        )
+
+    #Method for displaying totals per day/week/month
+    @classmethod
+    async def periods_report_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        period: ReportPeriod = ReportPeriod.MONTH,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+    ) -> PeriodReportResponseSchema:
+        """
+        Totals of concrete user bucketed by date_trunc(period, day).
+
+        Raises:
+            HTTPException 503: In case of database errors
+        """
+
+        filters, transaction_type_value = cls.rollup_filters(
+            user_id=user_id,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        bucket = cast(func.date_trunc(period.value, DailyRollups.day), Date)
+
+        try:
+            result = await session.execute(
+                select(
+                    bucket.label("period_start"),
+                    cls.INCOME.label("income"),
+                    cls.EXPENSE.label("expense"),
+                    cls.COUNT.label("transactions_count")
+                )
+                .where(*filters)
+                .group_by(bucket)
+                .having(cls.COUNT > 0)
+                .order_by(bucket)
+            )
+            rows = result.all()
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+        return PeriodReportResponseSchema(
+            data=[
+                PeriodReportItemSchema(
+                    period_start=row.period_start,
+                    income=row.income,
+                    expense=row.expense,
+                    net=row.income - row.expense,
+                    transactions_count=row.transactions_count
+                )
+                for row in rows
+            ],
+            meta={
+                **cls._meta(
+                    transaction_type=transaction_type_value,
+                    start_date=start_date,
+                    end_date=end_date
+                ),
+                "period": period.value
+            }
+        )
+
+    @classmethod
+    def _meta(
+        cls,
+        *,
+        transaction_type: str | None,
+        start_date: datetime | None,
+        end_date: datetime | None
+    ) -> dict:
+        return {
+            "filters": {
+                "transaction_type": transaction_type,
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None
+            },
+            "generated_at": datetime.now(tz=timezone.utc).isoformat()
+        }
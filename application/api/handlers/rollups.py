@@ -0,0 +1,118 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert, Insert
+from sqlalchemy import select, delete, func, cast, Date, BigInteger, ColumnElement, FromClause
+
+from application.database.models.transactions import Transactions
+from application.database.models.daily_rollups import DailyRollups
+
+
+class RollupsService:
+    """
+    Maintenance of the daily_rollups table.
+
+    A rollup row holds sum and count of transactions of one user per
+    (UTC day, category id, transaction type). Every write path applies its
+    delta in the same database transaction as the write itself.
+    """
+
+    #Method for converting created_at into a rollup day
+    @classmethod
+    def rollup_day(
+        cls,
+        created_at: ColumnElement
+    ) -> ColumnElement:
+        return cast(func.timezone("UTC", created_at), Date)
+
+    #Method for building an upsert of rollup deltas
+    @classmethod
+    def upsert_from(
+        cls,
+        source: FromClause,
+        *,
+        sign: int = 1
+    ) -> Insert:
+        """
+        Building INSERT ... ON CONFLICT DO UPDATE that adds rows of `source` to the rollups.
+
+        Args:
+            source: subquery or CTE with user_id, created_at, category_id,
+                transaction_type and amount columns
+            sign: 1 for inserted transactions, -1 for deleted ones
+
+        Returns:
+            Insert statement ready to be executed
+        """
+
+        day = cls.rollup_day(source.c.created_at)
+
+        deltas = (
+            select(
+                source.c.user_id,
+                day.label("day"),
+                source.c.category_id,
+                source.c.transaction_type,
+                (cast(func.sum(source.c.amount), BigInteger) * sign).label("total_amount"),
+                (func.count() * sign).label("transaction_count")
+            )
+            .group_by(source.c.user_id, day, source.c.category_id, source.c.transaction_type)
+        )
+
+        statement = pg_insert(DailyRollups).from_select(
+            ["user_id", "day", "category_id", "transaction_type", "total_amount", "transaction_count"],
+            deltas
+        )
+
+        return statement.on_conflict_do_update(
+            index_elements=[
+                DailyRollups.user_id,
+                DailyRollups.day,
+                DailyRollups.category_id,
+                DailyRollups.transaction_type
+            ],
+            set_={
+                "total_amount": DailyRollups.total_amount + statement.excluded.total_amount,
+                "transaction_count": DailyRollups.transaction_count + statement.excluded.transaction_count,
+                "updated_at": func.now()
+            }
+        )
+
+    #Method for rebuilding rollups from transactions
+    @classmethod
+    async def rebuild_rollups_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int | None = None
+    ) -> int:
+        """
+        Recomputing rollups of one user (or all users) from the transactions table.
+
+        Runs in a single database transaction, so readers see either the old or
+        the new rollups.
+
+        Args:
+            session: AsyncSession
+            user_id: user ID from DB, None for every user
+
+        Returns:
+            Number of rollup rows written
+        """
+
+        source = select(
+            Transactions.user_id,
+            Transactions.created_at,
+            Transactions.category_id,
+            Transactions.transaction_type,
+            Transactions.amount
+        )
+        clear = delete(DailyRollups)
+
+        if user_id is not None:
+            source = source.where(Transactions.user_id == user_id)
+            clear = clear.where(DailyRollups.user_id == user_id)
+
+        await session.execute(clear)
+        result = await session.execute(cls.upsert_from(source.subquery()))
+        await session.commit()
+
+        return result.rowcount
@@ -1,30 +1,213 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import select, desc, asc, and_, func, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, desc, asc, and_, func, delete, tuple_, literal, literal_column, false, DateTime, ColumnElement, Select, Row
+from sqlalchemy.orm import InstrumentedAttribute
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 
-from application.database.models.users import Users
 from application.database.models.transactions import Transactions
+from application.api.handlers.rollups import RollupsService
+from application.api.handlers.categories import CategoriesService
 from features.pagination_enum import SortOrder, SortField
-from features.transaction_enum import TransactionType
+from features.transaction_enum import TransactionType, TransactionField
+from features.file_format_enum import FileFormat
+from features.search_enum import SearchMode
+from application.core.config import settings
+from application.core.cursor import Cursor
+from application.core.cache import transactions_count_cache
+from application.core.instrumentation import timed_phase
+from application.core.streaming import LineTooLongError
+from application.core.money import to_minor_units, from_minor_units, minor_units_to_json
+from application.database.partitions import ensure_months
 from application.schemas.transactions import (
     TransactionResponseWithMetaSchema, 
     DeleteResponseSchema, 
-    TransactionsResponseSchema
+    TransactionsResponseSchema,
+    TransactionsSchema,
+    TransactionRowPayload,
+    TransactionsPagePayload,
+    TransactionsImportSchema,
+    ImportResponseSchema,
+    ImportRowErrorSchema,
+    BatchCreateItemSchema,
+    BatchCreateResponseSchema,
+    BatchDeleteItemSchema,
+    BatchDeleteResponseSchema,
+    BATCH_DELETE_MAX_ITEMS
 )
 
 from datetime import datetime, timezone
-from typing import Dict, Any
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, Any, AsyncIterator, Sequence
+
+import csv
+import io
+import json
+import re
 
 class TransactionsService:
+    RESPONSE_COLUMNS = (
+        Transactions.id,
+        Transactions.user_id,
+        Transactions.amount,
+        Transactions.category,
+        Transactions.description,
+        Transactions.transaction_type,
+        Transactions.created_at
+    )
+
+    LISTING_COLUMNS = (
+        Transactions.id,
+        Transactions.amount,
+        Transactions.category,
+        Transactions.description,
+        Transactions.transaction_type,
+        Transactions.created_at
+    )
+
+    EXPORT_COLUMNS = (
+        Transactions.id,
+        Transactions.amount,
+        Transactions.category,
+        Transactions.description,
+        Transactions.transaction_type,
+        Transactions.created_at,
+        Transactions.updated_at
+    )
+
+    INSERT_CHUNK_SIZE = 4_000
+
+    SORT_MAPPING = {
+        SortField.CREATED_AT.value: Transactions.created_at,
+        SortField.AMOUNT.value: Transactions.amount,
+        SortField.DATE.value: Transactions.created_at,
+        SortField.UPDATED_AT.value: Transactions.updated_at,
+        SortField.CATEGORY.value: Transactions.category,
+        SortField.TRANSACTION_TYPE.value: Transactions.transaction_type
+    }
+
+    #Method for resolving a sort column
+    @classmethod
+    def sort_column(
+        cls,
+        *,
+        sort_by: str | None
+    ) -> InstrumentedAttribute:
+        """
+        Resolving sort field name into a Transactions column.
+        Unknown fields fall back to created_at.
+        """
+
+        return cls.SORT_MAPPING.get(sort_by, Transactions.created_at)
+
+    #Method for building filter conditions shared by listing endpoints
+    @classmethod
+    async def transaction_filters(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        category: str | None = None,
+        transaction_type: TransactionType | str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> tuple[list[ColumnElement[bool]], str | None]:
+        """
+        Building WHERE conditions for transaction listings.
+
+        Args:
+            session: AsyncSession, used when the category id is not cached
+            user_id: user ID from DB
+            category: transaction category, matched case-insensitively
+            transaction_type: transaction type: income or expense
+            start_date: lower bound for created_at
+            end_date: upper bound for created_at (inclusive for the whole day)
+
+        Returns:
+            List of conditions and normalized transaction type value
+        """
+
+        filters = [Transactions.user_id == user_id]
+
+        if category:
+            category_id = await CategoriesService.find_id(session=session, user_id=user_id, name=category)
+            # A category the user doesn't have matches nothing
+            filters.append(Transactions.category_id == category_id if category_id is not None else false())
+
+        transaction_type_value = None
+        if transaction_type:
+            if isinstance(transaction_type, TransactionType):
+                transaction_type_value = transaction_type.value
+            else:
+                try:
+                    transaction_type_enum = TransactionType(transaction_type)
+                    transaction_type_value = transaction_type_enum.value
+                except (ValueError, AttributeError):
+                    transaction_type_value = transaction_type
+            if transaction_type_value:
+                filters.append(Transactions.transaction_type == transaction_type_value)
+
+        if start_date:
+            filters.append(Transactions.created_at >= start_date)
+
+        if end_date:
+            end_date_with_time = end_date.replace(hour=23, minute=59, second=59)
+            filters.append(Transactions.created_at <= end_date_with_time)
+
+        return filters, transaction_type_value
+
+    #Method for building a search condition
+    @classmethod
+    def search_filter(
+        cls,
+        *,
+        search: str,
+        mode: SearchMode = SearchMode.FTS
+    ) -> ColumnElement[bool]:
+        """
+        Building an index-backed search condition over category and description.
+
+        FTS matches every word of the query as a prefix ("amaz" finds "Amazon"),
+        fuzzy tolerates typos through trigram word similarity. Both use the
+        (user_id, ...) GIN indexes together with the user filter.
+
+        Args:
+            search: user search query
+            mode: SearchMode.FTS or SearchMode.FUZZY
+
+        Returns:
+            Condition for WHERE
+
+        Raises:
+            HTTPException 400: If the query has no searchable words
+        """
+
+        words = re.findall(r"\w+", search.lower())
+
+        if not words:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query has no searchable words"
+            )
+
+        if mode == SearchMode.FUZZY:
+            # `<%` is word_similarity above pg_trgm.word_similarity_threshold, served by gin_trgm_ops
+            return literal(" ".join(words)).op("<%")(Transactions.search_text)
+
+        # Words are \w+ only, so they can't inject tsquery operators. The config is
+        # inlined: a REGCONFIG bind has no literal renderer for EXPLAIN harnesses
+        tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), " & ".join(f"{word}:*" for word in words))
+
+        return Transactions.search_vector.op("@@")(tsquery)
+
     #Method for adding a transaction
     @classmethod
     async def create_transaction_handler(
         cls,
         *,
         user_id: int,
-        amount: float,
+        amount: Decimal,
         category: str,
         session: AsyncSession,
         transaction_type: TransactionType,
@@ -33,20 +216,22 @@ class TransactionsService:
         """
         Creating new transaction for concrete user.
 
+        The user is not looked up again: get_current_user has already
+        resolved it and the foreign key guards the insert.
+
         Args:
             user_id: user ID from DB
-            amount: transaction amount
+            amount: transaction amount in major units, stored as exact minor units
             category: transaction category
             transaction_type: transaction type: income or expense
             description: transaction description
             session: AsyncSession
 
         Returns:
-            
+            Created transaction
 
         Raises:
-            HTTPException 400: If amount less or equal than 0
-            HTTPException 404: If user not found
+            HTTPException 400: If amount less or equal than 0 or not a whole number of minor units
             HTTPException 503: In case of database errors
         """
 
@@ -55,6 +240,15 @@ class TransactionsService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Amount must be greater than 0"
             )
+
+        try:
+            amount_minor = to_minor_units(amount)
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
     
         if not isinstance(transaction_type, TransactionType):
             valid_types = [t.value for t in TransactionType]
@@ -63,47 +257,43 @@ class TransactionsService:
                 detail=f"Invalid transaction type. Must be one of: {valid_types}"
             )
 
-        try:
-            result = await session.execute(
-                select(Users)
-                .where(Users.id == user_id)
-            )
+        transaction_date = datetime.now(tz=timezone.utc)
+        category_name = CategoriesService.normalize(category)
 
-            existing_user = result.scalar_one_or_none()
+        try:
+            # A cache hit costs no round trip, a new category is created in this transaction
+            category_ids = await CategoriesService.resolve_ids(session=session, user_id=user_id, names=[category_name])
 
-            if not existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found"
+            # INSERT ... RETURNING and the rollup upsert travel as one statement
+            new_transaction = (
+                insert(Transactions)
+                .values(
+                    user_id=user_id,
+                    amount=amount_minor,
+                    category=category_name,
+                    category_id=category_ids[category_name],
+                    description=description.strip() if description else "",
+                    transaction_type=transaction_type,
+                    created_at=transaction_date
                 )
-            
-        except SQLAlchemyError as e:
-            await session.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Service temporarily unavailable"
+                .returning(*cls.RESPONSE_COLUMNS, Transactions.category_id)
+                .cte("new_transaction")
             )
-        
-        transaction_date = datetime.now(tz=timezone.utc)
-
-        try:
 
-            new_transaction = Transactions(
-                user_id=user_id,
-                amount=amount,
-                category=category.strip().title(),
-                description=description.strip() if description else "",
-                transaction_type=transaction_type,
-                created_at=transaction_date
+            result = await session.execute(
+                select(new_transaction)
+                .add_cte(RollupsService.upsert_from(new_transaction).cte("new_transaction_rollup"))
             )
+            row = result.one()
 
-            session.add(new_transaction)
             await session.commit()
-            await session.refresh(new_transaction)
 
-            return TransactionsResponseSchema.model_validate(new_transaction, from_attributes=True)
+            transactions_count_cache.invalidate(user_id=user_id)
+
+            return TransactionsResponseSchema.model_validate(dict(row._mapping))
 
         except SQLAlchemyError as e:
+            await session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Service temporarily unavailable"
@@ -124,81 +314,88 @@ class TransactionsService:
         end_date: datetime | None = None,
         sort_by: str = "created_at",
         sort_order: str = "desc",
-    ) -> TransactionResponseWithMetaSchema:
-        #Doc string
-
-        offset = (page - 1) * per_page
-
-        query = (
-            select(Transactions)
-            .where(Transactions.user_id == user_id)
-            .options(
-                selectinload(Transactions.user)
-            )
-        )
-
-        if category:
-            query = query.where(Transactions.category == category)
-
-        transaction_type_value = None
-        if transaction_type:
-            if isinstance(transaction_type, TransactionType):
-                transaction_type_value = transaction_type.value
-            else:
-                try:
-                    transaction_type_enum = TransactionType(transaction_type)
-                    transaction_type_value = transaction_type_enum.value
-                except (ValueError, AttributeError):
-                    transaction_type_value = transaction_type
-            if transaction_type_value:
-                query = query.where(Transactions.transaction_type == transaction_type_value)
+        include_total: bool = True,
+        fields: list[TransactionField] | None = None,
+    ) -> TransactionsPagePayload:
+        """
+        Displaying transactions of concrete user with offset pagination.
 
-        date_filters = []
+        Only the needed columns are selected with a core query: no ORM
+        identity map and no relationship loading.
 
-        if start_date:
+        Args:
+            session: AsyncSession
+            user_id: user ID from DB
+            page: current page
+            per_page: number of records per page
+            category: transaction category
+            transaction_type: transaction type: income or expense
+            start_date: lower bound for created_at
+            end_date: upper bound for created_at
+            sort_by: column for sorting
+            sort_order: sort order
+            include_total: count matching records (served from the per-user count cache).
+                When False, has_next is probed with LIMIT per_page + 1 and
+                total_records/total_pages are null
+            fields: sparse fieldset, None for every field
 
-            date_filters.append(Transactions.created_at >= start_date)
+        Returns:
+            Page payload with pagination, filters and sort info in meta,
+            ready for `encode_transactions_page`
+        """
 
-        if end_date:
-            end_date_with_time = end_date.replace(hour=23, minute=59, second=59)
-            date_filters.append(Transactions.created_at <= end_date_with_time)
+        offset = (page - 1) * per_page
 
-        if date_filters:
-            query = query.where(and_(*date_filters))
+        filters, transaction_type_value = await cls.transaction_filters(
+            session=session,
+            user_id=user_id,
+            category=category,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
 
-        sort_mapping = {
-            SortField.CREATED_AT.value: Transactions.created_at,
-            SortField.AMOUNT.value: Transactions.amount,
-            SortField.DATE.value: Transactions.created_at,
-            SortField.UPDATED_AT.value: Transactions.updated_at,
-            SortField.CATEGORY.value: Transactions.category,
-            SortField.TRANSACTION_TYPE.value: Transactions.transaction_type
-        }
+        query = (
+            select(*cls.listing_columns(fields=fields))
+            .where(*filters)
+        )
 
-        sort_field = sort_mapping.get(sort_by, Transactions.created_at)
+        sort_field = cls.sort_column(sort_by=sort_by)
 
         if sort_order.lower() == SortOrder.ASC.value:
-            query = query.order_by(asc(sort_field))
+            query = query.order_by(asc(sort_field), asc(Transactions.id))
         else:
-            query = query.order_by(desc(sort_field))
+            query = query.order_by(desc(sort_field), desc(Transactions.id))
 
-        total_records_query = query.with_only_columns(func.count()).order_by(None)
+        total_records = None
+        total_pages = None
 
-        total_records_result = await session.execute(total_records_query)
-        total_records = total_records_result.scalar_one()
+        if include_total:
+            total_records = await cls._count_transactions(
+                session=session,
+                user_id=user_id,
+                filters=filters,
+                cache_key=(CategoriesService.normalize(category) if category else None, transaction_type_value, start_date, end_date)
+            )
+            total_pages = (total_records + per_page - 1) // per_page if total_records > 0 else 1
 
-        paginated_query = query.offset(offset).limit(per_page)
+            paginated_query = query.offset(offset).limit(per_page)
+        else:
+            paginated_query = query.offset(offset).limit(per_page + 1)
 
-        result = await session.execute(paginated_query)
-        transactions = result.scalars().all()
+        with timed_phase("query"):
+            result = await session.execute(paginated_query)
+            transactions = result.all()
 
-        transaction_data = [
-            TransactionsResponseSchema.model_validate(t, from_attributes=True) for t in transactions
-            ]
+        if include_total:
+            has_next = page < total_pages
+        else:
+            has_next = len(transactions) > per_page
+            transactions = transactions[:per_page]
 
-        total_pages = (total_records + per_page - 1) // per_page if total_records > 0 else 1
+        transaction_data = cls._listing_items(rows=transactions, fields=fields)
 
-        return TransactionResponseWithMetaSchema(
+        return TransactionsPagePayload(
             data=transaction_data,
             meta={
                 "pagination": {
@@ -206,7 +403,7 @@ class TransactionsService:
                     "per_page": per_page,
                     "total_records": total_records,
                     "total_pages": total_pages,
-                    "has_next": page < total_pages,
+                    "has_next": has_next,
                     "has_prev": page > 1
                 },
                 "filters": {
@@ -218,9 +415,66 @@ class TransactionsService:
                 "sort": {
                     "by": sort_by,
                     "order": sort_order
-                }
+                },
+                "fields": [field.value for field in fields] if fields else None
             }
         )
+
+    #Method for resolving selected columns of a listing
+    @classmethod
+    def listing_columns(
+        cls,
+        *,
+        fields: list[TransactionField] | None = None
+    ) -> list[InstrumentedAttribute]:
+        """
+        Resolving a sparse fieldset into Transactions columns.
+        None selects every column of TransactionsResponseSchema.
+        """
+
+        if not fields:
+            return list(cls.LISTING_COLUMNS)
+
+        return [getattr(Transactions, field.value) for field in dict.fromkeys(fields)]
+
+    @classmethod
+    def _listing_items(
+        cls,
+        *,
+        rows: Sequence[Row],
+        fields: list[TransactionField] | None
+    ) -> list[TransactionRowPayload]:
+        # Rows come from our own query, so they are passed on without validation.
+        # The projection columns come first, cursor helper columns (if any) are cut off by zip
+        names = [column.key for column in cls.listing_columns(fields=fields)]
+
+        return [dict(zip(names, row)) for row in rows]
+
+    @classmethod
+    async def _count_transactions(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        filters: list[ColumnElement[bool]],
+        cache_key: tuple
+    ) -> int:
+        total_records = transactions_count_cache.get(user_id=user_id, key=cache_key)
+
+        if total_records is None:
+            # Taken before the query: a write committed meanwhile makes the count stale
+            generation = transactions_count_cache.generation(user_id=user_id)
+
+            with timed_phase("count"):
+                total_records_result = await session.execute(
+                    select(func.count())
+                    .select_from(Transactions)
+                    .where(*filters)
+                )
+            total_records = total_records_result.scalar_one()
+            transactions_count_cache.set(user_id=user_id, key=cache_key, total=total_records, generation=generation)
+
+        return total_records
     
     #Method for displaying concrete transaction
     @classmethod
@@ -234,20 +488,21 @@ class TransactionsService:
         #Doc string
 
         try:
+            # Without created_at no partition is pruned: every attached partition is probed
+            # once through its (id, created_at) primary key, so the cost grows with the months
+            # kept (PARTITION_RETENTION_MONTHS) plus PARTITION_MONTHS_AHEAD. A (user_id, id)
+            # index would be per partition too and not save a probe
             result = await session.execute(
-                select(Transactions)
+                select(*cls.LISTING_COLUMNS)
                 .where(
                     and_(
                         Transactions.id == transaction_id,
                         Transactions.user_id == user_id
                     )
                 )
-                .options(
-                    selectinload(Transactions.user)
-                )
             )
 
-            transaction = result.scalar_one_or_none()
+            transaction = result.one_or_none()
 
             if not transaction:
                 raise HTTPException(
@@ -255,7 +510,7 @@ class TransactionsService:
                     detail="transaction not found"
                 )
             
-            transaction_data = TransactionsResponseSchema.model_validate(transaction, from_attributes=True)
+            transaction_data = TransactionsResponseSchema.model_validate(dict(transaction._mapping))
 
             return TransactionResponseWithMetaSchema(
                 data=[transaction_data],
@@ -281,39 +536,53 @@ class TransactionsService:
         transaction_id: int,
         session: AsyncSession
     ) -> DeleteResponseSchema:
-        #Doc String
+        """
+        Deleting concrete transaction of concrete user.
+
+        DELETE ... RETURNING and the rollup delta travel as one statement,
+        an empty RETURNING means the transaction does not exist.
+
+        Args:
+            user_id: user ID from DB
+            transaction_id: transaction ID from DB
+            session: AsyncSession
+
+        Raises:
+            HTTPException 404: If transaction not found
+            HTTPException 503: In case of database errors
+        """
 
         try:
-            check = await session.execute(
-                select(Transactions)
+            # Probes every partition by primary key, like get_concrete_transaction_handler
+            deleted_transaction = (
+                delete(Transactions)
                 .where(
                     and_(
                         Transactions.id == transaction_id,
                         Transactions.user_id == user_id
                     )
                 )
+                .returning(*cls._rollup_source().selected_columns)
+                .cte("deleted_transaction")
             )
 
-            transaction = check.scalar_one_or_none()
+            result = await session.execute(
+                select(func.count())
+                .select_from(deleted_transaction)
+                .add_cte(RollupsService.upsert_from(deleted_transaction, sign=-1).cte("deleted_transaction_rollup"))
+            )
 
-            if not transaction:
+            if not result.scalar_one():
+                await session.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="transaction not found"
                 )
 
-            await session.execute(
-                delete(Transactions)
-                .where(
-                    and_(
-                        Transactions.id == transaction_id,
-                        Transactions.user_id == user_id
-                    )
-                )
-            )
-
             await session.commit()
 
+            transactions_count_cache.invalidate(user_id=user_id)
+
             return DeleteResponseSchema(
                 message=f"Transaction {transaction_id} was successfully deleted",
                 deleted_id=transaction_id,
@@ -327,4 +596,675 @@ class TransactionsService:
                 detail="Service temporarily unavailable"
             )
 
-    #Method for displaying transaction with cursor-based pagination
\ No newline at end of file
+    #Method for adding several transactions at once
+    @classmethod
+    async def batch_create_transactions_handler(
+        cls,
+        *,
+        user_id: int,
+        items: list[TransactionsSchema],
+        session: AsyncSession
+    ) -> BatchCreateResponseSchema:
+        """
+        Creating several transactions for concrete user in one database transaction.
+
+        All rows are inserted by one multi-row INSERT ... RETURNING together with
+        their rollup deltas, so either every item is created or none is.
+
+        Args:
+            user_id: user ID from DB
+            items: validated transactions
+            session: AsyncSession
+
+        Returns:
+            Created transactions in request order
+
+        Raises:
+            HTTPException 503: In case of database errors
+        """
+
+        transaction_date = datetime.now(tz=timezone.utc)
+
+        rows = [
+            {
+                "user_id": user_id,
+                "amount": to_minor_units(item.amount),
+                "category": CategoriesService.normalize(item.category),
+                "description": item.description.strip() if item.description else "",
+                "transaction_type": item.transaction_type,
+                "created_at": transaction_date
+            }
+            for item in items
+        ]
+
+        try:
+            category_ids = await CategoriesService.resolve_ids(
+                session=session,
+                user_id=user_id,
+                names={row["category"] for row in rows}
+            )
+            for row in rows:
+                row["category_id"] = category_ids[row["category"]]
+
+            new_transactions = (
+                insert(Transactions)
+                .values(rows)
+                .returning(*cls.RESPONSE_COLUMNS, Transactions.category_id)
+                .cte("new_transactions")
+            )
+
+            # Sequence values are drawn in VALUES order, so ordering by id restores request order
+            result = await session.execute(
+                select(new_transactions)
+                .order_by(new_transactions.c.id)
+                .add_cte(RollupsService.upsert_from(new_transactions).cte("new_transactions_rollup"))
+            )
+            created = result.all()
+
+            await session.commit()
+
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+        transactions_count_cache.invalidate(user_id=user_id)
+
+        return BatchCreateResponseSchema(
+            data=[
+                BatchCreateItemSchema(
+                    index=index,
+                    transaction=TransactionsResponseSchema.model_validate(dict(row._mapping))
+                )
+                for index, row in enumerate(created)
+            ],
+            meta={
+                "user_id": user_id,
+                "created_count": len(created),
+                "created_at": transaction_date.isoformat()
+            }
+        )
+
+    #Method for deleting several transactions at once
+    @classmethod
+    async def batch_delete_transactions_handler(
+        cls,
+        *,
+        user_id: int,
+        session: AsyncSession,
+        ids: list[int] | None = None,
+        category: str | None = None,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+    ) -> BatchDeleteResponseSchema:
+        """
+        Deleting transactions of concrete user by ids or by listing filters.
+
+        One DELETE ... RETURNING with the rollup delta runs in a single
+        database transaction. A filter delete removes at most
+        BATCH_DELETE_MAX_ITEMS of the oldest matching transactions, so the
+        transaction and the response stay bounded like an ids delete.
+
+        Args:
+            user_id: user ID from DB
+            session: AsyncSession
+            ids: transaction ids (takes precedence over filters)
+            category: transaction category
+            transaction_type: transaction type: income or expense
+            start_date: lower bound for created_at
+            end_date: upper bound for created_at
+
+        Returns:
+            Per-item status for ids, or every deleted id for filters with
+            has_more set when the limit was hit
+
+        Raises:
+            HTTPException 503: In case of database errors
+        """
+
+        try:
+            if ids is not None:
+                conditions = [Transactions.user_id == user_id, Transactions.id.in_(ids)]
+            else:
+                conditions, _ = await cls.transaction_filters(
+                    session=session,
+                    user_id=user_id,
+                    category=category,
+                    transaction_type=transaction_type,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                oldest = (
+                    select(Transactions.id)
+                    .where(*conditions)
+                    .order_by(Transactions.created_at, Transactions.id)
+                    .limit(BATCH_DELETE_MAX_ITEMS)
+                )
+                conditions.append(Transactions.id.in_(oldest.scalar_subquery()))
+
+            deleted_transactions = (
+                delete(Transactions)
+                .where(*conditions)
+                .returning(Transactions.id, *cls._rollup_source().selected_columns)
+                .cte("deleted_transactions")
+            )
+
+            result = await session.execute(
+                select(deleted_transactions.c.id)
+                .add_cte(RollupsService.upsert_from(deleted_transactions, sign=-1).cte("deleted_transactions_rollup"))
+            )
+            deleted_ids = set(result.scalars().all())
+
+            await session.commit()
+
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+        if deleted_ids:
+            transactions_count_cache.invalidate(user_id=user_id)
+
+        if ids is not None:
+            data = [
+                BatchDeleteItemSchema(id=transaction_id, status="deleted" if transaction_id in deleted_ids else "not_found")
+                for transaction_id in dict.fromkeys(ids)
+            ]
+        else:
+            data = [BatchDeleteItemSchema(id=transaction_id, status="deleted") for transaction_id in sorted(deleted_ids)]
+
+        return BatchDeleteResponseSchema(
+            deleted_count=len(deleted_ids),
+            data=data,
+            has_more=ids is None and len(deleted_ids) == BATCH_DELETE_MAX_ITEMS,
+            deleted_at=datetime.now(tz=timezone.utc)
+        )
+
+    #Method for displaying transaction with cursor-based pagination
+    @classmethod
+    async def cursor_transactions_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        cursor: str | None = None,
+        per_page: int = 10,
+        category: str | None = None,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        fields: list[TransactionField] | None = None,
+        search: str | None = None,
+        search_mode: SearchMode = SearchMode.FTS,
+    ) -> TransactionsPagePayload:
+        """
+        Displaying transactions with keyset (cursor-based) pagination.
+
+        The page is located by a (sort key, id) row comparison instead of OFFSET,
+        so every page costs the same regardless of its depth.
+
+        Args:
+            session: AsyncSession
+            user_id: user ID from DB
+            cursor: opaque cursor from previous response (None for the first page)
+            per_page: number of records per page
+            category: transaction category
+            transaction_type: transaction type: income or expense
+            start_date: lower bound for created_at
+            end_date: upper bound for created_at
+            sort_by: column for sorting
+            sort_order: sort order
+            fields: sparse fieldset, None for every field
+            search: search query over category and description, None for no search
+            search_mode: full-text or fuzzy search
+
+        Returns:
+            Page payload with next/prev cursors in meta, ready for `encode_transactions_page`
+
+        Raises:
+            HTTPException 400: If cursor is malformed, was built for another sorting
+                or the search query has no searchable words
+        """
+
+        filters, transaction_type_value = await cls.transaction_filters(
+            session=session,
+            user_id=user_id,
+            category=category,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        if search:
+            filters.append(cls.search_filter(search=search, mode=search_mode))
+
+        sort_field = cls.sort_column(sort_by=sort_by)
+        sort_key = sort_field.key
+        order = SortOrder.ASC.value if (sort_order or "").lower() == SortOrder.ASC.value else SortOrder.DESC.value
+
+        direction = "next"
+        if cursor:
+            try:
+                cursor_data = Cursor.decode(cursor=cursor)
+                if cursor_data["s"] != sort_key or cursor_data["o"] != order:
+                    raise ValueError("Cursor does not match sort parameters")
+
+                boundary_value = cls._cursor_value_from_json(sort_field=sort_field, value=cursor_data["v"])
+
+            except (ValueError, TypeError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid cursor: {e}"
+                )
+
+            direction = cursor_data["d"]
+
+        forward = direction == "next"
+        scan_ascending = (order == SortOrder.ASC.value) == forward
+
+        if cursor:
+            row_key = tuple_(sort_field, Transactions.id)
+            boundary = tuple_(
+                literal(boundary_value, sort_field.type),
+                literal(cursor_data["id"], Transactions.id.type)
+            )
+            filters.append(row_key > boundary if scan_ascending else row_key < boundary)
+
+        if scan_ascending:
+            ordering = (asc(sort_field), asc(Transactions.id))
+        else:
+            ordering = (desc(sort_field), desc(Transactions.id))
+
+        # The cursor needs sort key and id even when the fieldset omits them
+        query = (
+            select(
+                *cls.listing_columns(fields=fields),
+                sort_field.label("cursor_sort_key"),
+                Transactions.id.label("cursor_row_id")
+            )
+            .where(*filters)
+            .order_by(*ordering)
+            .limit(per_page + 1)
+        )
+
+        with timed_phase("query"):
+            result = await session.execute(query)
+            transactions = list(result.all())
+
+        has_more = len(transactions) > per_page
+        transactions = transactions[:per_page]
+
+        if forward:
+            has_next, has_prev = has_more, cursor is not None
+        else:
+            transactions.reverse()
+            has_next, has_prev = True, has_more
+
+        next_cursor = None
+        prev_cursor = None
+        if transactions:
+            if has_next:
+                next_cursor = cls._build_cursor(
+                    transaction=transactions[-1], sort_key=sort_key, sort_order=order, direction="next"
+                )
+            if has_prev:
+                prev_cursor = cls._build_cursor(
+                    transaction=transactions[0], sort_key=sort_key, sort_order=order, direction="prev"
+                )
+
+        transaction_data = cls._listing_items(rows=transactions, fields=fields)
+
+        return TransactionsPagePayload(
+            data=transaction_data,
+            meta={
+                "pagination": {
+                    "per_page": per_page,
+                    "next_cursor": next_cursor,
+                    "prev_cursor": prev_cursor,
+                    "has_next": has_next,
+                    "has_prev": has_prev
+                },
+                "filters": {
+                    "category": category,
+                    "transaction_type": transaction_type_value,
+                    "start_date": start_date.isoformat() if start_date else None,
+                    "end_date": end_date.isoformat() if end_date else None
+                },
+                "sort": {
+                    "by": sort_key,
+                    "order": order
+                },
+                "fields": [field.value for field in fields] if fields else None,
+                **({"search": {"q": search, "mode": search_mode.value}} if search else {})
+            }
+        )
+
+    @classmethod
+    def _build_cursor(
+        cls,
+        *,
+        transaction: Row,
+        sort_key: str,
+        sort_order: str,
+        direction: str
+    ) -> str:
+        value = transaction.cursor_sort_key
+
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Enum):
+            value = value.value
+
+        return Cursor.encode(
+            sort_by=sort_key,
+            sort_order=sort_order,
+            value=value,
+            row_id=transaction.cursor_row_id,
+            direction=direction
+        )
+
+    @classmethod
+    def _cursor_value_from_json(
+        cls,
+        *,
+        sort_field: InstrumentedAttribute,
+        value: Any
+    ) -> Any:
+        if isinstance(sort_field.type, DateTime):
+            return datetime.fromisoformat(value)
+
+        if sort_field.key == SortField.TRANSACTION_TYPE.value:
+            return TransactionType(value)
+
+        # Amounts are sorted by their minor units, which are always whole numbers
+        if sort_field.key == SortField.AMOUNT.value and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ValueError("Invalid amount in cursor")
+
+        if sort_field.key == SortField.CATEGORY.value and not isinstance(value, str):
+            raise ValueError("Invalid category in cursor")
+
+        return value
+
+    #Method for importing transactions from CSV or NDJSON
+    @classmethod
+    async def import_transactions_handler(
+        cls,
+        *,
+        user_id: int,
+        lines: AsyncIterator[str],
+        file_format: FileFormat,
+        session: AsyncSession
+    ) -> ImportResponseSchema:
+        """
+        Importing transactions for concrete user from a stream of lines.
+
+        Lines are parsed and validated one at a time and inserted with
+        multi-row INSERTs of IMPORT_BATCH_SIZE rows, each batch in its own
+        transaction, so memory stays flat for files of any size. Invalid rows
+        are skipped and reported. Monthly partitions for historical created_at
+        values are created before the batch that needs them.
+
+        CSV input must start with a header row containing amount, category and
+        transaction_type columns; description and created_at are optional.
+        Quoted CSV fields must not contain line breaks.
+
+        Args:
+            user_id: user ID from DB
+            lines: lines of the uploaded file
+            file_format: csv or ndjson
+            session: AsyncSession
+
+        Returns:
+            Number of inserted and failed rows with per-row errors
+
+        Raises:
+            HTTPException 400: If the CSV header is invalid or a line is too long
+            HTTPException 503: In case of database errors
+        """
+
+        inserted = 0
+        failed = 0
+        errors: list[ImportRowErrorSchema] = []
+        batch: list[dict[str, Any]] = []
+        header: list[str] | None = None
+        import_date = datetime.now(tz=timezone.utc)
+
+        def add_error(line_number: int, error: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.IMPORT_MAX_ERRORS:
+                errors.append(ImportRowErrorSchema(line=line_number, error=error))
+
+        try:
+            line_number = 0
+            async for line in lines:
+                line_number += 1
+
+                if not line.strip():
+                    continue
+
+                if file_format == FileFormat.CSV and header is None:
+                    header = [column.strip().lower() for column in next(csv.reader([line]))]
+                    missing = {"amount", "category", "transaction_type"} - set(header)
+                    if missing:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"CSV header is missing columns: {sorted(missing)}"
+                        )
+                    continue
+
+                try:
+                    if file_format == FileFormat.CSV:
+                        values = next(csv.reader([line]))
+                        if len(values) != len(header):
+                            raise ValueError(f"expected {len(header)} columns, got {len(values)}")
+                        raw = {column: value or None for column, value in zip(header, values)}
+                    else:
+                        raw = json.loads(line)
+                        if not isinstance(raw, dict):
+                            raise ValueError("expected a JSON object")
+
+                    item = TransactionsImportSchema.model_validate(raw)
+
+                except ValidationError as e:
+                    add_error(line_number, "; ".join(
+                        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+                    ))
+                    continue
+
+                except (ValueError, csv.Error) as e:
+                    add_error(line_number, str(e))
+                    continue
+
+                created_at = item.created_at or import_date
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+
+                batch.append({
+                    "user_id": user_id,
+                    "amount": to_minor_units(item.amount),
+                    "category": CategoriesService.normalize(item.category),
+                    "description": item.description.strip() if item.description else "",
+                    "transaction_type": item.transaction_type,
+                    "created_at": created_at
+                })
+
+                if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                    inserted += await cls._insert_batch(session=session, user_id=user_id, rows=batch)
+                    batch = []
+
+            if batch:
+                inserted += await cls._insert_batch(session=session, user_id=user_id, rows=batch)
+
+        except (LineTooLongError, UnicodeDecodeError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{e}; {inserted} rows were imported before the error"
+            )
+
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Service temporarily unavailable; {inserted} rows were imported before the error"
+            )
+
+        finally:
+            if inserted:
+                transactions_count_cache.invalidate(user_id=user_id)
+
+        return ImportResponseSchema(
+            inserted=inserted,
+            failed=failed,
+            errors=errors,
+            errors_truncated=failed > len(errors)
+        )
+
+    @classmethod
+    async def _insert_batch(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        rows: list[dict[str, Any]]
+    ) -> int:
+        # Past months get their partition before the insert instead of filling the
+        # default partition; committed at once, creating one locks the parent table
+        connection = await session.connection()
+        if await ensure_months(connection, {row["created_at"] for row in rows}):
+            await session.commit()
+
+        category_ids = await CategoriesService.resolve_ids(
+            session=session,
+            user_id=user_id,
+            names={row["category"] for row in rows}
+        )
+        for row in rows:
+            row["category_id"] = category_ids[row["category"]]
+
+        # Multi-row VALUES binds one parameter per cell; sub-chunks keep every
+        # statement below the 32767 bind parameter limit of PostgreSQL
+        for start in range(0, len(rows), cls.INSERT_CHUNK_SIZE):
+            new_transactions = (
+                insert(Transactions)
+                .values(rows[start:start + cls.INSERT_CHUNK_SIZE])
+                .returning(*cls._rollup_source().selected_columns)
+                .cte("new_transactions")
+            )
+            await session.execute(RollupsService.upsert_from(new_transactions))
+
+        await session.commit()
+
+        return len(rows)
+
+    @classmethod
+    def _rollup_source(cls) -> Select:
+        return select(
+            Transactions.user_id,
+            Transactions.created_at,
+            Transactions.category_id,
+            Transactions.transaction_type,
+            Transactions.amount
+        )
+
+    #Method for exporting transactions as CSV or NDJSON
+    @classmethod
+    async def export_transactions_handler(
+        cls,
+        *,
+        session: AsyncSession,
+        user_id: int,
+        file_format: FileFormat,
+        category: str | None = None,
+        transaction_type: TransactionType | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> AsyncIterator[bytes]:
+        """
+        Exporting all matching transactions of concrete user.
+
+        Rows are fetched from a server-side cursor in EXPORT_CHUNK_SIZE
+        partitions and encoded straight from the result rows, so memory
+        stays flat regardless of the number of exported rows.
+
+        Args:
+            session: AsyncSession (must stay open while the iterator is consumed)
+            user_id: user ID from DB
+            file_format: csv or ndjson
+            category: transaction category
+            transaction_type: transaction type: income or expense
+            start_date: lower bound for created_at
+            end_date: upper bound for created_at
+            sort_by: column for sorting
+            sort_order: sort order
+
+        Returns:
+            Async iterator of encoded chunks
+        """
+
+        filters, _ = await cls.transaction_filters(
+            session=session,
+            user_id=user_id,
+            category=category,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        sort_field = cls.sort_column(sort_by=sort_by)
+        if (sort_order or "").lower() == SortOrder.ASC.value:
+            ordering = (asc(sort_field), asc(Transactions.id))
+        else:
+            ordering = (desc(sort_field), desc(Transactions.id))
+
+        columns = cls.EXPORT_COLUMNS
+        query = (
+            select(*columns)
+            .where(*filters)
+            .order_by(*ordering)
+            .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        names = [column.key for column in columns]
+        amount_index = names.index("amount")
+
+        if file_format == FileFormat.CSV:
+            writer.writerow(names)
+
+        result = await session.stream(query)
+
+        async for partition in result.partitions():
+            for row in partition:
+                values = [
+                    value.value if isinstance(value, Enum)
+                    else value.isoformat() if isinstance(value, datetime)
+                    else value
+                    for value in row
+                ]
+                if file_format == FileFormat.CSV:
+                    # Exported in major units, exactly as stored
+                    values[amount_index] = from_minor_units(values[amount_index])
+                    writer.writerow(values)
+                else:
+                    # Same exact decimal string as the API responses
+                    values[amount_index] = minor_units_to_json(values[amount_index])
+                    buffer.write(json.dumps(dict(zip(names, values)), separators=(",", ":")))
+                    buffer.write("\n")
+
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
@@ -1,17 +1,21 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import select
+from sqlalchemy import select, update, delete
+from jose import JWTError
 
 from application.database.models.users import Users
 from application.database.models.tokens import Tokens
-from application.core.password import Password
+from application.core.password import Password, PasswordHashingBusyError
 from application.core.jwt_generation import JWTGeneration
+from application.schemas.users import RegisterResponseSchema
 
 from typing import Dict
 from datetime import datetime, timezone, timedelta
 
 class UserService:
+    ACCESS_TOKEN_TTL = timedelta(minutes=15)
+    REFRESH_TOKEN_TTL = timedelta(days=30)
 
     # Method for adding a user
     @classmethod
@@ -22,7 +26,7 @@ class UserService:
         email: str, 
         password: str, 
         session: AsyncSession
-    ) -> Dict[str, str]:
+    ) -> RegisterResponseSchema:
         """
         Registering a new user.
         
@@ -33,11 +37,11 @@ class UserService:
             session: AsyncSession 
         
         Returns:
-            Dict with message of success and user_id
+            Message of success and user_id
 
         Raises:
             HTTPException 400: If email has been registered
-            HTTPException 503: In case with database errors
+            HTTPException 503: In case with database errors or when password hashing is saturated
         """
         
         try:
@@ -48,13 +52,18 @@ class UserService:
 
             existing_email = result.scalar_one_or_none()
 
+            # Ends the read transaction: the pooled connection is returned while
+            # waiting for a bcrypt slot and hashing, so a registration or login
+            # storm can't starve other endpoints of connections
+            await session.commit()
+
             if existing_email:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Email already registered"
                 )
             # Password hashing
-            hashed_password = Password.hashed_psw(password=password)
+            hashed_password = await Password.hashed_psw_async(password=password)
 
             #Adding User to DB
             new_user = Users(
@@ -66,10 +75,18 @@ class UserService:
             session.add(new_user)
             await session.commit()
 
-            return {
-                "message": "The User has been successfully registered",
-                "user_id": new_user.id
-            }
+            return RegisterResponseSchema(
+                message="The User has been successfully registered",
+                user_id=new_user.id
+            )
+
+        except PasswordHashingBusyError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, try again later",
+                headers={"Retry-After": "1"}
+            )
 
         except SQLAlchemyError as e:
             await session.rollback()
@@ -100,7 +117,7 @@ class UserService:
 
         Raises:
             HTTPException 401: If user entered incorrect credentials
-            HTTPException 503: In case with database errors
+            HTTPException 503: In case with database errors or when password hashing is saturated
         """
         
         try:
@@ -111,13 +128,19 @@ class UserService:
             
             existing_user = result.scalar_one_or_none()
 
+            # Returns the connection before bcrypt, see register_users_handler
+            await session.commit()
+
             if not existing_user:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid credentials"
                 )
             
-            is_valid_password = Password.verify_password(plain_password=password, hashed_password=existing_user.hashed_password)
+            is_valid_password = await Password.verify_password_async(
+                plain_password=password,
+                hashed_password=existing_user.hashed_password
+            )
 
             if not is_valid_password:
                 raise HTTPException(
@@ -126,35 +149,113 @@ class UserService:
                 )
 
             else:
-                refresh_payload = {
-                    "sub": str(existing_user.id),
-                    "exp": datetime.now(tz=timezone.utc) + timedelta(days=30),
-                    "type": "refresh"
-                }
+                refresh_token, expires_at = cls._refresh_token(user_id=existing_user.id)
 
-                refresh_token = Tokens(
-                    token=JWTGeneration.encode_jwt(payload=refresh_payload)
+                stored_token = Tokens(
+                    token_hash=JWTGeneration.hash_token(token=refresh_token),
+                    expires_at=expires_at
                 )
 
-                existing_user.token = refresh_token
-                
-                access_payload = {
-                    "sub": str(existing_user.id),
-                    "exp": datetime.now(tz=timezone.utc) + timedelta(minutes=15),
-                    "type": "access"
-                }
+                existing_user.token = stored_token
 
-                access_token = JWTGeneration.encode_jwt(payload=access_payload)
+                access_token = cls._access_token(user_id=existing_user.id)
 
-                session.add(refresh_token)
+                session.add(stored_token)
                 await session.commit()
 
                 return {
                     "access_token": access_token,
-                    "refresh_token": refresh_token.token,
+                    "refresh_token": refresh_token,
                     "token_type": "bearer"
                 }
 
+        except PasswordHashingBusyError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, try again later",
+                headers={"Retry-After": "1"}
+            )
+
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Service temporarily unavailable"
+            )
+
+    #Method for refreshing tokens of a user
+    @classmethod
+    async def refresh_tokens_handler(
+        cls,
+        *,
+        refresh_token: str,
+        session: AsyncSession
+    ) -> Dict[str, str]:
+        """
+        Issuing a new access token for a refresh token, without checking the password.
+
+        The refresh token is rotated by a single UPDATE that matches the
+        presented token, so of two concurrent requests with the same token
+        only one succeeds. A token with a valid signature that is no longer
+        stored has been used already (or revoked by logout): it is treated
+        as stolen and every refresh token of the user is revoked.
+
+        Args:
+            refresh_token: refresh token issued by login or a previous refresh
+            session: AsyncSession
+
+        Returns:
+            Dict with access_token, refresh_token and token_type
+
+        Raises:
+            HTTPException 401: If the token is invalid, expired, not a refresh token or was already used
+            HTTPException 503: In case with database errors
+        """
+
+        try:
+            payload = JWTGeneration.decode_jwt(access_token=refresh_token)
+
+        except JWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token"
+            )
+
+        if payload.get("type") != "refresh" or not str(payload.get("sub", "")).isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token"
+            )
+
+        user_id = int(payload["sub"])
+        new_refresh_token, expires_at = cls._refresh_token(user_id=user_id)
+
+        try:
+            # Unique index lookup by digest
+            result = await session.execute(
+                update(Tokens)
+                .where(
+                    Tokens.token_hash == JWTGeneration.hash_token(token=refresh_token),
+                    Tokens.user_id == user_id
+                )
+                .values(
+                    token_hash=JWTGeneration.hash_token(token=new_refresh_token),
+                    expires_at=expires_at
+                )
+                .returning(Tokens.id)
+            )
+            rotated = result.scalar_one_or_none()
+
+            if rotated is None:
+                # Reuse of a rotated token: revoke the whole token family
+                await session.execute(
+                    delete(Tokens)
+                    .where(Tokens.user_id == user_id)
+                )
+
+            await session.commit()
+
         except SQLAlchemyError as e:
             await session.rollback()
             raise HTTPException(
@@ -162,6 +263,48 @@ class UserService:
                 detail="Service temporarily unavailable"
             )
 
+        if rotated is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has been revoked"
+            )
+
+        return {
+            "access_token": cls._access_token(user_id=user_id),
+            "refresh_token": new_refresh_token,
+            "token_type": "bearer"
+        }
+
+    @classmethod
+    def _access_token(
+        cls,
+        *,
+        user_id: int
+    ) -> str:
+        return JWTGeneration.encode_jwt(payload={
+            "sub": str(user_id),
+            "exp": datetime.now(tz=timezone.utc) + cls.ACCESS_TOKEN_TTL,
+            "type": "access"
+        })
+
+    @classmethod
+    def _refresh_token(
+        cls,
+        *,
+        user_id: int
+    ) -> tuple[str, datetime]:
+        # exp is encoded with second precision, the stored expiry matches it
+        expires_at = (datetime.now(tz=timezone.utc) + cls.REFRESH_TOKEN_TTL).replace(microsecond=0)
+
+        # The jti added by encode_jwt keeps two tokens issued within the same second distinct
+        token = JWTGeneration.encode_jwt(payload={
+            "sub": str(user_id),
+            "exp": expires_at,
+            "type": "refresh"
+        })
+
+        return token, expires_at
+
     # Method for updating a user
     # Method for deleting a user
     # Method for displaying a user
\ No newline at end of file
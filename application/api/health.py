@@ -1,8 +1,39 @@
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from application.database.base import engine
+from application.database.token_sweeper import token_sweeper
+from application.core.password import Password
+from application.core.cache import transactions_count_cache, principal_cache, category_cache
+from application.core.metrics import render_metrics
 
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health")
 def health_check():
-    return {"status": "Ok"}
\ No newline at end of file
+    return {"status": "Ok"}
+
+
+@router.get("/health/pool", include_in_schema=False)
+async def pool_stats():
+    # Internal: live connection pool state of this worker
+    return engine.pool.stats
+
+
+@router.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def metrics():
+    # Prometheus text format, values are per worker process. Runs on the event loop
+    # (not the threadpool), so it reads counters and histograms between their updates
+    content = render_metrics(
+        pool_stats=engine.pool.stats,
+        bcrypt_stats={"waiting": Password.waiting, "running": Password.running},
+        cache_stats={
+            "transactions_count": transactions_count_cache.stats,
+            "principal": principal_cache.stats,
+            "category": category_cache.stats
+        },
+        token_stats=token_sweeper.stats
+    )
+
+    return PlainTextResponse(content, media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -5,8 +5,10 @@ from sqlalchemy import delete
 
 from application.database.models.users import Users
 from application.database.models.tokens import Tokens
-from application.api.dependencies.get_user import get_current_user
+from application.api.dependencies.get_user import get_current_user, get_token_payload
 from application.database.base import get_session
+from application.core.cache import principal_cache
+from application.core.revocation import revocation_backend
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -14,10 +16,14 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout_user_endpoint(
     current_user: Users = Depends(get_current_user),
+    payload: dict = Depends(get_token_payload),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Logout for concrete user.
+
+    Refresh tokens of the user are deleted and the presented access token
+    is revoked; other workers learn about it once the transaction commits.
     """
 
     try:
@@ -26,8 +32,13 @@ async def logout_user_endpoint(
             .where(Tokens.user_id == current_user.id)
         )
 
+        if payload.get("jti"):
+            await revocation_backend.publish(session=session, jti=payload["jti"], expires_at=payload["exp"])
+
         await session.commit()
 
+        principal_cache.pop(current_user.id)
+
         return {"message": "Successfully logged out"}
 
     except Exception as e:
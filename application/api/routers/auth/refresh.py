@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.schemas.users import RefreshTokenSchema
+from application.api.handlers.users import UserService
+from application.database.base import get_session
+
+from typing import Dict
+
+router = APIRouter(prefix="/auth", tags=["Auth"])
+
+
+@router.post("/refresh", status_code=status.HTTP_200_OK)
+async def refresh_tokens_endpoint(
+    token_data: RefreshTokenSchema,
+    session: AsyncSession = Depends(get_session)
+) -> Dict[str, str]:
+    """
+    Issuing new access and refresh tokens for a refresh token.
+
+    Args:
+        token_data: refresh token from login or a previous refresh
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        tokens = await UserService.refresh_tokens_handler(
+            refresh_token=token_data.refresh_token,
+            session=session
+        )
+
+        return tokens
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal service error"
+        )
@@ -2,12 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from application.schemas.users import UserCreateSchema
+from application.schemas.users import UserCreateSchema, RegisterResponseSchema
 from application.api.handlers.users import UserService
 from application.database.base import get_session
 
-from typing import Dict
-
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
@@ -16,7 +14,7 @@ async def register_user_endpoint(
     *, 
     user_data: UserCreateSchema, 
     session: AsyncSession = Depends(get_session)
-)-> Dict[str, str]:
+)-> RegisterResponseSchema:
     """
     Registering a new user.
     
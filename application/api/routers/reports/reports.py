@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.api.dependencies.get_user import get_current_user
+from application.api.dependencies.reports import get_report_params
+from application.api.handlers.reports import ReportsService
+from application.database.models.users import Users
+from application.database.base import get_session
+from application.schemas.reports import (
+    ReportsFilterSchema,
+    SummaryReportResponseSchema,
+    CategoryReportResponseSchema,
+    PeriodReportResponseSchema
+)
+from features.report_enum import ReportPeriod
+
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/summary", status_code=status.HTTP_200_OK, response_model=SummaryReportResponseSchema)
+async def summary_report_endpoint(
+    report_data: ReportsFilterSchema = Depends(get_report_params),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> SummaryReportResponseSchema:
+    """
+    Income, expense and net totals for concrete user.
+
+    A JWT Token is required
+
+    Args:
+        report_data: date and type filters
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await ReportsService.summary_report_handler(
+            user_id=current_user.id,
+            transaction_type=report_data.transaction_type,
+            start_date=report_data.start_date,
+            end_date=report_data.end_date,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
+@router.get("/categories", status_code=status.HTTP_200_OK, response_model=CategoryReportResponseSchema)
+async def categories_report_endpoint(
+    report_data: ReportsFilterSchema = Depends(get_report_params),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> CategoryReportResponseSchema:
+    """
+    Totals per category for concrete user.
+
+    A JWT Token is required
+
+    Args:
+        report_data: date and type filters
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await ReportsService.categories_report_handler(
+            user_id=current_user.id,
+            transaction_type=report_data.transaction_type,
+            start_date=report_data.start_date,
+            end_date=report_data.end_date,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
+@router.get("/periods", status_code=status.HTTP_200_OK, response_model=PeriodReportResponseSchema)
+async def periods_report_endpoint(
+    period: ReportPeriod = Query(ReportPeriod.MONTH, description="bucket size: day, week or month"),
+    report_data: ReportsFilterSchema = Depends(get_report_params),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> PeriodReportResponseSchema:
+    """
+    Totals per day, week or month for concrete user.
+
+    A JWT Token is required
+
+    Args:
+        period: bucket size
+        report_data: date and type filters
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await ReportsService.periods_report_handler(
+            user_id=current_user.id,
+            period=period,
+            transaction_type=report_data.transaction_type,
+            start_date=report_data.start_date,
+            end_date=report_data.end_date,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
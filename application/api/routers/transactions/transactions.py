@@ -1,21 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from application.api.dependencies.get_user import get_current_user
-from application.api.dependencies.transactions import get_transactions_params
+from application.api.dependencies.transactions import (
+    get_transactions_params,
+    get_cursor_transactions_params,
+    get_search_params,
+    get_export_params
+)
 from application.api.handlers.transactions import TransactionsService
 from application.database.models.users import Users
 from application.schemas.transactions import (
     TransactionsSchema, 
     PagedTransactionsDisplaySchema,
+    CursorTransactionsDisplaySchema,
+    SearchTransactionsDisplaySchema,
+    TransactionsExportSchema,
     TransactionResponseWithMetaSchema,
     DeleteResponseSchema,
-    TransactionsResponseSchema
+    TransactionsResponseSchema,
+    ImportResponseSchema,
+    TransactionsBatchSchema,
+    TransactionsBatchDeleteSchema,
+    BatchCreateResponseSchema,
+    BatchDeleteResponseSchema
 )
 
-from application.database.base import get_session
+from application.database.base import get_session, session_factory
 from application.schemas.transactions import TransactionResponseWithMetaSchema
+from application.core.streaming import iter_lines
+from application.core.serialization import TransactionsPageResponse
+from features.file_format_enum import FileFormat
 
 
 from typing import Dict, Any
@@ -65,12 +82,190 @@ async def new_transaction_endpoint(
             detail=f"Internal service error: {str(e)}"
         )
 
-@router.get("/paged_transactions", status_code=status.HTTP_200_OK, response_model=TransactionResponseWithMetaSchema)
+@router.post("/batch", status_code=status.HTTP_201_CREATED, response_model=BatchCreateResponseSchema)
+async def batch_create_transactions_endpoint(
+    batch_data: TransactionsBatchSchema,
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> BatchCreateResponseSchema:
+    """
+    Creating up to 1000 transactions for concrete user in one request.
+
+    A JWT Token is required
+
+    Args:
+        batch_data: transactions to create
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await TransactionsService.batch_create_transactions_handler(
+            user_id=current_user.id,
+            items=batch_data.items,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
+@router.post("/batch/delete", status_code=status.HTTP_200_OK, response_model=BatchDeleteResponseSchema)
+async def batch_delete_transactions_endpoint(
+    delete_data: TransactionsBatchDeleteSchema,
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> BatchDeleteResponseSchema:
+    """
+    Deleting transactions of concrete user by a list of ids or by filters.
+
+    A JWT Token is required
+
+    Args:
+        delete_data: ids or filters
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    filters = delete_data.filters
+
+    try:
+        result = await TransactionsService.batch_delete_transactions_handler(
+            user_id=current_user.id,
+            ids=delete_data.ids,
+            category=filters.category if filters else None,
+            transaction_type=filters.transaction_type if filters else None,
+            start_date=filters.start_date if filters else None,
+            end_date=filters.end_date if filters else None,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal service error"
+        )
+
+@router.post("/import", status_code=status.HTTP_201_CREATED, response_model=ImportResponseSchema)
+async def import_transactions_endpoint(
+    request: Request,
+    file_format: FileFormat = Query(FileFormat.CSV, description="format of the request body: csv or ndjson"),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> ImportResponseSchema:
+    """
+    Bulk import of transactions for concrete user.
+
+    The raw request body (text/csv or application/x-ndjson) is parsed
+    while it is being received, so files are never loaded into memory.
+
+    A JWT Token is required
+
+    Args:
+        request: incoming request with the file as body
+        file_format: csv or ndjson
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await TransactionsService.import_transactions_handler(
+            user_id=current_user.id,
+            lines=iter_lines(request.stream()),
+            file_format=file_format,
+            session=session
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_transactions_endpoint(
+    export_data: TransactionsExportSchema = Depends(get_export_params),
+    current_user: Users = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Streaming export of all transactions of concrete user.
+
+    A JWT Token is required
+
+    Args:
+        export_data: export format, filters and sorting
+        current_user: concrete user from dependency
+
+    Returns:
+        CSV or NDJSON stream
+    """
+
+    user_id = current_user.id
+
+    async def stream():
+        # The export owns its session so the cursor lives exactly as long as the response
+        async with session_factory() as session:
+            async for chunk in TransactionsService.export_transactions_handler(
+                user_id=user_id,
+                file_format=export_data.file_format,
+                category=export_data.category,
+                transaction_type=export_data.transaction_type,
+                start_date=export_data.start_date,
+                end_date=export_data.end_date,
+                sort_by=export_data.sort_by,
+                sort_order=export_data.sort_order,
+                session=session
+            ):
+                yield chunk
+
+    if export_data.file_format == FileFormat.CSV:
+        media_type, extension = "text/csv", "csv"
+    else:
+        media_type, extension = "application/x-ndjson", "ndjson"
+
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{extension}"'}
+    )
+
+@router.get(
+    "/paged_transactions",
+    status_code=status.HTTP_200_OK,
+    response_model=TransactionResponseWithMetaSchema,
+    response_class=TransactionsPageResponse
+)
 async def paged_transactions_endpoint(
     transaction_data: PagedTransactionsDisplaySchema = Depends(get_transactions_params),
     current_user: Users = Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
-) -> TransactionResponseWithMetaSchema:
+) -> TransactionsPageResponse:
     #Doc string
 
     try:
@@ -84,10 +279,13 @@ async def paged_transactions_endpoint(
             per_page=transaction_data.per_page,
             sort_by=transaction_data.sort_by,
             sort_order=transaction_data.sort_order,
+            include_total=transaction_data.include_total,
+            fields=transaction_data.fields,
             session=session
         )
 
-        return result
+        # Returning the response directly skips FastAPI's response_model re-validation
+        return TransactionsPageResponse(content=result)
     
     except Exception as e:
         raise HTTPException(
@@ -95,6 +293,115 @@ async def paged_transactions_endpoint(
             detail=f"Internal service error: {str(e)}"
         )
 
+@router.get(
+    "/cursor_transactions",
+    status_code=status.HTTP_200_OK,
+    response_model=TransactionResponseWithMetaSchema,
+    response_class=TransactionsPageResponse
+)
+async def cursor_transactions_endpoint(
+    transaction_data: CursorTransactionsDisplaySchema = Depends(get_cursor_transactions_params),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> TransactionsPageResponse:
+    """
+    Displaying transactions of concrete user with keyset pagination.
+
+    A JWT Token is required
+
+    Args:
+        transaction_data: cursor, filters and sorting
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await TransactionsService.cursor_transactions_handler(
+            user_id=current_user.id,
+            cursor=transaction_data.cursor,
+            category=transaction_data.category,
+            transaction_type=transaction_data.transaction_type,
+            start_date=transaction_data.start_date,
+            end_date=transaction_data.end_date,
+            per_page=transaction_data.per_page,
+            sort_by=transaction_data.sort_by,
+            sort_order=transaction_data.sort_order,
+            fields=transaction_data.fields,
+            session=session
+        )
+
+        # Returning the response directly skips FastAPI's response_model re-validation
+        return TransactionsPageResponse(content=result)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=TransactionResponseWithMetaSchema,
+    response_class=TransactionsPageResponse
+)
+async def search_transactions_endpoint(
+    transaction_data: SearchTransactionsDisplaySchema = Depends(get_search_params),
+    current_user: Users = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> TransactionsPageResponse:
+    """
+    Searching transactions of concrete user by category and description.
+
+    Combines with the listing filters and is paginated by cursor. Results are
+    ordered by the sort field, not by relevance. A cursor is only valid for
+    the query it was returned for.
+
+    A JWT Token is required
+
+    Args:
+        transaction_data: search query, cursor, filters and sorting
+        current_user: concrete user from dependency
+        session: AsyncSession from settings
+
+    Returns:
+        The result of the service layer's work
+    """
+
+    try:
+        result = await TransactionsService.cursor_transactions_handler(
+            user_id=current_user.id,
+            cursor=transaction_data.cursor,
+            category=transaction_data.category,
+            transaction_type=transaction_data.transaction_type,
+            start_date=transaction_data.start_date,
+            end_date=transaction_data.end_date,
+            per_page=transaction_data.per_page,
+            sort_by=transaction_data.sort_by,
+            sort_order=transaction_data.sort_order,
+            fields=transaction_data.fields,
+            search=transaction_data.q,
+            search_mode=transaction_data.mode,
+            session=session
+        )
+
+        return TransactionsPageResponse(content=result)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal service error: {str(e)}"
+        )
+
 @router.get("/{transaction_id}", status_code=status.HTTP_200_OK, response_model=TransactionResponseWithMetaSchema)
 async def get_concrete_transaction_endpoint(
     transaction_id: int = Path(..., description="transaction_id", ge=1),
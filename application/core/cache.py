@@ -0,0 +1,186 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from application.core.config import settings
+
+import itertools
+import time
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache with per-entry time to live.
+
+    The cache is not shared between workers, so the TTL bounds how long
+    an entry may stay stale when it is changed by another process.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Any:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize
+        }
+
+
+class TransactionsCountCache:
+    """
+    Cache of filtered transaction counts grouped by user.
+
+    Counts of one user live in a single bucket, so a write invalidates
+    every filter combination of that user in O(1).
+
+    Every invalidation also gives the user a new generation. A reader takes
+    the generation before its count query and passes it to `set`, which
+    drops the count when a write invalidated the user in between. Values
+    come from one increasing counter and never repeat, so a generation that
+    was evicted only makes `set` skip, never store a stale count.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._buckets = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._next_generation = itertools.count(1)
+
+    def get(self, *, user_id: int, key: Hashable) -> int | None:
+        bucket = self._buckets.get(user_id)
+        total = bucket.get(key) if bucket else None
+
+        if total is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return total
+
+    def generation(self, *, user_id: int) -> int:
+        return self._generations.get(user_id, 0)
+
+    def set(self, *, user_id: int, key: Hashable, total: int, generation: int) -> None:
+        if generation != self.generation(user_id=user_id):
+            return
+
+        bucket = self._buckets.get(user_id)
+
+        if bucket is None:
+            bucket = {}
+            self._buckets.set(user_id, bucket)
+
+        bucket[key] = total
+
+    def invalidate(self, *, user_id: int) -> None:
+        self._buckets.pop(user_id)
+        self._generations.set(user_id, next(self._next_generation))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._buckets),
+            "maxsize": self._buckets.maxsize
+        }
+
+
+class CategoryCache:
+    """
+    Per-user map of category names to ids.
+
+    Categories are never renamed or deleted by the API, so entries only
+    expire through the TTL; a user's names live in one bucket.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._buckets = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_many(self, *, user_id: int, names: set[str]) -> dict[str, int]:
+        bucket = self._buckets.get(user_id) or {}
+        found = {name: bucket[name] for name in names if name in bucket}
+
+        self.hits += len(found)
+        self.misses += len(names) - len(found)
+
+        return found
+
+    def set_many(self, *, user_id: int, categories: dict[str, int]) -> None:
+        if not categories:
+            return
+
+        bucket = self._buckets.get(user_id)
+
+        if bucket is None:
+            bucket = {}
+            self._buckets.set(user_id, bucket)
+
+        bucket.update(categories)
+
+    def invalidate(self, *, user_id: int) -> None:
+        self._buckets.pop(user_id)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._buckets),
+            "maxsize": self._buckets.maxsize
+        }
+
+
+transactions_count_cache = TransactionsCountCache(
+    maxsize=settings.COUNT_CACHE_SIZE,
+    ttl=settings.COUNT_CACHE_TTL
+)
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+category_cache = CategoryCache(
+    maxsize=settings.CATEGORY_CACHE_SIZE,
+    ttl=settings.CATEGORY_CACHE_TTL
+)
@@ -24,9 +24,57 @@ class Settings(BaseSettings):
     DB_PORT: int
     DB_NAME: str
 
+    # Connection Pool Settings
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1_800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 5
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+
     # FastAPI Settings
     BASE_FASTAPI_URL: str
 
+    # Import Settings
+    IMPORT_BATCH_SIZE: int = 1_000
+    IMPORT_MAX_ERRORS: int = 100
+
+    # Export Settings
+    EXPORT_CHUNK_SIZE: int = 1_000
+
+    # Password Hashing Settings
+    BCRYPT_MAX_CONCURRENCY: int = 4
+    BCRYPT_QUEUE_TIMEOUT: float = 2.0
+
+    # Cache Settings
+    COUNT_CACHE_SIZE: int = 10_000
+    COUNT_CACHE_TTL: int = 60
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL: int = 60
+    CATEGORY_CACHE_SIZE: int = 10_000
+    CATEGORY_CACHE_TTL: int = 600
+
+    # Instrumentation Settings
+    INSTRUMENTATION_SAMPLE_RATE: float = 1.0
+
+    # Metrics Settings
+    METRICS_LOOP_LAG_INTERVAL: float = 0.5
+
+    # Partition Settings
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_RETENTION_MONTHS: int = 0
+    PARTITION_ARCHIVE_SCHEMA: str = "archive"
+    PARTITION_MAINTENANCE_INTERVAL: int = 3_600
+
+    # Token Sweeper Settings
+    TOKEN_SWEEP_INTERVAL: int = 600
+    TOKEN_SWEEP_BATCH_SIZE: int = 1_000
+
+    # Token Revocation Settings
+    TOKEN_REVOCATION_BACKEND: str = "local"
+    TOKEN_REVOCATION_CHANNEL: str = "token_revocations"
+
     @property
     def get_db(self):
         
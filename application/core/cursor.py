@@ -0,0 +1,72 @@
+import base64
+import json
+
+from typing import Any
+
+
+class Cursor:
+    """
+    Opaque keyset cursor.
+
+    A cursor stores the sort key of the boundary row, its id and the
+    direction of the next page. The client must treat it as an opaque string.
+    """
+
+    @classmethod
+    def encode(
+        cls,
+        *,
+        sort_by: str,
+        sort_order: str,
+        value: Any,
+        row_id: int,
+        direction: str
+    ) -> str:
+        """
+        Encoding a cursor into an url-safe string.
+
+        Args:
+            sort_by: sort field the cursor was built for
+            sort_order: sort order the cursor was built for
+            value: sort key of the boundary row (must be JSON serializable)
+            row_id: id of the boundary row
+            direction: "next" or "prev"
+
+        Returns:
+            url-safe base64 string without padding
+        """
+
+        raw = json.dumps(
+            {"s": sort_by, "o": sort_order, "v": value, "id": row_id, "d": direction},
+            separators=(",", ":")
+        ).encode("utf-8")
+
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(
+        cls,
+        *,
+        cursor: str
+    ) -> dict[str, Any]:
+        """
+        Decoding a cursor produced by `encode`.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+        except (ValueError, UnicodeError) as e:
+            raise ValueError("Malformed cursor") from e
+
+        if not isinstance(data, dict) or not {"s", "o", "v", "id", "d"} <= data.keys():
+            raise ValueError("Malformed cursor")
+
+        if data["d"] not in ("next", "prev") or not isinstance(data["id"], int):
+            raise ValueError("Malformed cursor")
+
+        return data
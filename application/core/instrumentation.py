@@ -0,0 +1,172 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from application.core.config import settings
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import json
+import logging
+import random
+import time
+
+logger = logging.getLogger("application.instrumentation")
+
+
+def configure_logger() -> None:
+    """
+    Writing instrumentation lines to stderr as they are: they are already JSON.
+
+    Only this logger gets a handler and it doesn't propagate, so the root
+    logger stays as the server (uvicorn) configured it.
+    """
+
+    if logger.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+configure_logger()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Timings collected for a single sampled request.
+
+    Phases are accumulated, so a phase entered twice (e.g. two count queries)
+    reports the sum of both.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    sql_count: int = 0
+    db_time: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.phases.items()]
+        entries.append(f'db;dur={self.db_time * 1000:.2f};desc="{self.sql_count} queries"')
+        entries.append(f"total;dur={self.elapsed * 1000:.2f}")
+
+        return ", ".join(entries)
+
+
+# Set only for sampled requests, so the hooks below are no-ops otherwise
+current_metrics: ContextVar[RequestMetrics | None] = ContextVar("current_metrics", default=None)
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """
+    Adding the duration of the block to the current request's phase timings.
+    """
+
+    metrics = current_metrics.get()
+
+    if metrics is None:
+        yield
+        return
+
+    started = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        metrics.add_phase(name, time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Counting statements and DB time of the current request.
+
+    SQLAlchemy runs these hooks in a greenlet that shares the context of the
+    calling coroutine, so `current_metrics` is visible here.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if current_metrics.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        metrics = current_metrics.get()
+
+        if metrics is None or not conn.info.get("query_started"):
+            return
+
+        metrics.sql_count += 1
+        metrics.db_time += time.perf_counter() - conn.info["query_started"].pop()
+
+
+class InstrumentationMiddleware:
+    """
+    Pure ASGI middleware adding a Server-Timing header and a structured log line.
+
+    Only INSTRUMENTATION_SAMPLE_RATE of the requests are measured. The header
+    is written when the response starts, so for streamed responses it covers
+    the time until the first byte.
+    """
+
+    def __init__(self, app: Any, *, sample_rate: float | None = None) -> None:
+        self.app = app
+        self.sample_rate = settings.INSTRUMENTATION_SAMPLE_RATE if sample_rate is None else sample_rate
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        status_code = 500
+
+        async def send_with_timing(message: dict) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", metrics.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+
+        finally:
+            current_metrics.reset(token)
+            self.log(scope=scope, metrics=metrics, status_code=status_code)
+
+    @staticmethod
+    def log(*, scope: dict, metrics: RequestMetrics, status_code: int) -> None:
+        route = scope.get("route")
+
+        logger.info(json.dumps({
+            "event": "request",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status_code,
+            "duration_ms": round(metrics.elapsed * 1000, 2),
+            "sql_count": metrics.sql_count,
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in metrics.phases.items()}
+        }))
@@ -2,6 +2,9 @@ from jose import jwt
 
 from application.core.config import settings
 
+import hashlib
+import uuid
+
 
 class JWTGeneration:
     #Doc String
@@ -16,6 +19,9 @@ class JWTGeneration:
     ) -> str:
         #Doc String
 
+        # Every token gets its own id, so a single token can be revoked
+        payload = {"jti": uuid.uuid4().hex, **payload}
+
         return jwt.encode(payload, key=private_key, algorithm=algorithm)
     
 
@@ -29,4 +35,14 @@ class JWTGeneration:
     ) -> dict:
         #Doc String
 
-        return jwt.decode(token=access_token, key=public_key, algorithms=[algorithm], options={"verify_exp": True})
\ No newline at end of file
+        return jwt.decode(token=access_token, key=public_key, algorithms=[algorithm], options={"verify_exp": True})
+
+
+    @classmethod
+    def hash_token(
+        cls,
+        *,
+        token: str
+    ) -> str:
+        # Fixed-length digest stored and looked up instead of the token itself
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
\ No newline at end of file
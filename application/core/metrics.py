@@ -0,0 +1,246 @@
+from application.core.config import settings
+
+from typing import Any, Iterable
+
+import asyncio
+import bisect
+import time
+
+# Upper bounds in seconds, +Inf is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Cumulative histogram in Prometheus semantics keyed by label values.
+
+    Updates only happen on the event loop thread, so plain counters are
+    enough and no lock is taken on the request path.
+    """
+
+    def __init__(self, name: str, description: str, *, labels: tuple[str, ...], buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        self._series: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+
+        if series is None:
+            # Per-bucket counts (non-cumulative) + the +Inf bucket, sum, count
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} histogram"
+
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            labels = format_labels(zip(self.labels, label_values))
+            cumulative = 0
+
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield f"{self.name}_bucket{format_labels([*zip(self.labels, label_values), ('le', le)])} {cumulative}"
+
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class EventLoopLagMonitor:
+    """
+    Measuring how late the event loop wakes up a sleeping task.
+
+    A lag close to the interval means the loop is blocked by CPU work or
+    synchronous calls.
+    """
+
+    def __init__(self, *, interval: float) -> None:
+        self.interval = interval
+        self.last = 0.0
+        self.max = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.last = max(time.perf_counter() - started - self.interval, 0.0)
+            self.max = max(self.max, self.last)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-loop-lag-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+
+request_latency = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status.",
+    labels=("route", "method", "status"),
+    buckets=LATENCY_BUCKETS
+)
+
+loop_lag_monitor = EventLoopLagMonitor(interval=settings.METRICS_LOOP_LAG_INTERVAL)
+
+in_flight_requests = 0
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware observing every HTTP request.
+
+    Requests are labelled by route template (e.g. /transactions/{transaction_id}),
+    so path parameters don't create new series. Unmatched paths share one label.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        global in_flight_requests
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        in_flight_requests += 1
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+
+        finally:
+            in_flight_requests -= 1
+            route = scope.get("route")
+
+            request_latency.observe(
+                time.perf_counter() - started,
+                getattr(route, "path", "unmatched"),
+                scope["method"],
+                str(status_code)
+            )
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    rendered = ",".join(f'{name}="{escape_label(value)}"' for name, value in pairs)
+
+    return f"{{{rendered}}}" if rendered else ""
+
+
+def simple_metric(name: str, description: str, samples: Iterable[tuple[dict[str, str], float]], *, kind: str = "gauge") -> Iterable[str]:
+    yield f"# HELP {name} {description}"
+    yield f"# TYPE {name} {kind}"
+
+    for labels, value in samples:
+        yield f"{name}{format_labels(labels.items())} {value}"
+
+
+def render_metrics(
+    *,
+    pool_stats: dict[str, Any],
+    bcrypt_stats: dict[str, int],
+    cache_stats: dict[str, dict[str, int]],
+    token_stats: dict[str, int | float]
+) -> str:
+    """
+    Rendering every metric in the Prometheus text exposition format (0.0.4).
+
+    Collected values are passed in, so the output can be checked without
+    a running database or Prometheus server.
+    """
+
+    lines: list[str] = []
+    lines += request_latency.render()
+    lines += simple_metric("http_requests_in_flight", "Requests currently being served.", [({}, in_flight_requests)])
+
+    lines += simple_metric("db_pool_size", "Configured connection pool size.", [({}, pool_stats["size"])])
+    lines += simple_metric("db_pool_checked_out", "Connections currently checked out.", [({}, pool_stats["checked_out"])])
+    lines += simple_metric("db_pool_overflow", "Overflow connections currently open.", [({}, pool_stats["overflow"])])
+    lines += simple_metric(
+        "db_pool_checkouts_total", "Connection checkouts.", [({}, pool_stats["checkouts"])], kind="counter"
+    )
+    lines += simple_metric(
+        "db_pool_timeouts_total", "Checkouts that timed out.", [({}, pool_stats["timeouts"])], kind="counter"
+    )
+    lines += simple_metric(
+        "db_pool_wait_seconds_total", "Time spent waiting for a connection.",
+        [({}, pool_stats["wait_total_seconds"])], kind="counter"
+    )
+
+    lines += simple_metric("bcrypt_waiting", "Coroutines waiting for a bcrypt slot.", [({}, bcrypt_stats["waiting"])])
+    lines += simple_metric("bcrypt_running", "Password hashes currently computed.", [({}, bcrypt_stats["running"])])
+
+    lines += simple_metric(
+        "cache_hits_total", "Cache hits.",
+        [({"cache": name}, stats["hits"]) for name, stats in cache_stats.items()], kind="counter"
+    )
+    lines += simple_metric(
+        "cache_misses_total", "Cache misses.",
+        [({"cache": name}, stats["misses"]) for name, stats in cache_stats.items()], kind="counter"
+    )
+    lines += simple_metric(
+        "cache_hit_ratio", "Hits divided by lookups since start.",
+        [
+            ({"cache": name}, round(stats["hits"] / lookups, 4) if (lookups := stats["hits"] + stats["misses"]) else 0.0)
+            for name, stats in cache_stats.items()
+        ]
+    )
+    lines += simple_metric(
+        "cache_entries", "Entries currently cached.",
+        [({"cache": name}, stats["size"]) for name, stats in cache_stats.items()]
+    )
+
+    lines += simple_metric(
+        "tokens_table_rows", "Estimated rows of the tokens table at the last sweep.", [({}, token_stats["table_rows"])]
+    )
+    lines += simple_metric(
+        "tokens_table_bytes", "Size of the tokens table with indexes at the last sweep.", [({}, token_stats["table_bytes"])]
+    )
+    lines += simple_metric(
+        "token_sweeps_total", "Completed expired token sweeps.", [({}, token_stats["runs"])], kind="counter"
+    )
+    lines += simple_metric(
+        "token_sweep_deleted_total", "Expired tokens deleted.", [({}, token_stats["deleted_total"])], kind="counter"
+    )
+    lines += simple_metric(
+        "token_sweep_duration_seconds_total", "Time spent sweeping expired tokens.",
+        [({}, token_stats["duration_total_seconds"])], kind="counter"
+    )
+    lines += simple_metric(
+        "token_sweep_last_duration_seconds", "Duration of the last sweep.", [({}, token_stats["last_duration_seconds"])]
+    )
+
+    lines += simple_metric("event_loop_lag_seconds", "Last measured event loop lag.", [({}, round(loop_lag_monitor.last, 6))])
+    lines += simple_metric("event_loop_lag_max_seconds", "Largest event loop lag since start.", [({}, round(loop_lag_monitor.max, 6))])
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,38 @@
+from pydantic import PlainSerializer
+
+from decimal import Decimal
+from typing import Annotated
+
+# Amounts are stored and aggregated as integer minor units (cents)
+MINOR_UNITS = 100
+AMOUNT_DECIMAL_PLACES = 2
+# Largest amount whose minor units still fit into BIGINT
+AMOUNT_MAX_DIGITS = 18
+
+
+def to_minor_units(amount: Decimal | int) -> int:
+    """
+    Converting an amount in major units into exact minor units.
+
+    Raises:
+        ValueError: If the amount has more decimal places than minor units allow
+    """
+
+    minor = Decimal(amount) * MINOR_UNITS
+    if minor != minor.to_integral_value():
+        raise ValueError(f"Amount can have at most {AMOUNT_DECIMAL_PLACES} decimal places")
+
+    return int(minor)
+
+
+def from_minor_units(value: int) -> Decimal:
+    return Decimal(value).scaleb(-AMOUNT_DECIMAL_PLACES)
+
+
+def minor_units_to_json(value: int) -> str:
+    # A float is inexact above 2**53 minor units, which BIGINT amounts and sums exceed
+    return str(from_minor_units(value))
+
+
+# Field type of responses: holds minor units, rendered as an exact decimal string in major units
+MinorUnits = Annotated[int, PlainSerializer(minor_units_to_json, return_type=str, when_used="json")]
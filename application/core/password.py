@@ -1,8 +1,31 @@
 import bcrypt
 
+from application.core.config import settings
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar
+
+import asyncio
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL, so a thread pool is enough to keep hashing off the event loop
+_executor = ThreadPoolExecutor(max_workers=settings.BCRYPT_MAX_CONCURRENCY, thread_name_prefix="bcrypt")
+_slots = asyncio.Semaphore(settings.BCRYPT_MAX_CONCURRENCY)
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when a bcrypt slot was not acquired within BCRYPT_QUEUE_TIMEOUT."""
+
+
 class Password:
     #Doc String
 
+    # Number of coroutines waiting for a bcrypt slot and currently hashing
+    waiting: int = 0
+    running: int = 0
+
     @classmethod
     def hashed_psw(
         cls, 
@@ -23,4 +46,61 @@ class Password:
     ) -> bool:
         #Doc String
 
-        return bcrypt.checkpw(password=plain_password.encode("utf-8"), hashed_password=hashed_password.encode("utf-8"))
\ No newline at end of file
+        return bcrypt.checkpw(password=plain_password.encode("utf-8"), hashed_password=hashed_password.encode("utf-8"))
+
+    @classmethod
+    async def hashed_psw_async(
+        cls,
+        *,
+        password: str
+    ) -> str:
+        """
+        Hashing a password in the bcrypt thread pool.
+
+        Raises:
+            PasswordHashingBusyError: If all bcrypt slots stay busy longer than the queue timeout
+        """
+
+        return await cls._run_bounded(partial(cls.hashed_psw, password=password))
+
+    @classmethod
+    async def verify_password_async(
+        cls,
+        *,
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """
+        Verifying a password in the bcrypt thread pool.
+
+        Raises:
+            PasswordHashingBusyError: If all bcrypt slots stay busy longer than the queue timeout
+        """
+
+        return await cls._run_bounded(
+            partial(cls.verify_password, plain_password=plain_password, hashed_password=hashed_password)
+        )
+
+    @classmethod
+    async def _run_bounded(
+        cls,
+        func: Callable[[], T]
+    ) -> T:
+        cls.waiting += 1
+        try:
+            await asyncio.wait_for(_slots.acquire(), timeout=settings.BCRYPT_QUEUE_TIMEOUT)
+
+        except asyncio.TimeoutError as e:
+            raise PasswordHashingBusyError("Password hashing capacity exceeded") from e
+
+        finally:
+            cls.waiting -= 1
+
+        cls.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_executor, func)
+
+        finally:
+            cls.running -= 1
+            _slots.release()
@@ -0,0 +1,168 @@
+from sqlalchemy import select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.core.config import settings
+from features.revocation_enum import RevocationBackendType
+
+import asyncio
+import heapq
+import logging
+import time
+
+import asyncpg
+
+logger = logging.getLogger("application.revocation")
+
+
+class RevocationList:
+    """
+    In-process set of revoked token ids (jti).
+
+    An entry is only needed until the token's own exp: after that the JWT
+    check rejects the token anyway. Entries are therefore dropped at exp,
+    which keeps the set as small as the number of tokens revoked within
+    one access-token lifetime. Entries are never evicted earlier, that
+    would silently un-revoke a token.
+    """
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, float] = {}
+        self._expiry: list[tuple[float, str]] = []
+
+    def revoke(self, jti: str, *, expires_at: float) -> None:
+        if expires_at <= time.time() or self._revoked.get(jti, 0) >= expires_at:
+            return
+
+        self._revoked[jti] = expires_at
+        heapq.heappush(self._expiry, (expires_at, jti))
+        self._purge()
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def _purge(self) -> None:
+        now = time.time()
+
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expiry)
+            if self._revoked.get(jti) == expires_at:
+                del self._revoked[jti]
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list = RevocationList()
+
+
+class LocalRevocationBackend:
+    """
+    Stand-in for a single worker (and local development): revocations are
+    applied to this process only.
+    """
+
+    def __init__(self, revocations: RevocationList) -> None:
+        self.revocations = revocations
+
+    async def publish(self, *, session: AsyncSession, jti: str, expires_at: float) -> None:
+        self.revocations.revoke(jti, expires_at=expires_at)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresRevocationBackend(LocalRevocationBackend):
+    """
+    Revocations shared between workers through Postgres LISTEN/NOTIFY.
+
+    The notification is sent in the caller's transaction, so other workers
+    learn about a revocation only once it is committed. Every worker keeps
+    one dedicated listening connection outside of the pool and reconnects
+    when it is lost. Notifications are not persisted: a worker that starts
+    (or reconnects) after a revocation doesn't know about it, which leaves
+    at most one access-token lifetime for the revoked token there.
+    """
+
+    def __init__(
+        self,
+        revocations: RevocationList,
+        *,
+        url: str,
+        channel: str,
+        reconnect_delay: float = 5.0
+    ) -> None:
+        super().__init__(revocations)
+        self.connect_args = make_url(url).translate_connect_args(username="user")
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._task: asyncio.Task | None = None
+
+    async def publish(self, *, session: AsyncSession, jti: str, expires_at: float) -> None:
+        # Applied locally right away, the own notification arrives later and is a no-op
+        await super().publish(session=session, jti=jti, expires_at=expires_at)
+        await session.execute(select(func.pg_notify(self.channel, f"{jti}:{expires_at:.0f}")))
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        jti, _, expires_at = payload.rpartition(":")
+
+        try:
+            self.revocations.revoke(jti, expires_at=float(expires_at))
+        except ValueError:
+            logger.warning("Ignoring malformed revocation %r", payload)
+
+    async def _listen(self) -> None:
+        while True:
+            connection = None
+            lost = asyncio.Event()
+
+            try:
+                connection = await asyncpg.connect(**self.connect_args)
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                await lost.wait()
+                logger.warning("Revocation listener connection lost, reconnecting")
+
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Revocation listener failed, reconnecting")
+
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="revocation-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+
+def build_revocation_backend() -> LocalRevocationBackend:
+    backend = RevocationBackendType(settings.TOKEN_REVOCATION_BACKEND)
+
+    if backend == RevocationBackendType.POSTGRES:
+        return PostgresRevocationBackend(
+            revocation_list,
+            url=settings.get_db,
+            channel=settings.TOKEN_REVOCATION_CHANNEL
+        )
+
+    return LocalRevocationBackend(revocation_list)
+
+
+revocation_backend = build_revocation_backend()
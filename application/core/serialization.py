@@ -0,0 +1,27 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from application.schemas.transactions import TransactionsPagePayload
+from application.core.instrumentation import timed_phase
+
+# Built once: the adapter compiles its serializer on construction
+transactions_page_adapter = TypeAdapter(TransactionsPagePayload)
+
+
+def encode_transactions_page(payload: TransactionsPagePayload) -> bytes:
+    """
+    Encoding a listing page straight to JSON bytes.
+
+    Rows are plain dicts built from DB rows, so they are serialized by
+    pydantic-core without creating or validating a model per row.
+    """
+
+    with timed_phase("serialize"):
+        return transactions_page_adapter.dump_json(payload)
+
+
+class TransactionsPageResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: TransactionsPagePayload) -> bytes:
+        return encode_transactions_page(content)
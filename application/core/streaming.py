@@ -0,0 +1,41 @@
+import codecs
+
+from typing import AsyncIterator
+
+
+class LineTooLongError(ValueError):
+    """Raised when a streamed line exceeds the allowed length."""
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+    *,
+    encoding: str = "utf-8",
+    max_line_length: int = 64 * 1024
+) -> AsyncIterator[str]:
+    """
+    Splitting a stream of byte chunks into text lines.
+
+    Only the current incomplete line is buffered, so memory stays bounded
+    by `max_line_length` regardless of the stream size.
+
+    Raises:
+        LineTooLongError: If a line is longer than `max_line_length` characters
+    """
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    buffer = ""
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+
+        for line in lines:
+            yield line.rstrip("\r")
+
+        if len(buffer) > max_line_length:
+            raise LineTooLongError(f"Line is longer than {max_line_length} characters")
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
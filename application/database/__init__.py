@@ -2,10 +2,12 @@ from application.database.models.users import Users
 from application.database.models.transactions import Transactions
 from application.database.models.categories import Categories
 from application.database.models.tokens import Tokens
+from application.database.models.daily_rollups import DailyRollups
 
 __all__ = [
     "Users",
     "Transactions",
     "Categories",
-    "Tokens"
+    "Tokens",
+    "DailyRollups"
 ]
\ No newline at end of file
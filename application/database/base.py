@@ -2,10 +2,23 @@ from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from application.core.config import settings
+from application.database.pool import InstrumentedQueuePool
+from application.core.instrumentation import instrument_engine
 from typing import AsyncGenerator
 
 
-engine = create_async_engine(url=settings.get_db)
+engine = create_async_engine(
+    url=settings.get_db,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+)
+instrument_engine(engine.sync_engine)
+
 session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, func, ForeignKey
+from sqlalchemy import String, DateTime, func, ForeignKey, UniqueConstraint
 
 from application.database.base import Base
 
@@ -12,10 +12,14 @@ if TYPE_CHECKING:
 
 class Categories(Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        # Names are unique per user; the index also serves lookups by user_id
+        UniqueConstraint("user_id", "name", name="uq_categories_user_id_name"),
+    )
 
     # Base Columns
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(32), nullable=False, unique=True)
+    name: Mapped[str] = mapped_column(String(32), nullable=False)
 
     # Service Columns
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Date, BigInteger, Integer, func, ForeignKey, Enum
+
+from application.database.base import Base
+from features.transaction_enum import TransactionType
+
+from datetime import datetime, date
+
+
+class DailyRollups(Base):
+    __tablename__ = "daily_rollups"
+
+    # Base Columns
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), primary_key=True)
+    transaction_type: Mapped[TransactionType] = mapped_column(Enum(TransactionType, name="transaction_type"), primary_key=True)
+    # Minor units, see application.core.money
+    total_amount: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    # Service Columns
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import DateTime, func, ForeignKey
+from sqlalchemy import String, DateTime, func, ForeignKey, UniqueConstraint
 
 from application.database.base import Base
 
@@ -11,10 +11,17 @@ if TYPE_CHECKING:
 
 class Tokens(Base):
     __tablename__ = "tokens"
+    __table_args__ = (
+        # Refresh rotation looks tokens up by digest
+        UniqueConstraint("token_hash", name="uq_tokens_token_hash"),
+    )
 
     # Base Columns
     id: Mapped[int] = mapped_column(primary_key=True)
-    token: Mapped[str]
+    # sha256 hex digest of the refresh token, the token itself is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Same moment as the token's exp claim, the sweeper deletes rows past it
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
 
     # Service Columns
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -22,4 +29,4 @@ class Tokens(Base):
 
     # Relationships
     user: Mapped["Users"] = relationship("Users", back_populates="token")
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
\ No newline at end of file
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
\ No newline at end of file
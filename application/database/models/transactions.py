@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, func, ForeignKey, Enum
+from sqlalchemy import String, DateTime, BigInteger, func, ForeignKey, Enum, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 from application.database.base import Base
 from features.transaction_enum import TransactionType
@@ -13,16 +14,59 @@ if TYPE_CHECKING:
 
 class Transactions(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Keyset and offset listings: WHERE user_id = ? ORDER BY <sort field>, id
+        Index("ix_transactions_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_transactions_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_transactions_user_id_amount_id", "user_id", "amount", "id"),
+        Index("ix_transactions_user_id_category_id", "user_id", "category", "id"),
+        Index("ix_transactions_user_id_transaction_type_id", "user_id", "transaction_type", "id"),
+        # Category and type filters ordered by date
+        Index("ix_transactions_user_id_category_id_created_at_id", "user_id", "category_id", "created_at", "id"),
+        Index("ix_transactions_user_id_transaction_type_created_at_id", "user_id", "transaction_type", "created_at", "id"),
+        # Search: btree_gin lets user_id share the GIN index with the searched column
+        Index("ix_transactions_user_id_search_vector", "user_id", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_transactions_user_id_search_text_trgm",
+            "user_id",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+        # Monthly partitions are managed by application.database.partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     # Base Columns
-    id: Mapped[int] = mapped_column(primary_key=True)
-    amount: Mapped[float] = mapped_column(nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # Exact minor units (cents), converted at the API boundary by application.core.money
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Denormalized category name for display and search, filters use category_id
     category: Mapped[str] = mapped_column(String(32), nullable=False)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
     description: Mapped[str | None] = mapped_column(String(512))
     transaction_type: Mapped[TransactionType] = mapped_column(Enum(TransactionType, name="transaction_type"), nullable=False)
 
+    # Search Columns
+    # 'simple' config: merchant names are matched as written, without stemming
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', category), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
+    search_text: Mapped[str] = mapped_column(
+        String(545),
+        Computed("category || ' ' || coalesce(description, '')", persisted=True),
+        deferred=True
+    )
+
     # Service Columns
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Partition key, so it is part of the primary key
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), primary_key=True)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
@@ -0,0 +1,303 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable
+
+import asyncio
+import logging
+import re
+
+logger = logging.getLogger("application.partitions")
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+# Stored columns of a row; generated search columns are recomputed by Postgres
+DATA_COLUMNS = "id, amount, category, category_id, description, transaction_type, created_at, updated_at, user_id"
+
+# Serializes maintenance between workers, any constant unique to this job works
+MAINTENANCE_LOCK_KEY = 0x7472616e73
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    month: datetime
+
+    @property
+    def upper(self) -> datetime:
+        return add_months(self.month, 1)
+
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def bounds_sql(month: datetime) -> str:
+    return f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def create_partition_sql(month: datetime) -> str:
+    """DDL of the monthly partition holding `month` (UTC month boundaries)."""
+
+    return f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT_TABLE} {bounds_sql(month)}"
+
+
+def create_default_partition_sql() -> str:
+    # Catches rows outside of every monthly range instead of failing the insert
+    return f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"
+
+
+async def list_partitions(connection: AsyncConnection) -> list[Partition]:
+    """
+    Monthly partitions currently attached to the transactions table, oldest first.
+    """
+
+    result = await connection.execute(
+        text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+        """),
+        {"parent": PARENT_TABLE}
+    )
+
+    partitions = []
+    for (name,) in result:
+        match = PARTITION_NAME.match(name)
+        if match:
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+            partitions.append(Partition(name=name, month=month))
+
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+async def create_partition(connection: AsyncConnection, month: datetime) -> None:
+    """
+    Creating the monthly partition holding `month`.
+
+    Rows that already landed in the default partition for that month are
+    moved into it, otherwise Postgres refuses to create the partition.
+    """
+
+    name = partition_name(month)
+    bounds = {"lower": month, "upper": add_months(month, 1)}
+
+    in_default = await connection.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :lower AND created_at < :upper)"),
+        bounds
+    )
+
+    if not in_default.scalar_one():
+        await connection.execute(text(create_partition_sql(month)))
+        return
+
+    await connection.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)"))
+    await connection.execute(
+        text(f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE created_at >= :lower AND created_at < :upper
+                RETURNING *
+            )
+            INSERT INTO {name} ({DATA_COLUMNS}) SELECT {DATA_COLUMNS} FROM moved
+        """),
+        bounds
+    )
+    await connection.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} {bounds_sql(month)}"))
+
+
+async def ensure_months(connection: AsyncConnection, months: Iterable[datetime]) -> list[str]:
+    """
+    Creating the monthly partitions of `months` that don't exist yet.
+
+    Takes the maintenance lock only when something is missing, so callers
+    writing rows (import, seeding) can run it before every batch. Creating
+    a partition locks the parent table: the caller should commit right away.
+
+    Returns:
+        Names of the created partitions
+    """
+
+    wanted = {month_start(month) for month in months}
+    existing = {partition.month for partition in await list_partitions(connection)}
+
+    if wanted <= existing:
+        return []
+
+    await connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+    # Another worker may have created some of them while we waited for the lock
+    existing = {partition.month for partition in await list_partitions(connection)}
+    created = []
+
+    for month in sorted(wanted - existing):
+        await create_partition(connection, month)
+        created.append(partition_name(month))
+
+    return created
+
+
+def months_between(start: datetime, end: datetime) -> list[datetime]:
+    """Every month from the one holding `start` up to the one holding `end`."""
+
+    month, last = month_start(start), month_start(end)
+    months = []
+
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+
+    return months
+
+
+async def months_in_default(connection: AsyncConnection) -> list[datetime]:
+    # Maintenance keeps the default partition empty, so this scan is normally free
+    result = await connection.execute(
+        text(f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC') FROM {DEFAULT_PARTITION}")
+    )
+
+    return [month_start(month) for (month,) in result]
+
+
+async def ensure_partitions(
+    connection: AsyncConnection,
+    *,
+    months_ahead: int,
+    now: datetime | None = None
+) -> list[str]:
+    """
+    Creating monthly partitions up to `months_ahead` months ahead and for every
+    month that has rows in the default partition.
+
+    Past-dated rows (imports, seeding, a month older than the partitioning
+    migration) are moved out of the default partition into their own month,
+    where date filters prune to them and retention can detach them.
+    Must run inside a transaction, which the caller commits.
+
+    Returns:
+        Names of the created partitions
+    """
+
+    current = month_start(now or datetime.now(tz=timezone.utc))
+    months = months_between(current, add_months(current, months_ahead))
+
+    return await ensure_months(connection, [*months, *await months_in_default(connection)])
+
+
+async def detach_partitions(
+    connection: AsyncConnection,
+    *,
+    older_than_months: int,
+    archive_schema: str,
+    now: datetime | None = None
+) -> list[str]:
+    """
+    Detaching monthly partitions older than `older_than_months` into `archive_schema`.
+
+    Detached tables keep their data and indexes and can be dumped or dropped
+    independently. Daily rollups are not touched, so reports still include
+    archived months until rollups are rebuilt. Must run inside a transaction.
+
+    Returns:
+        Names of the detached partitions
+    """
+
+    await connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+
+    cutoff = add_months(month_start(now or datetime.now(tz=timezone.utc)), -older_than_months)
+    detached = []
+
+    for partition in await list_partitions(connection):
+        if partition.upper > cutoff:
+            break
+
+        if not detached:
+            await connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+
+        await connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"))
+        await connection.execute(text(f'ALTER TABLE {partition.name} SET SCHEMA "{archive_schema}"'))
+        detached.append(partition.name)
+
+    return detached
+
+
+class PartitionMaintenance:
+    """
+    Background job keeping future partitions created, the default partition
+    empty (and old partitions detached).
+
+    Every worker runs it, the advisory lock makes concurrent runs wait for
+    each other and the second run finds nothing to do.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        interval: float,
+        months_ahead: int,
+        retention_months: int,
+        archive_schema: str
+    ) -> None:
+        self.engine = engine
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_schema = archive_schema
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> None:
+        async with self.engine.begin() as connection:
+            created = await ensure_partitions(connection, months_ahead=self.months_ahead)
+
+            detached = []
+            if self.retention_months > 0:
+                detached = await detach_partitions(
+                    connection,
+                    older_than_months=self.retention_months,
+                    archive_schema=self.archive_schema
+                )
+
+        if created or detached:
+            logger.info("Partition maintenance: created %s, detached %s", created, detached)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+
+            except Exception:
+                # A failed run is retried on the next tick, the app keeps serving
+                logger.exception("Partition maintenance failed")
+
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="partition-maintenance")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
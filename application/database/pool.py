@@ -0,0 +1,82 @@
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from typing import Any
+
+import asyncio
+import time
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a connection.
+
+    Counters are kept per pool (one pool per worker process) and reset
+    when the pool is recreated by `engine.dispose()`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+
+        try:
+            return super()._do_get()
+
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_total_seconds": round(self.wait_total, 6),
+            "wait_max_seconds": round(self.wait_max, 6),
+            "wait_avg_seconds": round(self.wait_total / self.checkouts, 6) if self.checkouts else 0.0
+        }
+
+
+async def warm_up_pool(engine: AsyncEngine, *, connections: int) -> int:
+    """
+    Opening pool connections ahead of the first requests.
+
+    Args:
+        engine: AsyncEngine with the pool to fill
+        connections: number of connections to open, capped by the pool size
+
+    Returns:
+        Number of connections that were opened and returned to the pool
+    """
+
+    connections = min(connections, engine.pool.size())
+
+    # Connections are held at the same time, otherwise the pool would hand out a single one again
+    held = [engine.connect() for _ in range(connections)]
+
+    try:
+        results = await asyncio.gather(*(connection.start() for connection in held), return_exceptions=True)
+
+    finally:
+        await asyncio.gather(*(connection.close() for connection in held if connection.sync_connection is not None))
+
+    return sum(1 for result in results if not isinstance(result, BaseException))
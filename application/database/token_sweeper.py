@@ -0,0 +1,164 @@
+from sqlalchemy import select, delete, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from application.database.base import engine
+from application.database.models.tokens import Tokens
+from application.core.config import settings
+
+from datetime import datetime, timezone
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger("application.token_sweeper")
+
+
+async def delete_expired_batch(
+    connection: AsyncConnection,
+    *,
+    batch_size: int,
+    now: datetime
+) -> int:
+    """
+    Deleting at most `batch_size` expired refresh tokens.
+
+    Rows locked by a concurrent refresh or another worker's sweep are
+    skipped instead of waited for. Must run inside a transaction.
+
+    Returns:
+        Number of deleted rows
+    """
+
+    expired = (
+        select(Tokens.id)
+        .where(Tokens.expires_at < now)
+        .order_by(Tokens.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    result = await connection.execute(delete(Tokens).where(Tokens.id.in_(expired.scalar_subquery())))
+
+    return result.rowcount
+
+
+async def token_table_size(connection: AsyncConnection) -> tuple[int, int]:
+    """
+    Estimated row count and total size in bytes (with indexes) of the tokens table.
+
+    Both come from the catalog, so the check costs no scan.
+    """
+
+    result = await connection.execute(
+        text("""
+            SELECT greatest(reltuples, 0)::bigint, pg_total_relation_size(oid)
+            FROM pg_class
+            WHERE oid = CAST(:table AS regclass)
+        """),
+        {"table": Tokens.__tablename__}
+    )
+    rows, size = result.one()
+
+    return rows, size
+
+
+class TokenSweeper:
+    """
+    Background job deleting expired refresh tokens.
+
+    Every batch is its own short transaction, so locks are held only for
+    `batch_size` rows and concurrent sweeps of other workers skip them.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        interval: float,
+        batch_size: int
+    ) -> None:
+        self.engine = engine
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: asyncio.Task | None = None
+
+        self.runs = 0
+        self.deleted_total = 0
+        self.duration_total = 0.0
+        self.last_duration = 0.0
+        self.table_rows = 0
+        self.table_bytes = 0
+
+    async def run_once(self, *, now: datetime | None = None) -> int:
+        started = time.perf_counter()
+        now = now or datetime.now(tz=timezone.utc)
+        deleted = 0
+
+        while True:
+            async with self.engine.begin() as connection:
+                batch = await delete_expired_batch(connection, batch_size=self.batch_size, now=now)
+
+            deleted += batch
+            if batch < self.batch_size:
+                break
+
+            # Lets requests of this worker run between batches
+            await asyncio.sleep(0)
+
+        async with self.engine.connect() as connection:
+            self.table_rows, self.table_bytes = await token_table_size(connection)
+
+        self.last_duration = time.perf_counter() - started
+        self.duration_total += self.last_duration
+        self.deleted_total += deleted
+        self.runs += 1
+
+        if deleted:
+            logger.info("Token sweep: deleted %s expired tokens in %.3fs", deleted, self.last_duration)
+
+        return deleted
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "runs": self.runs,
+            "deleted_total": self.deleted_total,
+            "duration_total_seconds": round(self.duration_total, 6),
+            "last_duration_seconds": round(self.last_duration, 6),
+            "table_rows": self.table_rows,
+            "table_bytes": self.table_bytes
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+
+            except Exception:
+                # A failed run is retried on the next tick, the app keeps serving
+                logger.exception("Token sweep failed")
+
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="token-sweeper")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+
+token_sweeper = TokenSweeper(
+    engine,
+    interval=settings.TOKEN_SWEEP_INTERVAL,
+    batch_size=settings.TOKEN_SWEEP_BATCH_SIZE
+)
@@ -1,23 +1,71 @@
 import uvicorn
 from fastapi import FastAPI
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from application.api.routers.auth.register import router as register_router
 from application.api.routers.auth.login import router as login_router
 from application.api.routers.auth.logout import router as logout_router
+from application.api.routers.auth.refresh import router as refresh_router
 from application.api.routers.transactions.transactions import router as transactions_router
+from application.api.routers.reports.reports import router as reports_router
 from application.api.health import router as health_router
+from application.database.base import engine
+from application.database.pool import warm_up_pool
+from application.database.partitions import PartitionMaintenance
+from application.database.token_sweeper import token_sweeper
+from application.core.config import settings
+from application.core.instrumentation import InstrumentationMiddleware
+from application.core.metrics import MetricsMiddleware, loop_lag_monitor
+from application.core.revocation import revocation_backend
+
+
+partition_maintenance = PartitionMaintenance(
+    engine,
+    interval=settings.PARTITION_MAINTENANCE_INTERVAL,
+    months_ahead=settings.PARTITION_MONTHS_AHEAD,
+    retention_months=settings.PARTITION_RETENTION_MONTHS,
+    archive_schema=settings.PARTITION_ARCHIVE_SCHEMA
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Connections are opened before serving, so first requests don't pay connect latency
+    await warm_up_pool(engine, connections=settings.DB_POOL_WARMUP)
+    await revocation_backend.start()
+    loop_lag_monitor.start()
+    partition_maintenance.start()
+    token_sweeper.start()
+
+    try:
+        yield
+
+    finally:
+        await token_sweeper.stop()
+        await partition_maintenance.stop()
+        await loop_lag_monitor.stop()
+        await revocation_backend.stop()
+        await engine.dispose()
 
 
 app = FastAPI(
     title="FinMind AI",
     description="Private Financial Analisys System",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+app.add_middleware(InstrumentationMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(register_router)
 app.include_router(login_router)
 app.include_router(logout_router)
+app.include_router(refresh_router)
 app.include_router(transactions_router)
+app.include_router(reports_router)
 app.include_router(health_router)
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+
+from features.transaction_enum import TransactionType
+from application.core.money import MinorUnits
+
+from datetime import datetime, date
+
+
+class ReportsFilterSchema(BaseModel):
+    start_date: datetime | None = Field(None, description="start date of the report")
+    end_date: datetime | None = Field(None, description="end date of the report")
+    transaction_type: TransactionType | None = Field(None, description="transaction_type")
+
+class SummaryReportSchema(BaseModel):
+    income: MinorUnits = Field(..., description="sum of income transactions")
+    expense: MinorUnits = Field(..., description="sum of expense transactions")
+    net: MinorUnits = Field(..., description="income minus expense")
+    transactions_count: int = Field(..., ge=0)
+
+class CategoryReportItemSchema(BaseModel):
+    category: str = Field(..., max_length=32)
+    transaction_type: TransactionType = Field(...)
+    total: MinorUnits = Field(...)
+    transactions_count: int = Field(..., ge=0)
+
+class PeriodReportItemSchema(BaseModel):
+    period_start: date = Field(..., description="first day of the bucket")
+    income: MinorUnits = Field(...)
+    expense: MinorUnits = Field(...)
+    net: MinorUnits = Field(...)
+    transactions_count: int = Field(..., ge=0)
+
+class SummaryReportResponseSchema(BaseModel):
+    data: SummaryReportSchema
+    meta: dict
+
+class CategoryReportResponseSchema(BaseModel):
+    data: list[CategoryReportItemSchema]
+    meta: dict
+
+class PeriodReportResponseSchema(BaseModel):
+    data: list[PeriodReportItemSchema]
+    meta: dict
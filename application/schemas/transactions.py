@@ -1,21 +1,36 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
-from features.transaction_enum import TransactionType
-from application.schemas.users import UserResponseSchema
+from features.transaction_enum import TransactionType, TransactionField
+from features.file_format_enum import FileFormat
+from features.search_enum import SearchMode
+from application.core.money import MinorUnits, AMOUNT_MAX_DIGITS, AMOUNT_DECIMAL_PLACES
 
 from datetime import datetime
-from typing import TypeVar
+from decimal import Decimal
+from typing import TypeVar, Literal, TypedDict, Annotated
 
 T = TypeVar("T")
 
+# Most transactions one batch delete removes, by ids or by filters
+BATCH_DELETE_MAX_ITEMS = 1000
+
 
 class TransactionsSchema(BaseModel):
-    amount: float = Field(gt=0, description="The transaction amount must be greater than 0")
+    amount: Decimal = Field(
+        gt=0,
+        max_digits=AMOUNT_MAX_DIGITS,
+        decimal_places=AMOUNT_DECIMAL_PLACES,
+        description="The transaction amount must be greater than 0"
+    )
     category: str = Field(max_length=32, description="Transaction category")
     description: str | None = Field(max_length=512, description="Transaction description")
     transaction_type: TransactionType = Field(..., description="Transaction type: income or expense")
 
 
+class TransactionsImportSchema(TransactionsSchema):
+    description: str | None = Field(None, max_length=512, description="Transaction description")
+    created_at: datetime | None = Field(None, description="Original transaction date, defaults to import time")
+
 class PagedTransactionsDisplaySchema(BaseModel):
     page: int = Field(1, description="current page")
     per_page: int = Field(10, description="number of records per page")
@@ -25,16 +40,64 @@ class PagedTransactionsDisplaySchema(BaseModel):
     end_date: datetime | None = Field(None, description="end date for sorting")
     category: str | None = Field(None, description="transaction category")
     transaction_type: TransactionType | None = Field(None, description="transaction_type")
+    include_total: bool = Field(True, description="count total records and pages")
+    fields: list[TransactionField] | None = Field(None, description="sparse fieldset")
+
+class CursorTransactionsDisplaySchema(BaseModel):
+    cursor: str | None = Field(None, description="opaque cursor from the previous page")
+    per_page: int = Field(10, ge=1, le=100, description="number of records per page")
+    sort_by: str | None = Field("created_at", description="column for sorting")
+    sort_order: str | None = Field("desc", description="sort order")
+    start_date: datetime | None = Field(None, description="start date for sorting")
+    end_date: datetime | None = Field(None, description="end date for sorting")
+    category: str | None = Field(None, description="transaction category")
+    transaction_type: TransactionType | None = Field(None, description="transaction_type")
+    fields: list[TransactionField] | None = Field(None, description="sparse fieldset")
+
+class SearchTransactionsDisplaySchema(CursorTransactionsDisplaySchema):
+    q: str = Field(..., min_length=1, max_length=128, description="search query over category and description")
+    mode: SearchMode = Field(SearchMode.FTS, description="fts: word prefixes, fuzzy: tolerates typos")
+
+class TransactionsExportSchema(BaseModel):
+    file_format: FileFormat = Field(FileFormat.CSV, description="export format: csv or ndjson")
+    sort_by: str | None = Field("created_at", description="column for sorting")
+    sort_order: str | None = Field("desc", description="sort order")
+    start_date: datetime | None = Field(None, description="start date for sorting")
+    end_date: datetime | None = Field(None, description="end date for sorting")
+    category: str | None = Field(None, description="transaction category")
+    transaction_type: TransactionType | None = Field(None, description="transaction_type")
 
 class TransactionsResponseSchema(TransactionsSchema):
     id: int = Field(..., ge=1)
+    amount: MinorUnits = Field(..., description="Transaction amount")
     created_at: datetime = Field(...)
-    user: UserResponseSchema | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
+class TransactionsSparseResponseSchema(BaseModel):
+    # Only fields requested through ?fields= are set and serialized
+    id: int | None = None
+    amount: MinorUnits | None = None
+    category: str | None = None
+    description: str | None = None
+    transaction_type: TransactionType | None = None
+    created_at: datetime | None = None
+
+class TransactionRowPayload(TypedDict, total=False):
+    # Serialization-only shape of a listed row, see application.core.serialization
+    id: int
+    amount: MinorUnits
+    category: str
+    description: str | None
+    transaction_type: TransactionType
+    created_at: datetime
+
+class TransactionsPagePayload(TypedDict):
+    data: list[TransactionRowPayload]
+    meta: dict
+
 class TransactionResponseWithMetaSchema(BaseModel):
-    data: list[TransactionsResponseSchema]
+    data: list[TransactionsResponseSchema | TransactionsSparseResponseSchema]
     meta: dict
     
     model_config = ConfigDict(from_attributes=True)
@@ -42,4 +105,62 @@ class TransactionResponseWithMetaSchema(BaseModel):
 class DeleteResponseSchema(BaseModel):
     message: str = Field(...)
     deleted_id: int = Field(..., ge=1)
+    deleted_at: datetime = Field(...)
+
+class ImportRowErrorSchema(BaseModel):
+    line: int = Field(..., ge=1, description="line number in the uploaded file")
+    error: str = Field(...)
+
+class ImportResponseSchema(BaseModel):
+    inserted: int = Field(..., ge=0)
+    failed: int = Field(..., ge=0)
+    errors: list[ImportRowErrorSchema] = Field(default_factory=list)
+    errors_truncated: bool = Field(False, description="more errors happened than are listed")
+
+class TransactionsFilterSchema(BaseModel):
+    start_date: datetime | None = Field(None, description="start date for sorting")
+    end_date: datetime | None = Field(None, description="end date for sorting")
+    category: str | None = Field(None, description="transaction category")
+    transaction_type: TransactionType | None = Field(None, description="transaction_type")
+
+class TransactionsBatchSchema(BaseModel):
+    items: list[TransactionsSchema] = Field(..., min_length=1, max_length=1000)
+
+class BatchCreateItemSchema(BaseModel):
+    index: int = Field(..., ge=0, description="position of the item in the request")
+    transaction: TransactionsResponseSchema
+
+class BatchCreateResponseSchema(BaseModel):
+    data: list[BatchCreateItemSchema]
+    meta: dict
+
+class TransactionsBatchDeleteSchema(BaseModel):
+    ids: list[Annotated[int, Field(ge=1)]] | None = Field(
+        None,
+        min_length=1,
+        max_length=BATCH_DELETE_MAX_ITEMS,
+        description="transaction ids to delete"
+    )
+    filters: TransactionsFilterSchema | None = Field(
+        None,
+        description=f"delete the oldest {BATCH_DELETE_MAX_ITEMS} transactions matching the filters"
+    )
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "TransactionsBatchDeleteSchema":
+        #Exactly one target, and a filter must narrow something down
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("provide either ids or filters")
+        if self.filters is not None and not self.filters.model_dump(exclude_none=True):
+            raise ValueError("filters must contain at least one condition")
+        return self
+
+class BatchDeleteItemSchema(BaseModel):
+    id: int = Field(..., ge=1)
+    status: Literal["deleted", "not_found"]
+
+class BatchDeleteResponseSchema(BaseModel):
+    deleted_count: int = Field(..., ge=0)
+    data: list[BatchDeleteItemSchema]
+    has_more: bool = Field(False, description="a filter delete hit the limit, repeat it to delete the rest")
     deleted_at: datetime = Field(...)
\ No newline at end of file
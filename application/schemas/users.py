@@ -9,6 +9,13 @@ class UserLoginSchema(BaseModel):
     email: EmailStr = Field(max_length=256)
     password: str = Field(max_length=256)
 
+class RegisterResponseSchema(BaseModel):
+    message: str = Field(...)
+    user_id: int = Field(..., ge=1)
+
+class RefreshTokenSchema(BaseModel):
+    refresh_token: str = Field(max_length=2048)
+
 class UserResponseSchema(BaseModel):
     id: int = Field(ge=1)
     username: str = Field(max_length=32)
@@ -0,0 +1,223 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The app is served in-process by uvicorn on an ephemeral port and driven by a
+minimal keep-alive HTTP/1.1 client built on asyncio streams, so the benchmarks
+need nothing beyond the application dependencies.
+"""
+
+import asyncio
+import json
+import time
+
+import uvicorn
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+
+@asynccontextmanager
+async def serve_app(app: Any, *, host: str = "127.0.0.1") -> AsyncIterator[tuple[str, int]]:
+    """Serving the ASGI app in the current event loop on a free port."""
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=0, log_level="warning", lifespan="on"))
+    task = asyncio.create_task(server.serve())
+
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    try:
+        yield host, port
+    finally:
+        server.should_exit = True
+        await task
+
+
+class HttpClient:
+    """Single keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: Any = None,
+        body: bytes | None = None,
+        token: str | None = None,
+        content_type: str = "application/json"
+    ) -> tuple[int, bytes]:
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+        body = body or b""
+
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            f"Content-Length: {len(body)}",
+        ]
+        if body:
+            headers.append(f"Content-Type: {content_type}")
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+
+        message = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+        # A kept-alive connection may have been closed by the server (idle timeout or
+        # after an error) without a Connection: close header; it shows as an empty
+        # status line, and the request is sent once more on a fresh connection
+        for attempt in range(2):
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+            try:
+                self._writer.write(message)
+                await self._writer.drain()
+                status_line = await self._reader.readline()
+            except ConnectionError:
+                status_line = b""
+
+            if status_line.strip():
+                break
+
+            await self.close()
+        else:
+            raise ConnectionError(f"{method} {path}: server closed the connection without a response")
+
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if "content-length" in response_headers:
+            payload = await self._reader.readexactly(int(response_headers["content-length"]))
+        elif response_headers.get("transfer-encoding") == "chunked":
+            payload = await self._read_chunked()
+        else:
+            payload = b""
+
+        if response_headers.get("connection") == "close":
+            await self.close()
+
+        return status, payload
+
+    async def json(self, method: str, path: str, **kwargs: Any) -> tuple[int, Any]:
+        status, payload = await self.request(method, path, **kwargs)
+        return status, json.loads(payload) if payload else None
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self._reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._reader = self._writer = None
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """p50/p95/p99 (nearest rank) of latencies in seconds, reported in milliseconds."""
+
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        index = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered) + 0.5) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    return {"p50": rank(50), "p95": rank(95), "p99": rank(99)}
+
+
+async def run_for(
+    duration: float,
+    concurrency: int,
+    make_worker: Callable[[int], Awaitable[Callable[[], Awaitable[bool]]]]
+) -> tuple[list[float], int]:
+    """
+    Running `concurrency` workers in a closed loop for `duration` seconds.
+
+    `make_worker(index)` returns an operation coroutine function which reports
+    whether the call succeeded. Returns latencies of successful calls and the
+    number of failed calls.
+    """
+
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def loop(index: int) -> None:
+        nonlocal errors
+        operation = await make_worker(index)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            ok = await operation()
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    await asyncio.gather(*(loop(i) for i in range(concurrency)))
+
+    return latencies, errors
+
+
+async def run_requests(
+    total: int,
+    concurrency: int,
+    make_worker: Callable[[int], Awaitable[Callable[[int], Awaitable[bool]]]]
+) -> tuple[list[float], int, float]:
+    """
+    Running exactly `total` operations spread over `concurrency` workers.
+
+    A fixed number of operations (instead of a fixed duration) keeps the work
+    identical between runs, so results of different commits are comparable.
+    `make_worker(index)` returns an operation coroutine function taking the
+    global operation number. Returns latencies of successful calls, the number
+    of failed calls and the wall time in seconds.
+    """
+
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def loop(index: int) -> None:
+        nonlocal errors
+        operation = await make_worker(index)
+        for number in counter:
+            started = time.perf_counter()
+            ok = await operation(number)
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop(i) for i in range(concurrency)))
+
+    return latencies, errors, time.perf_counter() - started
@@ -0,0 +1,212 @@
+"""
+Index usage check for the hot queries of the API.
+
+Runs EXPLAIN (FORMAT JSON) for every query listed in `hot_queries` against the
+database from settings and reports the plan the planner really picks. It exits
+with code 1 when a plan:
+
+* scans a checked table with more than --min-rows rows sequentially
+* sorts more than one page of rows, i.e. no index delivers the requested order
+* can't be planned at all
+
+Plans depend on table statistics, so run it against a seeded and analyzed
+database (scripts.seed_data). On an empty one the planner rightly prefers
+sequential scans; --no-seqscan disables them to check index shapes there.
+
+Usage:
+    python -m benchmarks.explain_hot_queries
+    python -m benchmarks.explain_hot_queries --no-seqscan
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from sqlalchemy import select, delete, update, func, desc, asc, and_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+from application.database.base import engine
+from application.database.models.transactions import Transactions
+from application.database.models.tokens import Tokens
+from application.database.models.categories import Categories
+from application.api.handlers.transactions import TransactionsService
+from features.transaction_enum import TransactionType
+from features.search_enum import SearchMode
+
+from datetime import datetime, timezone
+
+CHECKED_TABLES = {"transactions", "tokens", "categories"}
+USER_ID = 1
+PAGE_SIZE = 10
+
+# Search ranks every match before taking a page: its Sort is bounded by the
+# number of matches, not by the user's rows
+SORT_ALLOWED = {"full-text search", "fuzzy search"}
+
+
+async def listing_query(
+    session: AsyncSession,
+    *,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    **filters
+) -> Executable:
+    conditions, _ = await TransactionsService.transaction_filters(session=session, user_id=USER_ID, **filters)
+    sort_field = TransactionsService.sort_column(sort_by=sort_by)
+    direction = asc if sort_order == "asc" else desc
+
+    return (
+        select(Transactions)
+        .where(*conditions)
+        .order_by(direction(sort_field), direction(Transactions.id))
+        .limit(PAGE_SIZE)
+    )
+
+
+async def count_query(session: AsyncSession, **filters) -> Executable:
+    conditions, _ = await TransactionsService.transaction_filters(session=session, user_id=USER_ID, **filters)
+
+    return select(func.count()).select_from(Transactions).where(*conditions)
+
+
+async def search_query(session: AsyncSession, search: str, mode: SearchMode) -> Executable:
+    conditions, _ = await TransactionsService.transaction_filters(session=session, user_id=USER_ID)
+    conditions.append(TransactionsService.search_filter(search=search, mode=mode))
+
+    return (
+        select(Transactions.id)
+        .where(*conditions)
+        .order_by(desc(Transactions.created_at), desc(Transactions.id))
+        .limit(PAGE_SIZE)
+    )
+
+
+async def hot_queries(session: AsyncSession) -> dict[str, Executable]:
+    start_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2025, 3, 31, tzinfo=timezone.utc)
+    # An existing category of the user: an unknown one is a constant false filter
+    category = await session.scalar(
+        select(Categories.name).where(Categories.user_id == USER_ID).order_by(Categories.id).limit(1)
+    )
+
+    return {
+        "paged listing by created_at": await listing_query(session),
+        "paged listing by amount": await listing_query(session, sort_by="amount"),
+        "paged listing by updated_at": await listing_query(session, sort_by="updated_at", sort_order="asc"),
+        "paged listing sorted by category": await listing_query(session, sort_by="category"),
+        "paged listing sorted by type": await listing_query(session, sort_by="transaction_type", sort_order="asc"),
+        "paged listing by category": await listing_query(session, category=category),
+        "paged listing by type": await listing_query(session, transaction_type=TransactionType.EXPENSE),
+        "paged listing by date range": await listing_query(session, start_date=start_date, end_date=end_date),
+        "full-text search": await search_query(session, "amazon charge", SearchMode.FTS),
+        "fuzzy search": await search_query(session, "amazn", SearchMode.FUZZY),
+        "total count": await count_query(session),
+        "total count by category": await count_query(session, category=category),
+        # By id: one primary key probe per partition, no partition can be pruned
+        "concrete transaction": select(*TransactionsService.LISTING_COLUMNS).where(
+            and_(Transactions.id == 1, Transactions.user_id == USER_ID)
+        ),
+        "delete by id": delete(Transactions).where(
+            and_(Transactions.id == 1, Transactions.user_id == USER_ID)
+        ),
+        "logout tokens delete": delete(Tokens).where(Tokens.user_id == USER_ID),
+        "refresh token rotation": update(Tokens)
+            .where(Tokens.token_hash == "0" * 64, Tokens.user_id == USER_ID)
+            .values(token_hash="1" * 64),
+        "expired tokens sweep": delete(Tokens).where(Tokens.id.in_(
+            select(Tokens.id).where(Tokens.expires_at < end_date).order_by(Tokens.expires_at).limit(1_000).scalar_subquery()
+        )),
+        "user categories": select(Categories).where(Categories.user_id == USER_ID),
+    }
+
+
+def plan_problems(plan: dict, *, table_rows: dict[str, int], min_rows: int, sort_allowed: bool) -> list[str]:
+    """
+    Collecting sequential scans of large checked tables and sorts of more than
+    a page of rows in a JSON plan tree.
+    """
+
+    found = []
+    relation = plan.get("Relation Name", "")
+    # Partitions of transactions (transactions_p2026_01, transactions_default) count as transactions
+    table = next((name for name in CHECKED_TABLES if relation == name or relation.startswith(f"{name}_")), None)
+
+    if plan.get("Node Type") == "Seq Scan" and table and table_rows.get(relation, 0) > min_rows:
+        found.append(f"sequential scan on {relation} (~{table_rows[relation]} rows)")
+
+    if plan.get("Node Type") in ("Sort", "Incremental Sort") and not sort_allowed:
+        # A Sort consumes its whole input even under a LIMIT, an Incremental Sort whole groups of it
+        rows = plan["Plans"][0]["Plan Rows"]
+        if rows > PAGE_SIZE:
+            found.append(f"sort of ~{rows} rows by {', '.join(plan.get('Sort Key', []))}")
+
+    for child in plan.get("Plans", []):
+        found.extend(plan_problems(child, table_rows=table_rows, min_rows=min_rows, sort_allowed=sort_allowed))
+
+    return found
+
+
+async def main(args: argparse.Namespace) -> int:
+    failures = 0
+
+    async with engine.connect() as connection:
+        if args.no_seqscan:
+            await connection.exec_driver_sql("SET enable_seqscan = off")
+
+        result = await connection.exec_driver_sql("SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r'")
+        table_rows = dict(result.all())
+
+        # Category filters resolve the name into an id on the same connection
+        queries = await hot_queries(AsyncSession(bind=connection))
+
+        for name, query in queries.items():
+            sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+            # A query the database can't plan (e.g. missing extension) is reported, the rest still run
+            savepoint = await connection.begin_nested()
+            try:
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+                plan = result.scalar_one()
+            except DBAPIError as error:
+                await savepoint.rollback()
+                failures += 1
+                print(f"FAIL  {name}: {error.orig}")
+                continue
+            await savepoint.commit()
+
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            problems = plan_problems(
+                plan[0]["Plan"],
+                table_rows=table_rows,
+                min_rows=args.min_rows,
+                sort_allowed=name in SORT_ALLOWED
+            )
+            if problems:
+                failures += 1
+                print(f"FAIL  {name}: {'; '.join(dict.fromkeys(problems))}")
+            else:
+                print(f"ok    {name}")
+
+        await connection.rollback()
+
+    await engine.dispose()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=10_000,
+        help="sequential scans of smaller tables are accepted, the planner rightly prefers them there"
+    )
+    parser.add_argument("--no-seqscan", action="store_true", help="disable sequential scans (empty databases)")
+
+    sys.exit(asyncio.run(main(parser.parse_args())))
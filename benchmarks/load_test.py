@@ -0,0 +1,344 @@
+"""
+Load test of the whole API against a local Postgres.
+
+Starts the app in-process, seeds one user per --sizes entry with that many
+transactions (reused between runs when already present) and drives every
+scenario with a fixed number of requests at fixed concurrency:
+
+* register, login, refresh, logout (refresh runs on one connection: every
+  call consumes the refresh token returned by the previous one)
+* create, get_by_id, delete
+* paged listing on page 1 (shallow) and on the last page (deep) per seeded user
+
+Throughput and p50/p95/p99 of every scenario are printed as JSON together
+with the git commit, so results of two commits can be compared:
+
+    python -m benchmarks.load_test --output before.json
+    git checkout <other commit>
+    python -m benchmarks.load_test --compare before.json
+
+With --compare the exit code is 1 when a scenario's p95 grew or its
+throughput dropped by more than --threshold percent.
+
+Run against docker-compose `db` (port 5433) or any throwaway database with
+the migrations applied; DB_* settings are read from .env as usual.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import uuid
+
+from sqlalchemy import select, delete, func, text
+
+from application.main import app
+from application.database.base import engine, session_factory
+from application.database.models.users import Users
+from application.database.models.tokens import Tokens
+from application.database.models.transactions import Transactions
+from application.database.models.daily_rollups import DailyRollups
+from application.database.models.categories import Categories
+from application.database.partitions import ensure_months, months_between
+from application.api.handlers.rollups import RollupsService
+from application.api.handlers.categories import CategoriesService
+from application.api.handlers.users import UserService
+from benchmarks.common import HttpClient, serve_app, percentiles, run_requests
+
+from datetime import datetime, timedelta, timezone
+
+PASSWORD = "benchmark-password"
+PER_PAGE = 20
+
+SEED_CATEGORIES = ("Food", "Rent", "Transport", "Health", "Leisure", "Salary", "Utilities", "Travel")
+# Seeded transaction n is created SEED_STEP * n before SEED_ANCHOR
+SEED_ANCHOR = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SEED_STEP = timedelta(minutes=7)
+
+SEED_TRANSACTIONS = text("""
+    INSERT INTO transactions (user_id, amount, category, category_id, description, transaction_type, created_at, updated_at)
+    SELECT
+        :user_id,
+        generated.amount,
+        categories.name,
+        categories.id,
+        'load test ' || generated.n,
+        generated.transaction_type::transaction_type,
+        CAST(:anchor AS timestamptz) - generated.n * CAST(:step AS interval),
+        CAST(:anchor AS timestamptz) - generated.n * CAST(:step AS interval)
+    FROM (
+        SELECT
+            n,
+            1 + floor(random() * 500000)::bigint AS amount,
+            (CAST(:names AS varchar[]))[1 + floor(random() * cardinality(CAST(:names AS varchar[])))::int] AS name,
+            CASE WHEN random() < 0.2 THEN 'INCOME' ELSE 'EXPENSE' END AS transaction_type
+        FROM generate_series(1, :size) AS n
+    ) AS generated
+    JOIN categories ON categories.user_id = :user_id AND categories.name = generated.name
+""")
+
+
+def git_commit() -> dict:
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {"sha": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+async def login(client: HttpClient, email: str) -> str:
+    status, tokens = await client.json("POST", "/auth/login", json_body={"email": email, "password": PASSWORD})
+    if status != 200:
+        raise RuntimeError(f"Login of {email} failed with {status}")
+
+    return tokens["access_token"]
+
+
+async def ensure_user(client: HttpClient, email: str) -> int:
+    await client.request("POST", "/auth/register", json_body={"username": "loadtest", "email": email, "password": PASSWORD})
+
+    async with session_factory() as session:
+        return (await session.execute(select(Users.id).where(Users.email == email))).scalar_one()
+
+
+async def seed_user(client: HttpClient, size: int, *, seed: int) -> dict:
+    """Creating (or reusing) the user with exactly `size` deterministic transactions."""
+
+    email = f"loadtest-{size}@example.com"
+    user_id = await ensure_user(client, email)
+
+    async with session_factory() as session:
+        count = (await session.execute(
+            select(func.count()).select_from(Transactions).where(Transactions.user_id == user_id)
+        )).scalar_one()
+
+        if count != size:
+            # Past months get their partitions first, committed at once as the DDL locks the table
+            connection = await session.connection()
+            if await ensure_months(connection, months_between(SEED_ANCHOR - size * SEED_STEP, SEED_ANCHOR)):
+                await session.commit()
+
+            await session.execute(delete(Transactions).where(Transactions.user_id == user_id))
+            await CategoriesService.resolve_ids(session=session, user_id=user_id, names=SEED_CATEGORIES)
+            await session.execute(text("SELECT setseed(:seed)"), {"seed": (seed % 1000) / 1000})
+            await session.execute(
+                SEED_TRANSACTIONS,
+                {
+                    "user_id": user_id,
+                    "size": size,
+                    "names": list(SEED_CATEGORIES),
+                    "anchor": SEED_ANCHOR,
+                    "step": SEED_STEP
+                }
+            )
+            await session.commit()
+            await RollupsService.rebuild_rollups_handler(session=session, user_id=user_id)
+
+        ids = (await session.execute(
+            select(Transactions.id).where(Transactions.user_id == user_id).order_by(Transactions.id)
+        )).scalars().all()
+
+    return {"size": size, "email": email, "user_id": user_id, "ids": ids, "token": await login(client, email)}
+
+
+async def scenario(name: str, results: dict, total: int, concurrency: int, host: str, port: int, operation) -> None:
+    async def make_worker(_: int):
+        client = HttpClient(host, port)
+
+        async def call(number: int) -> bool:
+            return await operation(client, number)
+
+        return call
+
+    latencies, errors, seconds = await run_requests(total, concurrency, make_worker)
+
+    results[name] = {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "rps": round(len(latencies) / seconds, 1) if seconds else 0.0,
+        **percentiles(latencies)
+    }
+
+
+async def run_scenarios(args: argparse.Namespace, run_id: str) -> dict:
+    results: dict = {}
+    rng = random.Random(args.seed)
+
+    async with serve_app(app) as (host, port):
+        setup = HttpClient(host, port)
+        seeded = [await seed_user(setup, size, seed=args.seed) for size in args.sizes]
+
+        writer_email = f"loadtest-writer-{run_id}@example.com"
+        writer_id = await ensure_user(setup, writer_email)
+        writer_token = await login(setup, writer_email)
+        # Logout revokes the token it presents, so every call gets its own (minted without bcrypt)
+        logout_tokens = [UserService._access_token(user_id=writer_id) for _ in range(args.auth_requests)]
+        await setup.close()
+
+        created_ids: list[int] = []
+
+        async def register(client: HttpClient, number: int) -> bool:
+            status, _ = await client.request("POST", "/auth/register", json_body={
+                "username": "loadtest", "email": f"loadtest-reg-{run_id}-{number}@example.com", "password": PASSWORD
+            })
+            return status == 201
+
+        async def login_call(client: HttpClient, number: int) -> bool:
+            status, _ = await client.request("POST", "/auth/login", json_body={"email": writer_email, "password": PASSWORD})
+            return status == 200
+
+        async def create(client: HttpClient, number: int) -> bool:
+            status, body = await client.json("POST", "/transactions/new", token=writer_token, json_body={
+                "amount": 1 + number % 500,
+                "category": "Load",
+                "description": f"load test {number}",
+                "transaction_type": "EXPENSE"
+            })
+            if status == 201:
+                created_ids.append(body["id"])
+            return status == 201
+
+        async def remove(client: HttpClient, number: int) -> bool:
+            status, _ = await client.request("DELETE", f"/transactions/{created_ids[number]}", token=writer_token)
+            return status == 200
+
+        refresh_state: dict = {}
+
+        async def refresh(client: HttpClient, number: int) -> bool:
+            status, tokens = await client.json(
+                "POST", "/auth/refresh", json_body={"refresh_token": refresh_state["token"]}
+            )
+            if status == 200:
+                refresh_state["token"] = tokens["refresh_token"]
+            return status == 200
+
+        async def logout(client: HttpClient, number: int) -> bool:
+            status, _ = await client.request("POST", "/auth/logout", token=logout_tokens[number])
+            return status == 204
+
+        await scenario("register", results, args.auth_requests, args.concurrency, host, port, register)
+        await scenario("login", results, args.auth_requests, args.concurrency, host, port, login_call)
+
+        # The latest login holds the only valid refresh token of the writer
+        setup = HttpClient(host, port)
+        _, tokens = await setup.json("POST", "/auth/login", json_body={"email": writer_email, "password": PASSWORD})
+        refresh_state["token"] = tokens["refresh_token"]
+        await setup.close()
+        await scenario("refresh", results, args.auth_requests, 1, host, port, refresh)
+
+        await scenario("create", results, args.requests, args.concurrency, host, port, create)
+
+        for user in seeded:
+            last_page = max((user["size"] + PER_PAGE - 1) // PER_PAGE, 1)
+            sample = [rng.choice(user["ids"]) for _ in range(args.requests)] if user["ids"] else []
+
+            def listing(page: int, token: str = user["token"]):
+                async def call(client: HttpClient, number: int) -> bool:
+                    status, _ = await client.request(
+                        "GET", f"/transactions/paged_transactions?page={page}&per_page={PER_PAGE}", token=token
+                    )
+                    return status == 200
+
+                return call
+
+            async def get_by_id(client: HttpClient, number: int, token: str = user["token"], sample: list = sample) -> bool:
+                status, _ = await client.request("GET", f"/transactions/{sample[number]}", token=token)
+                return status == 200
+
+            size = user["size"]
+            await scenario(f"list_shallow_{size}", results, args.requests, args.concurrency, host, port, listing(1))
+            await scenario(f"list_deep_{size}", results, args.requests, args.concurrency, host, port, listing(last_page))
+            if sample:
+                await scenario(f"get_by_id_{size}", results, args.requests, args.concurrency, host, port, get_by_id)
+
+        await scenario("delete", results, len(created_ids), args.concurrency, host, port, remove)
+        await scenario("logout", results, args.auth_requests, args.concurrency, host, port, logout)
+
+    return results
+
+
+async def cleanup(run_id: str) -> None:
+    """Removing users created by this run; seeded users are kept for the next run."""
+
+    async with session_factory() as session:
+        user_ids = select(Users.id).where(Users.email.like(f"loadtest-%-{run_id}%"))
+
+        await session.execute(delete(Tokens).where(Tokens.user_id.in_(user_ids)))
+        await session.execute(delete(Transactions).where(Transactions.user_id.in_(user_ids)))
+        await session.execute(delete(DailyRollups).where(DailyRollups.user_id.in_(user_ids)))
+        await session.execute(delete(Categories).where(Categories.user_id.in_(user_ids)))
+        await session.execute(delete(Users).where(Users.id.in_(user_ids)))
+        await session.commit()
+
+    await engine.dispose()
+
+
+def compare(results: dict, baseline: dict, *, threshold: float) -> dict:
+    comparison = {}
+
+    for name, current in results.items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or not before["p95"] or not before["rps"]:
+            continue
+
+        p95_change = round((current["p95"] - before["p95"]) / before["p95"] * 100, 1)
+        rps_change = round((current["rps"] - before["rps"]) / before["rps"] * 100, 1)
+
+        comparison[name] = {
+            "p95_change_pct": p95_change,
+            "rps_change_pct": rps_change,
+            "regression": p95_change > threshold or rps_change < -threshold
+        }
+
+    return comparison
+
+
+async def main(args: argparse.Namespace) -> int:
+    run_id = uuid.uuid4().hex[:8]
+
+    try:
+        results = await run_scenarios(args, run_id)
+    finally:
+        await cleanup(run_id)
+
+    report = {
+        "commit": git_commit(),
+        "generated_at": datetime.now(tz=timezone.utc).isoformat(),
+        "settings": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "scenarios": results
+    }
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        report["baseline_commit"] = baseline.get("commit")
+        report["comparison"] = compare(results, baseline, threshold=args.threshold)
+        exit_code = int(any(item["regression"] for item in report["comparison"].values()))
+
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(rendered + "\n")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000], help="transactions per seeded user")
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per data scenario")
+    parser.add_argument("--auth-requests", type=int, default=200, help="requests per register/login/logout scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--seed", type=int, default=42, help="seed of generated data and sampled ids")
+    parser.add_argument("--output", default=None, help="also write the JSON report to this file")
+    parser.add_argument("--compare", default=None, help="baseline JSON report of another run")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,108 @@
+"""
+Listing latency under a login storm.
+
+Measures latency of GET /transactions/paged_transactions on its own and then
+while concurrent clients keep calling POST /auth/login. With bcrypt running off
+the event loop the two p99 values should stay close; a blocking hash shows up
+as a listing p99 in the hundreds of milliseconds.
+
+The default storm is larger than DB_POOL_SIZE + DB_MAX_OVERFLOW, so a login
+holding its connection while waiting for bcrypt shows up as pool waits
+(reported under "db_pool") and a listing p50 in seconds.
+
+Usage:
+    python -m benchmarks.login_storm --duration 10 --readers 4 --logins 32
+"""
+
+import argparse
+import asyncio
+import json
+import uuid
+
+from application.main import app
+from application.database.base import engine
+from benchmarks.common import HttpClient, serve_app, percentiles, run_for
+
+PASSWORD = "benchmark-password"
+
+
+async def prepare_user(host: str, port: int, transactions: int) -> tuple[str, str]:
+    client = HttpClient(host, port)
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+
+    await client.json("POST", "/auth/register", json_body={"username": "bench", "email": email, "password": PASSWORD})
+    _, tokens = await client.json("POST", "/auth/login", json_body={"email": email, "password": PASSWORD})
+
+    for i in range(transactions):
+        await client.request(
+            "POST",
+            "/transactions/new",
+            token=tokens["access_token"],
+            json_body={
+                "amount": 10 + i,
+                "category": "Food",
+                "description": f"benchmark {i}",
+                "transaction_type": "EXPENSE",
+            },
+        )
+
+    await client.close()
+
+    return email, tokens["access_token"]
+
+
+async def measure_listing(host: str, port: int, token: str, *, duration: float, readers: int) -> dict:
+    async def make_reader(_: int):
+        client = HttpClient(host, port)
+
+        async def operation() -> bool:
+            status, _ = await client.request("GET", "/transactions/paged_transactions?per_page=20", token=token)
+            return status == 200
+
+        return operation
+
+    latencies, errors = await run_for(duration, readers, make_reader)
+
+    return {"requests": len(latencies), "errors": errors, **percentiles(latencies)}
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with serve_app(app) as (host, port):
+        email, token = await prepare_user(host, port, args.transactions)
+
+        idle = await measure_listing(host, port, token, duration=args.duration, readers=args.readers)
+
+        logins = {"ok": 0, "rejected": 0}
+
+        async def make_login(_: int):
+            client = HttpClient(host, port)
+
+            async def operation() -> bool:
+                status, _ = await client.request("POST", "/auth/login", json_body={"email": email, "password": PASSWORD})
+                logins["ok" if status == 200 else "rejected"] += 1
+                return status == 200
+
+            return operation
+
+        storm = asyncio.create_task(run_for(args.duration, args.logins, make_login))
+        under_storm = await measure_listing(host, port, token, duration=args.duration, readers=args.readers)
+        await storm
+        # Read before shutdown, the lifespan disposes the pool
+        pool = engine.pool.stats
+
+    print(json.dumps({
+        "listing_idle": idle,
+        "listing_under_login_storm": under_storm,
+        "logins": logins,
+        "db_pool": {key: pool[key] for key in ("checkouts", "timeouts", "wait_max_seconds", "wait_avg_seconds")},
+        "settings": vars(args),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per phase")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent listing clients")
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login clients during the storm")
+    parser.add_argument("--transactions", type=int, default=100, help="transactions created for the benchmark user")
+    asyncio.run(main(parser.parse_args()))
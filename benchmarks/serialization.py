@@ -0,0 +1,119 @@
+"""
+Serialization cost of a transactions listing page, no database required.
+
+Builds synthetic rows shaped like the listing query result and encodes a
+page of 10/100/1000 rows with both paths:
+
+* legacy: TransactionsResponseSchema per row, wrapped into
+  TransactionResponseWithMetaSchema, re-validated against the response
+  model and dumped with json.dumps (what FastAPI does for a returned model)
+* current: TransactionsService._listing_items + encode_transactions_page
+
+and prints the median time per page and per row for both.
+
+Usage:
+    python -m benchmarks.serialization --repeat 200
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from pydantic import TypeAdapter
+
+from application.api.handlers.transactions import TransactionsService
+from application.core.serialization import encode_transactions_page
+from application.schemas.transactions import TransactionResponseWithMetaSchema, TransactionsResponseSchema
+from features.transaction_enum import TransactionType
+
+from datetime import datetime, timedelta, timezone
+
+
+response_adapter = TypeAdapter(TransactionResponseWithMetaSchema)
+
+
+def make_rows(count: int) -> list[tuple]:
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        (
+            index + 1,
+            100 + index % 5000,
+            f"Category {index % 12}",
+            f"Synthetic transaction {index}" if index % 3 else None,
+            TransactionType.EXPENSE if index % 4 else TransactionType.INCOME,
+            started + timedelta(minutes=index)
+        )
+        for index in range(count)
+    ]
+
+
+def make_meta(count: int) -> dict:
+    return {
+        "pagination": {"page": 1, "per_page": count, "total_records": count, "total_pages": 1},
+        "filters": {"category": None, "transaction_type": None, "start_date": None, "end_date": None},
+        "sort": {"sort_by": "created_at", "sort_order": "desc"},
+        "fields": None
+    }
+
+
+def legacy_encode(rows: list[tuple], meta: dict) -> bytes:
+    names = [column.key for column in TransactionsService.LISTING_COLUMNS]
+    data = [TransactionsResponseSchema.model_validate(dict(zip(names, row))) for row in rows]
+    model = TransactionResponseWithMetaSchema(data=data, meta=meta)
+
+    validated = response_adapter.validate_python(model)
+    content = response_adapter.dump_python(validated, mode="json", exclude_unset=True)
+
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def current_encode(rows: list[tuple], meta: dict) -> bytes:
+    data = TransactionsService._listing_items(rows=rows, fields=None)
+    return encode_transactions_page({"data": data, "meta": meta})
+
+
+def measure(encode, rows: list[tuple], *, repeat: int) -> dict:
+    meta = make_meta(len(rows))
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(rows, meta)
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+
+    return {
+        "page_ms": round(median * 1000, 3),
+        "row_us": round(median * 1_000_000 / len(rows), 2)
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    results = {}
+
+    for size in args.sizes:
+        rows = make_rows(size)
+
+        # Both paths must produce the same document
+        assert json.loads(legacy_encode(rows, make_meta(size))) == json.loads(current_encode(rows, make_meta(size)))
+
+        legacy = measure(legacy_encode, rows, repeat=args.repeat)
+        current = measure(current_encode, rows, repeat=args.repeat)
+
+        results[str(size)] = {
+            "legacy": legacy,
+            "current": current,
+            "speedup": round(legacy["page_ms"] / current["page_ms"], 2)
+        }
+
+    print(json.dumps({**results, "settings": vars(args)}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="rows per page")
+    parser.add_argument("--repeat", type=int, default=200, help="encodings per size and variant")
+    main(parser.parse_args())
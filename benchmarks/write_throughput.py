@@ -0,0 +1,114 @@
+"""
+Write throughput of the transaction create path against a local Postgres.
+
+Runs the same number of inserts twice at fixed concurrency:
+
+* legacy: the pre-RETURNING sequence (SELECT user, INSERT, COMMIT, refresh SELECT)
+* current: TransactionsService.create_transaction_handler
+
+and prints writes/sec for both. A throwaway user is created for the run and
+removed together with its transactions and rollups afterwards.
+
+Usage:
+    python -m benchmarks.write_throughput --writes 5000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import select, delete
+
+from application.database.base import engine, session_factory
+from application.database.models.users import Users
+from application.database.models.transactions import Transactions
+from application.database.models.daily_rollups import DailyRollups
+from application.api.handlers.transactions import TransactionsService
+from application.api.handlers.categories import CategoriesService
+from application.database.models.categories import Categories
+from application.core.money import MINOR_UNITS
+from features.transaction_enum import TransactionType
+
+from datetime import datetime, timezone
+
+
+async def legacy_write(user_id: int, index: int) -> None:
+    async with session_factory() as session:
+        result = await session.execute(select(Users).where(Users.id == user_id))
+        result.scalar_one()
+        category_ids = await CategoriesService.resolve_ids(session=session, user_id=user_id, names=["Benchmark"])
+
+        transaction = Transactions(
+            user_id=user_id,
+            amount=(10 + index % 100) * MINOR_UNITS,
+            category="Benchmark",
+            category_id=category_ids["Benchmark"],
+            description=f"legacy {index}",
+            transaction_type=TransactionType.EXPENSE,
+            created_at=datetime.now(tz=timezone.utc)
+        )
+        session.add(transaction)
+        await session.commit()
+        await session.refresh(transaction)
+
+
+async def current_write(user_id: int, index: int) -> None:
+    async with session_factory() as session:
+        await TransactionsService.create_transaction_handler(
+            user_id=user_id,
+            amount=10 + index % 100,
+            category="Benchmark",
+            description=f"current {index}",
+            transaction_type=TransactionType.EXPENSE,
+            session=session
+        )
+
+
+async def measure(write, user_id: int, *, writes: int, concurrency: int) -> dict:
+    counter = iter(range(writes))
+
+    async def worker() -> None:
+        for index in counter:
+            await write(user_id, index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {"writes": writes, "seconds": round(elapsed, 3), "writes_per_sec": round(writes / elapsed, 1)}
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with session_factory() as session:
+        user = Users(username="bench", email=f"bench-{uuid.uuid4().hex[:12]}@example.com", hashed_password="-")
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    try:
+        results = {
+            "legacy": await measure(legacy_write, user_id, writes=args.writes, concurrency=args.concurrency),
+            "current": await measure(current_write, user_id, writes=args.writes, concurrency=args.concurrency),
+        }
+        results["speedup"] = round(results["current"]["writes_per_sec"] / results["legacy"]["writes_per_sec"], 2)
+
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(Transactions).where(Transactions.user_id == user_id))
+            await session.execute(delete(DailyRollups).where(DailyRollups.user_id == user_id))
+            await session.execute(delete(Categories).where(Categories.user_id == user_id))
+            await session.execute(delete(Users).where(Users.id == user_id))
+            await session.commit()
+
+        await engine.dispose()
+
+    print(json.dumps({**results, "settings": vars(args)}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=5000, help="inserts per variant")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent writers")
+    asyncio.run(main(parser.parse_args()))
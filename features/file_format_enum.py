@@ -0,0 +1,5 @@
+from enum import Enum
+
+class FileFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class RevocationBackendType(Enum):
+    LOCAL = "local"
+    POSTGRES = "postgres"
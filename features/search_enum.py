@@ -0,0 +1,5 @@
+from enum import Enum
+
+class SearchMode(Enum):
+    FTS = "fts"
+    FUZZY = "fuzzy"
@@ -2,4 +2,12 @@ from enum import Enum
 
 class TransactionType(Enum):
     INCOME: str = "INCOME"
-    EXPENSE: str = "EXPENSE"
\ No newline at end of file
+    EXPENSE: str = "EXPENSE"
+
+class TransactionField(Enum):
+    ID = "id"
+    AMOUNT = "amount"
+    CATEGORY = "category"
+    DESCRIPTION = "description"
+    TRANSACTION_TYPE = "transaction_type"
+    CREATED_AT = "created_at"
\ No newline at end of file
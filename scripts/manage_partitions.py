@@ -0,0 +1,71 @@
+"""
+Managing monthly partitions of the transactions table.
+
+Usage:
+    python -m scripts.manage_partitions list
+    python -m scripts.manage_partitions ensure --months-ahead 6
+    python -m scripts.manage_partitions detach --older-than 24 --schema archive
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import text
+
+from application.core.config import settings
+from application.database.base import engine
+from application.database.partitions import (
+    DEFAULT_PARTITION,
+    list_partitions,
+    ensure_partitions,
+    detach_partitions,
+)
+
+
+async def show() -> None:
+    async with engine.connect() as connection:
+        for partition in await list_partitions(connection):
+            rows = await connection.execute(text(f"SELECT count(*) FROM {partition.name}"))
+            print(f"{partition.name}  {partition.month:%Y-%m}  {rows.scalar_one()} rows")
+
+        rows = await connection.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}"))
+        print(f"{DEFAULT_PARTITION}  -  {rows.scalar_one()} rows")
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        if args.command == "list":
+            await show()
+
+        elif args.command == "ensure":
+            async with engine.begin() as connection:
+                created = await ensure_partitions(connection, months_ahead=args.months_ahead)
+            print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+
+        elif args.command == "detach":
+            async with engine.begin() as connection:
+                detached = await detach_partitions(
+                    connection,
+                    older_than_months=args.older_than,
+                    archive_schema=args.schema
+                )
+            print(f"Detached {len(detached)} partitions into {args.schema}: {', '.join(detached) or '-'}")
+
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="attached partitions and their row counts")
+
+    ensure = commands.add_parser("ensure", help="create partitions up to N months ahead")
+    ensure.add_argument("--months-ahead", type=int, default=settings.PARTITION_MONTHS_AHEAD)
+
+    detach = commands.add_parser("detach", help="move partitions older than N months into the archive schema")
+    detach.add_argument("--older-than", type=int, required=True, help="months to keep attached")
+    detach.add_argument("--schema", default=settings.PARTITION_ARCHIVE_SCHEMA, help="schema of detached partitions")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,31 @@
+"""
+Rebuilding daily_rollups from the transactions table.
+
+Usage:
+    python -m scripts.rebuild_rollups              # every user
+    python -m scripts.rebuild_rollups --user-id 42 # one user
+"""
+
+import argparse
+import asyncio
+
+from application.database.base import engine, session_factory
+from application.api.handlers.rollups import RollupsService
+
+
+async def main(user_id: int | None) -> None:
+    async with session_factory() as session:
+        written = await RollupsService.rebuild_rollups_handler(session=session, user_id=user_id)
+
+    await engine.dispose()
+
+    scope = f"user {user_id}" if user_id is not None else "all users"
+    print(f"Rebuilt {written} rollup rows for {scope}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, default=None, help="rebuild only this user")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.user_id))
@@ -0,0 +1,270 @@
+"""
+Generating a large synthetic dataset for scaling tests and benchmarks.
+
+The data is deterministic for a given --seed:
+
+* per-user transaction counts are heavy-tailed (Pareto), most users have a
+  few hundred rows and a handful have hundreds of thousands
+* categories follow a Zipf distribution over a long-tail vocabulary
+* created_at spans --years ending at a fixed date
+* expense amounts are seasonal (summer and December peaks)
+
+Every user is written in one database transaction: the user row, its
+transactions (COPY in --batch-size chunks), its categories and its daily
+rollups. An interrupted run is resumed by running the same command again,
+users that already exist are skipped.
+
+The monthly partitions of the whole span are created up front, so no row
+lands in the default partition; the run fails if one does anyway.
+
+Usage:
+    python -m scripts.seed_data --users 10000 --seed 7
+    python -m scripts.seed_data --users 200 --max-transactions 1000000 --jobs 8
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import sys
+import time
+
+from sqlalchemy import select, text
+
+from application.database.base import engine, session_factory
+from application.database.models.users import Users
+from application.database.models.transactions import Transactions
+from application.database.partitions import DEFAULT_PARTITION, ensure_months, months_between
+from application.api.handlers.rollups import RollupsService
+from application.api.handlers.categories import CategoriesService
+from application.core.password import Password
+from application.core.money import MINOR_UNITS
+from features.transaction_enum import TransactionType
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+END_DATE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+INCOME_CATEGORIES = ("Salary", "Freelance", "Dividends", "Gifts", "Refunds")
+EXPENSE_CATEGORIES = (
+    "Groceries", "Rent", "Transport", "Restaurants", "Utilities", "Health", "Subscriptions", "Clothing",
+    "Entertainment", "Travel", "Education", "Insurance", "Pets", "Sports", "Electronics", "Household",
+    "Beauty", "Charity", "Taxes", "Parking"
+)
+
+COPY_COLUMNS = (
+    "user_id", "amount", "category", "category_id", "description", "transaction_type", "created_at", "updated_at"
+)
+
+
+class CategoryPicker:
+    """Zipf-distributed choice over the expense vocabulary extended with a long tail."""
+
+    def __init__(self, *, size: int, exponent: float) -> None:
+        tail = [f"Misc {index:04d}" for index in range(max(size - len(EXPENSE_CATEGORIES), 0))]
+        self.names = [*EXPENSE_CATEGORIES, *tail][:size]
+        weights = [1 / rank ** exponent for rank in range(1, len(self.names) + 1)]
+        self.cum_weights = list(itertools.accumulate(weights))
+
+    def pick(self, rng: random.Random) -> str:
+        return rng.choices(self.names, cum_weights=self.cum_weights)[0]
+
+
+def user_rng(seed: int, index: int) -> random.Random:
+    # Independent stream per user, so any user can be regenerated on its own
+    return random.Random(f"{seed}:{index}")
+
+
+def transactions_count(rng: random.Random, args: argparse.Namespace) -> int:
+    count = int(args.mean_transactions * (args.pareto_alpha - 1) / args.pareto_alpha * rng.paretovariate(args.pareto_alpha))
+    return min(max(count, 1), args.max_transactions)
+
+
+def seasonal_factor(moment: datetime) -> float:
+    day = moment.timetuple().tm_yday
+    summer = 0.15 * math.sin(2 * math.pi * (day - 100) / 365)
+    december = 0.35 if moment.month == 12 else 0.0
+    return 1.0 + summer + december
+
+
+def generate_records(
+    *,
+    rng: random.Random,
+    user_id: int,
+    count: int,
+    categories: CategoryPicker,
+    years: int
+) -> Iterator[tuple]:
+    span = int((END_DATE - start_date(years)).total_seconds())
+
+    for index in range(count):
+        created_at = END_DATE - timedelta(seconds=rng.randrange(span))
+
+        if rng.random() < 0.12:
+            transaction_type = TransactionType.INCOME
+            category = rng.choice(INCOME_CATEGORIES)
+            amount = round(rng.lognormvariate(7.5, 0.6) * MINOR_UNITS)
+        else:
+            transaction_type = TransactionType.EXPENSE
+            category = categories.pick(rng)
+            amount = round(rng.lognormvariate(3.5, 1.1) * seasonal_factor(created_at) * MINOR_UNITS)
+
+        yield (
+            user_id,
+            max(amount, 1),
+            category,
+            f"{category} #{index}" if rng.random() < 0.7 else None,
+            transaction_type.value,
+            created_at,
+            created_at
+        )
+
+
+def chunks(records: Iterator[tuple], size: int) -> Iterator[list[tuple]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def seed_user(
+    *,
+    index: int,
+    args: argparse.Namespace,
+    hashed_password: str,
+    categories: CategoryPicker
+) -> int:
+    """
+    Writing one user with all its rows in a single transaction.
+
+    Returns:
+        Number of transactions written, 0 if the user already existed
+    """
+
+    email = f"seed-{args.seed}-{index}@example.com"
+    rng = user_rng(args.seed, index)
+    count = transactions_count(rng, args)
+
+    async with session_factory() as session:
+        existing = await session.execute(select(Users.id).where(Users.email == email))
+        if existing.scalar_one_or_none() is not None:
+            return 0
+
+        user = Users(username=f"seed{index}", email=email, hashed_password=hashed_password)
+        session.add(user)
+        await session.flush()
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        records = generate_records(rng=rng, user_id=user.id, count=count, categories=categories, years=args.years)
+
+        for chunk in chunks(records, args.batch_size):
+            # Categories are created in the same transaction as the user
+            category_ids = await CategoriesService.resolve_ids(
+                session=session,
+                user_id=user.id,
+                names={record[2] for record in chunk}
+            )
+            await driver_connection.copy_records_to_table(
+                Transactions.__tablename__,
+                records=[(*record[:3], category_ids[record[2]], *record[3:]) for record in chunk],
+                columns=COPY_COLUMNS
+            )
+
+        # Rollups are written in the same transaction, so a resumed run never sees a half-seeded user
+        source = select(
+            Transactions.user_id,
+            Transactions.created_at,
+            Transactions.category_id,
+            Transactions.transaction_type,
+            Transactions.amount
+        ).where(Transactions.user_id == user.id)
+        await session.execute(RollupsService.upsert_from(source.subquery()))
+
+        await session.commit()
+
+    return count
+
+
+def start_date(years: int) -> datetime:
+    return END_DATE - timedelta(days=365 * years)
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with engine.begin() as connection:
+        created = await ensure_months(connection, months_between(start_date(args.years), END_DATE))
+    if created:
+        print(f"Created {len(created)} monthly partitions", flush=True)
+
+    hashed_password = await Password.hashed_psw_async(password=args.password)
+    categories = CategoryPicker(size=args.categories, exponent=args.zipf_exponent)
+
+    slots = asyncio.Semaphore(args.jobs)
+    written = 0
+    written_users = 0
+    skipped = 0
+    started = time.perf_counter()
+
+    async def run(index: int) -> None:
+        nonlocal written, written_users, skipped
+
+        async with slots:
+            count = await seed_user(index=index, args=args, hashed_password=hashed_password, categories=categories)
+
+        if count:
+            written += count
+            written_users += 1
+        else:
+            skipped += 1
+
+        done = written_users + skipped
+        if done % args.progress_every == 0:
+            elapsed = time.perf_counter() - started
+            print(f"{done}/{args.users} users, {written} transactions, {written / elapsed:.0f} rows/s", flush=True)
+
+    try:
+        await asyncio.gather(*(run(index) for index in range(args.users)))
+
+        async with engine.connect() as connection:
+            in_default = (await connection.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}"))).scalar_one()
+    finally:
+        await engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    print(f"Seeded {written} transactions for {args.users - skipped} users ({skipped} already present) in {elapsed:.1f}s")
+
+    if in_default:
+        print(f"{in_default} rows are in {DEFAULT_PARTITION}, run scripts.manage_partitions ensure", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000, help="number of users")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the generated data")
+    parser.add_argument("--mean-transactions", type=int, default=500, help="mean transactions per user")
+    parser.add_argument("--max-transactions", type=int, default=1_000_000, help="cap of transactions per user")
+    parser.add_argument("--pareto-alpha", type=float, default=1.3, help="tail index of per-user counts (> 1)")
+    parser.add_argument("--categories", type=int, default=200, help="size of the expense category vocabulary")
+    parser.add_argument("--zipf-exponent", type=float, default=1.1, help="skew of category popularity")
+    parser.add_argument("--years", type=int, default=5, help="years of history before 2026-01-01")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="rows per COPY")
+    parser.add_argument("--jobs", type=int, default=4, help="users written concurrently")
+    parser.add_argument("--password", default="seed-password", help="password of every seeded user")
+    parser.add_argument("--progress-every", type=int, default=100, help="print progress every N users")
+    args = parser.parse_args()
+
+    if args.pareto_alpha <= 1:
+        parser.error("--pareto-alpha must be greater than 1")
+
+    sys.exit(asyncio.run(main(args)))
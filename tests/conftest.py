@@ -0,0 +1,13 @@
+import os
+
+# Settings are read on import of application modules and these have no defaults.
+# The unit tests never connect, so any values do; a real environment wins
+for name, value in {
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "finance_test",
+    "BASE_FASTAPI_URL": "http://localhost:8000",
+}.items():
+    os.environ.setdefault(name, value)
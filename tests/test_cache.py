@@ -0,0 +1,102 @@
+import pytest
+
+from application.core import cache
+from application.core.cache import TTLCache, TransactionsCountCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_expiry(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("key", "value")
+
+    clock[0] += 59
+    assert ttl_cache.get("key") == "value"
+
+    clock[0] += 2
+    assert ttl_cache.get("key", "gone") == "gone"
+    assert len(ttl_cache) == 0
+    assert ttl_cache.stats == {"hits": 1, "misses": 1, "size": 0, "maxsize": 10}
+
+
+def test_set_restarts_ttl(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("key", 1)
+
+    clock[0] += 50
+    ttl_cache.set("key", 2)
+
+    clock[0] += 50
+    assert ttl_cache.get("key") == 2
+
+
+def test_evicts_least_recently_used(clock):
+    ttl_cache = TTLCache(maxsize=2, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert ttl_cache.get("a") == 1
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("c") == 3
+
+
+def test_pop_and_clear(clock):
+    ttl_cache = TTLCache(maxsize=10, ttl=60)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    assert ttl_cache.pop("a") == 1
+    assert ttl_cache.pop("a") is None
+
+    ttl_cache.clear()
+    assert len(ttl_cache) == 0
+
+
+def test_count_cache_stores_and_invalidates(clock):
+    counts = TransactionsCountCache(maxsize=10, ttl=60)
+    generation = counts.generation(user_id=1)
+    counts.set(user_id=1, key=("Food", None), total=5, generation=generation)
+    counts.set(user_id=2, key=("Food", None), total=7, generation=counts.generation(user_id=2))
+
+    assert counts.get(user_id=1, key=("Food", None)) == 5
+    assert counts.get(user_id=1, key=(None, None)) is None
+
+    counts.invalidate(user_id=1)
+
+    assert counts.get(user_id=1, key=("Food", None)) is None
+    assert counts.get(user_id=2, key=("Food", None)) == 7
+
+
+def test_count_cache_drops_count_of_older_generation(clock):
+    counts = TransactionsCountCache(maxsize=10, ttl=60)
+
+    # A write invalidates the user while the count query is running
+    generation = counts.generation(user_id=1)
+    counts.invalidate(user_id=1)
+    counts.set(user_id=1, key=(None, None), total=5, generation=generation)
+
+    assert counts.get(user_id=1, key=(None, None)) is None
+
+    counts.set(user_id=1, key=(None, None), total=6, generation=counts.generation(user_id=1))
+    assert counts.get(user_id=1, key=(None, None)) == 6
+
+
+def test_count_cache_generations_never_repeat(clock):
+    counts = TransactionsCountCache(maxsize=1, ttl=60)
+    counts.invalidate(user_id=1)
+    generation = counts.generation(user_id=1)
+
+    # User 2 evicts the generation of user 1, the next one must still differ
+    counts.invalidate(user_id=2)
+    counts.invalidate(user_id=1)
+
+    assert counts.generation(user_id=1) != generation
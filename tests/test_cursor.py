@@ -0,0 +1,45 @@
+import base64
+import json
+
+import pytest
+
+from application.core.cursor import Cursor
+
+
+def encode(**overrides) -> str:
+    fields = {"sort_by": "created_at", "sort_order": "desc", "value": "2026-01-31T12:00:00+00:00", "row_id": 42, "direction": "next"}
+    return Cursor.encode(**{**fields, **overrides})
+
+
+def raw_cursor(data) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def test_round_trip():
+    cursor = encode(sort_by="amount", sort_order="asc", value=1250, row_id=7, direction="prev")
+
+    assert Cursor.decode(cursor=cursor) == {"s": "amount", "o": "asc", "v": 1250, "id": 7, "d": "prev"}
+
+
+def test_is_url_safe_without_padding():
+    cursor = encode(value="?/+" * 10)
+
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "!!!!", encode()[:-3], encode() + "A"])
+def test_malformed(cursor):
+    with pytest.raises(ValueError):
+        Cursor.decode(cursor=cursor)
+
+
+@pytest.mark.parametrize("data", [
+    [1, 2, 3],
+    {"s": "created_at", "o": "desc", "v": None, "id": 1},
+    {"s": "created_at", "o": "desc", "v": None, "id": 1, "d": "sideways"},
+    {"s": "created_at", "o": "desc", "v": None, "id": "1", "d": "next"},
+])
+def test_tampered(data):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        Cursor.decode(cursor=raw_cursor(data))
@@ -0,0 +1,78 @@
+from application.core.metrics import Histogram, render_metrics, format_labels
+
+POOL_STATS = {"size": 10, "checked_out": 3, "overflow": 0, "checkouts": 120, "timeouts": 1, "wait_total_seconds": 0.25}
+BCRYPT_STATS = {"waiting": 2, "running": 4}
+CACHE_STATS = {
+    "count": {"hits": 3, "misses": 1, "size": 2, "maxsize": 10},
+    "category": {"hits": 0, "misses": 0, "size": 0, "maxsize": 10},
+}
+TOKEN_STATS = {
+    "table_rows": 500,
+    "table_bytes": 65536,
+    "runs": 2,
+    "deleted_total": 40,
+    "duration_total_seconds": 0.5,
+    "last_duration_seconds": 0.2,
+}
+
+
+def render() -> list[str]:
+    output = render_metrics(
+        pool_stats=POOL_STATS,
+        bcrypt_stats=BCRYPT_STATS,
+        cache_stats=CACHE_STATS,
+        token_stats=TOKEN_STATS
+    )
+
+    assert output.endswith("\n")
+    return output.splitlines()
+
+
+def test_every_metric_is_described():
+    lines = render()
+    help_names = [line.split()[2] for line in lines if line.startswith("# HELP ")]
+    type_names = [line.split()[2] for line in lines if line.startswith("# TYPE ")]
+
+    assert help_names == type_names
+    assert len(set(help_names)) == len(help_names)
+
+    for line in lines:
+        if not line.startswith("#"):
+            name = line.split("{")[0].split()[0]
+            assert any(name == metric or name.startswith(f"{metric}_") for metric in help_names), line
+
+
+def test_samples():
+    lines = render()
+
+    assert "db_pool_size 10" in lines
+    assert "db_pool_wait_seconds_total 0.25" in lines
+    assert "# TYPE db_pool_checkouts_total counter" in lines
+    assert "bcrypt_waiting 2" in lines
+    assert 'cache_hit_ratio{cache="count"} 0.75' in lines
+    assert 'cache_hit_ratio{cache="category"} 0.0' in lines
+    assert 'cache_entries{cache="count"} 2' in lines
+    assert "token_sweep_deleted_total 40" in lines
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency.", labels=("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5.0, "/a")
+
+    assert list(histogram.render()) == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 5.65',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    assert format_labels([("path", 'a"b\\c\nd')]) == '{path="a\\"b\\\\c\\nd"}'
+    assert format_labels([]) == ""
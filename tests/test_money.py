@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from application.core.money import to_minor_units, from_minor_units, minor_units_to_json, MinorUnits
+
+
+class Amount(BaseModel):
+    amount: MinorUnits
+
+
+@pytest.mark.parametrize("amount, minor", [
+    (Decimal("12.5"), 1250),
+    (Decimal("0.01"), 1),
+    (Decimal("0.10"), 10),
+    (Decimal("12.500"), 1250),
+    (7, 700),
+    (Decimal("99999999999999.99"), 9999999999999999),
+])
+def test_to_minor_units(amount, minor):
+    assert to_minor_units(amount) == minor
+
+
+@pytest.mark.parametrize("amount", [Decimal("0.001"), Decimal("12.345"), Decimal("1E-10")])
+def test_to_minor_units_rejects_fractions_of_minor_units(amount):
+    with pytest.raises(ValueError, match="decimal places"):
+        to_minor_units(amount)
+
+
+def test_from_minor_units_is_exact():
+    assert from_minor_units(1250) == Decimal("12.50")
+    assert str(from_minor_units(5)) == "0.05"
+    assert str(from_minor_units(-1250)) == "-12.50"
+
+
+def test_json_is_exact_above_float_precision():
+    # 2**53 + 1 minor units have no exact float
+    minor = 2**53 + 1
+
+    assert minor_units_to_json(minor) == "90071992547409.93"
+    assert to_minor_units(Decimal(minor_units_to_json(minor))) == minor
+
+
+def test_minor_units_field():
+    amount = Amount(amount=1250)
+
+    assert amount.model_dump() == {"amount": 1250}
+    assert amount.model_dump_json() == '{"amount":"12.50"}'
@@ -0,0 +1,64 @@
+import pytest
+
+from application.core import revocation
+from application.core.revocation import RevocationList
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(revocation.time, "time", lambda: now[0])
+    return now
+
+
+def test_revoked_until_expiry(clock):
+    revocations = RevocationList()
+    revocations.revoke("jti", expires_at=1_060.0)
+
+    assert revocations.is_revoked("jti")
+    assert not revocations.is_revoked("other")
+
+    clock[0] = 1_060.0
+    assert not revocations.is_revoked("jti")
+
+
+def test_expired_token_is_not_stored(clock):
+    revocations = RevocationList()
+    revocations.revoke("jti", expires_at=1_000.0)
+
+    assert len(revocations) == 0
+
+
+def test_expired_entries_are_purged(clock):
+    revocations = RevocationList()
+    revocations.revoke("first", expires_at=1_010.0)
+    revocations.revoke("second", expires_at=1_100.0)
+
+    clock[0] = 1_050.0
+    revocations.revoke("third", expires_at=1_200.0)
+
+    assert len(revocations) == 2
+    assert not revocations.is_revoked("first")
+    assert revocations.is_revoked("second")
+
+
+def test_revoking_again_never_shortens(clock):
+    revocations = RevocationList()
+    revocations.revoke("jti", expires_at=1_100.0)
+    revocations.revoke("jti", expires_at=1_050.0)
+
+    clock[0] = 1_060.0
+    assert revocations.is_revoked("jti")
+
+
+def test_purging_an_extended_entry_keeps_it(clock):
+    revocations = RevocationList()
+    revocations.revoke("jti", expires_at=1_050.0)
+    revocations.revoke("jti", expires_at=1_100.0)
+
+    # The heap still holds the earlier expiry, popping it must keep the entry
+    clock[0] = 1_060.0
+    revocations.revoke("other", expires_at=1_200.0)
+
+    assert revocations.is_revoked("jti")
+    assert len(revocations) == 2
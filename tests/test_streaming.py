@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from application.core.streaming import iter_lines, LineTooLongError
+
+
+async def stream(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+def split(chunks: list[bytes], **kwargs) -> list[str]:
+    async def collect() -> list[str]:
+        return [line async for line in iter_lines(stream(chunks), **kwargs)]
+
+    return asyncio.run(collect())
+
+
+def test_lines_across_chunks():
+    assert split([b"amount,cat", b"egory\n12.50,Fo", b"od\n0.10,Rent"]) == ["amount,category", "12.50,Food", "0.10,Rent"]
+
+
+def test_crlf_and_empty_lines():
+    assert split([b"a\r\n\r\nb\r", b"\n"]) == ["a", "", "b"]
+
+
+def test_no_trailing_empty_line():
+    assert split([b"a\n"]) == ["a"]
+    assert split([]) == []
+
+
+def test_multibyte_character_split_between_chunks():
+    data = "Café,Crème\n".encode("utf-8")
+
+    assert split([data[:4], data[4:12], data[12:]]) == ["Café,Crème"]
+
+
+def test_invalid_encoding():
+    with pytest.raises(UnicodeDecodeError):
+        split([b"\xff\n"])
+
+
+def test_line_too_long():
+    with pytest.raises(LineTooLongError):
+        split([b"short\n", b"x" * 11], max_line_length=10)
+
+    assert split([b"x" * 10 + b"\n"], max_line_length=10) == ["x" * 10]